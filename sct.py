@@ -22,6 +22,7 @@ from collections import defaultdict
 from datetime import datetime, timezone, timedelta, UTC
 import json
 import os
+import tempfile
 import re
 import sys
 import unittest
@@ -57,6 +58,7 @@ from sdcm.provision import AzureProvisioner
 from sdcm.provision.provisioner import VmInstance, VmArch
 from sdcm.remote import LOCALRUNNER
 from sdcm.nemesis.monkey.runners import SisyphusMonkey
+from sdcm.sct_events.events_store import EVENTS_DB, EventsStore, import_raw_events_log
 from sdcm.sct_config import AWS_SUPPORTED_REGIONS, SCTConfiguration, init_and_verify_sct_config, available_backends
 from sdcm.sct_provision.common.layout import SCTProvisionLayout
 from sdcm.sct_provision.instances_provider import provision_sct_resources
@@ -2152,7 +2154,23 @@ def search_builder(test_id):
 )
 @click.option("--last-n", type=int, required=False, help="return last n lines from events.log file")
 @click.option("--save-to", type=str, required=False, help="Download events.log file and save to provided dir")
-def show_events(test_id: str, follow: bool = False, last_n: int = None, save_to: str = None):
+@click.option(
+    "--severity",
+    type=click.Choice(["CRITICAL", "ERROR", "WARNING", "NORMAL", "DEBUG"], case_sensitive=False),
+    multiple=True,
+    help="Show only events with the severity (can be used multiple times)",
+)
+@click.option("--event-class", type=str, required=False, help="Show only events of the class, e.g. DatabaseLogEvent")
+@click.option("--node", type=str, required=False, help="Show only events of the node")
+def show_events(  # noqa: PLR0913
+    test_id: str,
+    follow: bool = False,
+    last_n: int = None,
+    save_to: str = None,
+    severity: tuple = (),
+    event_class: str = None,
+    node: str = None,
+):
     logging.getLogger("paramiko").setLevel(logging.CRITICAL)
     add_file_logger()
     builders = get_builder_by_test_id(test_id)
@@ -2168,7 +2186,22 @@ def show_events(test_id: str, follow: bool = False, last_n: int = None, save_to:
         )
         remoter = builder["builder"]["remoter"]
 
-        if follow or last_n:
+        if severity or event_class or node:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                events_db = download_events_store(remoter, f"{builder['path']}/events_log", tmp_dir)
+                with EventsStore(events_db) as store:
+                    events = list(
+                        store.query(
+                            base=event_class,
+                            severity=[s.upper() for s in severity] or None,
+                            node=node,
+                            limit=last_n,
+                            newest_first=bool(last_n),
+                        )
+                    )
+                for event in events[::-1] if last_n else events:
+                    click.echo(event.formatted or event.json)
+        elif follow or last_n:
             options = "-f " if follow else ""
             options += f"-n {last_n} " if last_n else ""
             try:
@@ -2183,6 +2216,33 @@ def show_events(test_id: str, follow: bool = False, last_n: int = None, save_to:
     click.echo("Show events done.")
 
 
+def download_events_store(remoter, events_log_dir: str, target_dir: str) -> Path:
+    """Download a snapshot of events.db, or build it from raw_events.log if the test run has no events store."""
+
+    if remoter.run(f"test -f {events_log_dir}/{EVENTS_DB}", ignore_status=True, verbose=False).ok:
+        # Copy the database together with its write-ahead log to get all committed events.
+        archive = remoter.run("mktemp --suffix .tar.gz", verbose=False).stdout.strip()
+        try:
+            remoter.run(f"cd {events_log_dir} && tar -czf {archive} {EVENTS_DB}*", verbose=False)
+            remoter.receive_files(archive, target_dir)
+        finally:
+            remoter.run(f"rm -f {archive}", ignore_status=True, verbose=False)
+        LOCALRUNNER.run(f"tar -xzf {target_dir}/{Path(archive).name} -C {target_dir}", verbose=False)
+        return Path(target_dir) / EVENTS_DB
+    remoter.receive_files(f"{events_log_dir}/raw_events.log", target_dir)
+    return import_raw_events_log(Path(target_dir) / "raw_events.log")
+
+
+@investigate.command("index-events", help="Build events store (events.db) from raw_events.log of a test run")
+@click.argument("raw-events-log", type=click.Path(exists=True, dir_okay=False))
+@click.option("--output", type=click.Path(dir_okay=False), required=False, help="Path to events.db file to create")
+def index_events(raw_events_log: str, output: str = None):
+    add_file_logger()
+    events_db = import_raw_events_log(raw_events_log, events_db=output)
+    with EventsStore(events_db, readonly=True) as store:
+        click.echo(f"{events_db}: {json.dumps(store.count_by_severity())}")
+
+
 cli.add_command(investigate)
 
 
@@ -38,11 +38,11 @@ from typing import List, Optional, Dict, Union, Set, Iterable, ContextManager, A
 from datetime import datetime, timezone
 from textwrap import dedent
 from functools import cached_property, wraps, lru_cache, partial
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
-from contextlib import ExitStack, contextmanager
+from contextlib import ExitStack, contextmanager, suppress
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import packaging.version
 
@@ -65,7 +65,12 @@ from sdcm.node_exporter_setup import NodeExporterSetup
 from sdcm.db_log_reader import DbLogReader
 from sdcm.mgmt import AnyManagerCluster, ScyllaManagerError
 from sdcm.mgmt.common import get_manager_repo, get_manager_scylla_backend
-from sdcm.prometheus import start_metrics_server, PrometheusAlertManagerListener, AlertSilencer
+from sdcm.prometheus import (
+    start_metrics_server,
+    PrometheusAlertManagerListener,
+    AlertSilencer,
+    backtrace_decoding_metrics_obj,
+)
 from sdcm.log import SDCMAdapter
 from sdcm.provision.common.configuration_script import ConfigurationScriptBuilder
 from sdcm.provision.common.utils import configure_vector_target_script, disable_daily_apt_triggers
@@ -98,6 +103,7 @@ from sdcm.remote.remote_file import remote_file, yaml_file_to_dict, dict_to_yaml
 from sdcm import wait, mgmt
 from sdcm.sct_config import SCTConfiguration
 from sdcm.utils.apt import apt_cmd
+from sdcm.utils.lock_utils import KeyBasedLock
 from sdcm.utils.rpm import rpm_cmd
 from sdcm.sct_events.continuous_event import ContinuousEventsRegistry
 from sdcm.sct_events.system import AwsKmsEvent
@@ -113,6 +119,7 @@ from sdcm.provision.gce.kms_provider import GcpKmsProvider
 from google.cloud.exceptions import GoogleCloudError
 from sdcm.utils.cql_utils import cql_quote_if_needed
 from sdcm.utils.benchmarks import ScyllaClusterBenchmarkManager
+from sdcm.utils.cql_sessions_pool import CQLSessionsPool
 from sdcm.utils.common import (
     S3Storage,
     ScyllaCQLSession,
@@ -232,6 +239,8 @@ HOUR_IN_SEC: int = 60 * MINUTE_IN_SEC
 MAX_TIME_WAIT_FOR_NEW_NODE_UP: int = HOUR_IN_SEC * 8
 MAX_TIME_WAIT_FOR_ALL_NODES_UP: int = MAX_TIME_WAIT_FOR_NEW_NODE_UP + HOUR_IN_SEC
 MAX_TIME_WAIT_FOR_DECOMMISSION: int = HOUR_IN_SEC * 6
+BACKTRACE_SYMBOLS_CACHE_SIZE: int = 100_000  # decoded frames of all builds kept by a monitor node
+BACKTRACE_DECODING_CACHE_SIZE: int = 1024  # addr2line results kept by a monitor node
 
 LOGGER = logging.getLogger(__name__)
 
@@ -408,6 +417,7 @@ class BaseNode(AutoSshContainerMixin):
     ]
 
     SYSTEM_EVENTS_PATTERNS = SYSTEM_ERROR_EVENTS_PATTERNS + INSTANCE_STATUS_EVENTS_PATTERNS
+    backtrace_symbols_cache_size = BACKTRACE_SYMBOLS_CACHE_SIZE
 
     def __init__(
         self,
@@ -449,6 +459,9 @@ class BaseNode(AutoSshContainerMixin):
         self._db_log_reader_thread = None
         self._scylla_manager_journal_thread = None
         self._decoding_backtraces_thread = None
+        self._backtrace_symbols: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._backtrace_symbols_lock = threading.Lock()
+        self._debug_info_locks = KeyBasedLock()
 
         self._short_hostname = None
         self._alert_manager: Optional[PrometheusAlertManagerListener] = None
@@ -1401,16 +1414,20 @@ class BaseNode(AutoSshContainerMixin):
         self._coredump_thread.start()
 
     def start_db_log_reader_thread(self):
-        self._db_log_reader_thread = DbLogReader(
+        reader_kwargs = dict(
             system_log=self.system_log,
-            remoter=self.remoter,
             node_name=str(self.name),
             system_event_patterns=SYSTEM_ERROR_EVENTS_PATTERNS,
-            decoding_queue=self.test_config.DECODING_QUEUE,
             log_lines=self.parent_cluster.params.get("logs_transport") in ["syslog-ng", "vector"],
             backtrace_stall_decoding=self.parent_cluster.params.get("backtrace_stall_decoding"),
             backtrace_decoding_disable_regex=self.parent_cluster.params.get("backtrace_decoding_disable_regex"),
         )
+        if db_log_reader_pool := self.test_config.DB_LOG_READER_POOL:
+            self._db_log_reader_thread = db_log_reader_pool.reader(**reader_kwargs)
+        else:
+            self._db_log_reader_thread = DbLogReader(
+                remoter=self.remoter, decoding_queue=self.test_config.DECODING_QUEUE, **reader_kwargs
+            )
         self._db_log_reader_thread.start()
 
     def start_alert_manager_thread(self):
@@ -2039,63 +2056,121 @@ class BaseNode(AutoSshContainerMixin):
         return result["stdout"]
 
     def decode_backtrace(self):
-        while True:
-            event = None
-            try:
-                obj = self.test_config.DECODING_QUEUE.get(timeout=5)
-                if obj is None:
-                    break
-                event = obj["event"]
-                self.log.debug("Event origin severity: %s", event.severity)
-                build_id = obj["build_id"]
-                raw_backtrace_oneline = " ".join(event.raw_backtrace.split("\n"))
+        """Take backtraces from the decoding queue and decode them using a pool of workers."""
+        metrics = backtrace_decoding_metrics_obj()
+        workers = self.test_config.BACKTRACE_DECODING_WORKERS
+        in_flight = threading.BoundedSemaphore(workers * 2)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="DecodeBacktraceWorker") as executor:
+            while True:
+                try:
+                    obj = self.test_config.DECODING_QUEUE.get(timeout=5)
+                    if obj is None:
+                        break
+                    in_flight.acquire()
+                    future = executor.submit(self._decode_and_publish_backtrace, obj)
+                    future.add_done_callback(lambda _: in_flight.release())
+                except queue.Empty:
+                    pass
+                except Exception as details:  # noqa: BLE001
+                    self.log.error("failed to decode backtrace %s", details)
+                    if "is closed" in str(details):
+                        break
+                with suppress(Exception):
+                    metrics.set_queue_depth(self.test_config.DECODING_QUEUE.qsize())
 
-                decoded = None
-                if build_id:
-                    try:
-                        decoded = self._decode_via_external_service(build_id, event.raw_backtrace)
-                        self.log.debug("Decoded backtrace via external service for build_id=%s", build_id)
-                    except Exception as exc:  # noqa: BLE001
-                        self.log.warning("External backtrace service failed (%s), falling back to local addr2line", exc)
-
-                if decoded is None:
-                    scylla_debug_file = self.copy_scylla_debug_info(obj["node"], build_id)
-                    decoded = self.decode_backtrace_local(scylla_debug_file, raw_backtrace_oneline).stdout
-
-                event.backtrace = decoded
-                the_map = FindIssuePerBacktrace()
-                if issue_url := the_map.find_issue(backtrace_type=event.type, decoded_backtrace=event.backtrace):
-                    event.known_issue = issue_url
-                    skip_per_issue = SkipPerIssues(issue_url, self.parent_cluster.params)
-                    # If found issue is closed
-                    if not skip_per_issue.issues_opened():
-                        if skip_per_issue.issues_labeled():
-                            # If found issue has skip label, this issue was fixed but won't be backported to the tested branch.
-                            # So this reactor stall is expected and shouldn't fail the test
-                            # if this event severity is Error or Critical - decrease to warning.
-                            event.severity = (
-                                Severity.WARNING if event.severity.value > Severity.WARNING.value else event.severity
-                            )
-                        else:
-                            # If found issue has no skip label - increase severity to Error (if not).
-                            # A reason: the issue was fixed, and it is not expected to get this reactor stall
-                            event.severity = (
-                                Severity.ERROR if event.severity.value < Severity.ERROR.value else event.severity
-                            )
-                    self.log.debug("Found issue for %s event: %s", event.event_id, event.known_issue)
-            except queue.Empty:
-                pass
-            except Exception as details:  # noqa: BLE001
-                self.log.error("failed to decode backtrace %s", details)
-                if "is closed" in str(details):
+                if self.termination_event.is_set() and self.test_config.DECODING_QUEUE.empty():
                     break
-            finally:
-                if event:
-                    event.ready_to_publish()
-                    event.publish()
 
-            if self.termination_event.is_set() and self.test_config.DECODING_QUEUE.empty():
-                break
+    def _decode_and_publish_backtrace(self, obj: dict) -> None:
+        event = obj["event"]
+        start_time = time.perf_counter()
+        try:
+            self.log.debug("Event origin severity: %s", event.severity)
+            build_id = obj["build_id"]
+
+            decoded = None
+            if build_id:
+                try:
+                    decoded = self._decode_via_external_service(build_id, event.raw_backtrace)
+                    self.log.debug("Decoded backtrace via external service for build_id=%s", build_id)
+                except Exception as exc:  # noqa: BLE001
+                    self.log.warning("External backtrace service failed (%s), falling back to local addr2line", exc)
+
+            if decoded is None:
+                decoded = self._decode_backtrace_using_symbols_cache(obj["node"], build_id, event.raw_backtrace)
+
+            event.backtrace = decoded
+            the_map = FindIssuePerBacktrace()
+            if issue_url := the_map.find_issue(backtrace_type=event.type, decoded_backtrace=event.backtrace):
+                event.known_issue = issue_url
+                skip_per_issue = SkipPerIssues(issue_url, self.parent_cluster.params)
+                # If found issue is closed
+                if not skip_per_issue.issues_opened():
+                    if skip_per_issue.issues_labeled():
+                        # If found issue has skip label, this issue was fixed but won't be backported to the tested branch.
+                        # So this reactor stall is expected and shouldn't fail the test
+                        # if this event severity is Error or Critical - decrease to warning.
+                        event.severity = (
+                            Severity.WARNING if event.severity.value > Severity.WARNING.value else event.severity
+                        )
+                    else:
+                        # If found issue has no skip label - increase severity to Error (if not).
+                        # A reason: the issue was fixed, and it is not expected to get this reactor stall
+                        event.severity = (
+                            Severity.ERROR if event.severity.value < Severity.ERROR.value else event.severity
+                        )
+                self.log.debug("Found issue for %s event: %s", event.event_id, event.known_issue)
+        except Exception as details:  # noqa: BLE001
+            self.log.error("failed to decode backtrace %s", details)
+        finally:
+            backtrace_decoding_metrics_obj().observe_latency(time.perf_counter() - start_time)
+            event.ready_to_publish()
+            event.publish()
+
+    def _decode_backtrace_using_symbols_cache(self, node_name: str, build_id: str, raw_backtrace: str) -> str:
+        """Decode backtrace using local addr2line and a cache of already decoded addresses.
+
+        Run addr2line only for addresses which are not in the cache yet.  Backtraces during reactor stalls
+        storm share most of their frames, so, usually there is nothing to decode at all.  The cache keeps
+        `backtrace_symbols_cache_size' least recently used frames of all builds.
+        """
+        addresses = raw_backtrace.split()
+        symbols = {}
+        with self._backtrace_symbols_lock:
+            for address in dict.fromkeys(addresses):
+                if (symbol := self._backtrace_symbols.get((build_id, address))) is not None:
+                    self._backtrace_symbols.move_to_end((build_id, address))
+                    symbols[address] = symbol
+        if missing := [address for address in dict.fromkeys(addresses) if address not in symbols]:
+            with self._debug_info_locks.get_lock(build_id):
+                scylla_debug_file = self.copy_scylla_debug_info(node_name, build_id)
+            decoded = self.decode_backtrace_local(scylla_debug_file, " ".join(missing)).stdout
+            if len(decoded_symbols := self._split_addr2line_output(decoded)) != len(missing):
+                # Can't map the output to the addresses, so, don't cache and decode the whole backtrace.
+                if missing == addresses:
+                    return decoded
+                return self.decode_backtrace_local(scylla_debug_file, " ".join(addresses)).stdout
+            symbols.update(zip(missing, decoded_symbols))
+            with self._backtrace_symbols_lock:
+                self._backtrace_symbols.update(
+                    ((build_id, address), symbol) for address, symbol in zip(missing, decoded_symbols)
+                )
+                while len(self._backtrace_symbols) > self.backtrace_symbols_cache_size:
+                    self._backtrace_symbols.popitem(last=False)
+        return "".join(symbols[address] for address in addresses)
+
+    @staticmethod
+    def _split_addr2line_output(output: str) -> list[str]:
+        """Split output of `addr2line -Cpife' to a list of frames, one per address (with inlined frames.)"""
+        symbols = []
+        for line in output.splitlines(keepends=True):
+            if not line.endswith("\n"):
+                line += "\n"  # noqa: PLW2901
+            if symbols and line.startswith(" (inlined by) "):
+                symbols[-1] += line
+            else:
+                symbols.append(line)
+        return symbols
 
     def copy_scylla_debug_info(self, node_name: str, build_id: str):
         """Copy scylla debug file from db-node to monitor-node.
@@ -2151,7 +2226,7 @@ class BaseNode(AutoSshContainerMixin):
 
         raise Exception("Couldn't find scylla debug information")
 
-    @lru_cache(maxsize=None)
+    @lru_cache(maxsize=BACKTRACE_DECODING_CACHE_SIZE)
     def decode_backtrace_local(self, scylla_debug_file, raw_backtrace):
         """run decode backtrace on monitor node
 
@@ -4231,6 +4306,10 @@ class BaseCluster:
     def __str__(self):
         return f"{self.__class__.__name__}:{self.name}"
 
+    @cached_property
+    def cql_sessions_pool(self) -> CQLSessionsPool:
+        return CQLSessionsPool(name=f"{self.name}:CQLSessionsPool")
+
     @cached_property
     def test_config(self) -> TestConfig:
         return TestConfig()
@@ -4520,6 +4599,7 @@ class BaseCluster:
         return errors
 
     def destroy(self):
+        self.cql_sessions_pool.close()
         self.log.info("Destroy nodes")
         for node in self.nodes:
             node.destroy()
@@ -4632,6 +4712,54 @@ class BaseCluster:
         else:
             auth_provider = None
 
+        # A session made with an SSL context given by the caller can't be matched with others, so, it's not pooled.
+        pool_key = None
+        if ssl_context is None:
+            pool_key = (
+                tuple(node_ips or ()),
+                port,
+                keyspace,
+                user,
+                password,
+                compression,
+                protocol_version,
+                type(load_balancing_policy).__name__,
+                getattr(load_balancing_policy, "local_dc", None),
+                getattr(load_balancing_policy, "local_rack", None),
+                (node.node_type, node.ip_address) if self.params.get("client_encrypt") else None,
+            )
+
+        connect = partial(
+            self._connect_session,
+            node=node,
+            keyspace=keyspace,
+            auth_provider=auth_provider,
+            compression=compression,
+            protocol_version=protocol_version,
+            load_balancing_policy=load_balancing_policy,
+            port=port,
+            ssl_context=ssl_context,
+            node_ips=node_ips,
+            connect_timeout=connect_timeout,
+        )
+        if pool_key is None:
+            session = connect()
+            return ScyllaCQLSession(session, session.cluster, verbose)
+        return self.cql_sessions_pool.lease(key=pool_key, connect=connect, verbose=verbose)
+
+    def _connect_session(
+        self,
+        node,
+        keyspace,
+        auth_provider,
+        compression,
+        protocol_version,
+        load_balancing_policy,
+        port,
+        ssl_context,
+        node_ips,
+        connect_timeout,
+    ):  # noqa: PLR0913
         if ssl_context is None and self.params.get("client_encrypt"):
             if "db" in node.node_type:
                 cert_name, key_name = TLSAssets.DB_CERT, TLSAssets.DB_KEY
@@ -4668,7 +4796,7 @@ class BaseCluster:
         # override driver default consistency level of LOCAL_QUORUM
         session.default_consistency_level = ConsistencyLevel.ONE
 
-        return ScyllaCQLSession(session, cluster_driver, verbose)
+        return session
 
     def get_load_balancing_policy(
         self, whitelist_nodes: Optional[list[BaseNode]] = None
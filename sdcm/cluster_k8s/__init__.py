@@ -1569,7 +1569,9 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
 
     @log_run_info
     def gather_k8s_logs(self) -> None:
-        return KubernetesOps.gather_k8s_logs(logdir_path=self.logdir, kubectl=self.kubectl)
+        return KubernetesOps.gather_k8s_logs(
+            logdir_path=self.logdir, kubectl=self.kubectl, api_call_rate_limiter=self.api_call_rate_limiter
+        )
 
     @log_run_info
     def gather_k8s_logs_by_operator(self) -> None:
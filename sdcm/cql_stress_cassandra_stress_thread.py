@@ -180,6 +180,7 @@ class CqlStressCassandraStressThread(CassandraStressThread):
                 node=loader,
                 remote_log_file=remote_hdr_file_name_full_path,
                 target_log_file=os.path.join(loader.logdir, remote_hdr_file_name),
+                compressed_transfer=self.params.get("hdrhistogram_compressed_transfer"),
             )
         else:
             hdrh_logger_context = contextlib.nullcontext()
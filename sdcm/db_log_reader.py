@@ -15,7 +15,10 @@
 import json
 import logging
 import os
+import queue
 import re
+import threading
+from collections import Counter
 from functools import cached_property
 from multiprocessing import Process, Event, Queue
 from typing import Optional
@@ -25,7 +28,9 @@ from sdcm.sct_events import Severity
 from sdcm.sct_events.base import LogEvent
 from sdcm.sct_events.database import get_pattern_to_event_to_func_mapping, BACKTRACE_RE
 from sdcm.sct_events.decorators import raise_event_on_failure
+from sdcm.sct_events.events_device import EventsDevice, get_events_main_device
 from sdcm.utils.common import make_threads_be_daemonic_by_default
+from sdcm.utils.log_patterns_matcher import MultiPatternMatcher
 
 LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +40,20 @@ LOGGER = logging.getLogger(__name__)
 LOG_LINE_MAX_PROCESSING_SIZE = 1024 * 5
 
 
+def enable_batched_events_publishing() -> Optional[EventsDevice]:
+    # Events found during one pass over the log are written to raw_events.log and sent to EventsDevice
+    # in batches, which is much cheaper during events storms (e.g., lot of reactor stalls.)
+    try:
+        events_device = get_events_main_device(_registry=LogEvent._events_processes_registry)
+    except RuntimeError as exc:
+        LOGGER.debug("Batched events publishing is disabled: %s", exc)
+        return None
+    if not isinstance(events_device, EventsDevice):
+        return None
+    events_device.enable_batched_publishing()
+    return events_device
+
+
 class DbLogReader(Process):
     EXCLUDE_FROM_LOGGING = [
         " | sshd[",
@@ -64,6 +83,7 @@ class DbLogReader(Process):
         log_lines: bool,
         backtrace_stall_decoding: bool = True,
         backtrace_decoding_disable_regex: Optional[str] = None,
+        batched_events_publishing: bool = True,
     ):
         self._system_log = system_log
         self._system_event_patterns = system_event_patterns
@@ -71,6 +91,7 @@ class DbLogReader(Process):
         self._log_lines = log_lines
         self._node_name = node_name
         self._backtrace_stall_decoding = backtrace_stall_decoding
+        self._batched_events_publishing = batched_events_publishing
         self._disable_regex_compiled = None
         if backtrace_decoding_disable_regex:
             self._backtrace_decoding_disable_regex = re.compile(backtrace_decoding_disable_regex)
@@ -90,6 +111,14 @@ class DbLogReader(Process):
     def _continuous_event_patterns(self):
         return get_pattern_to_event_to_func_mapping(node=self._node_name)
 
+    @cached_property
+    def _continuous_event_patterns_matcher(self) -> MultiPatternMatcher:
+        return MultiPatternMatcher([item.pattern for item in self._continuous_event_patterns])
+
+    @cached_property
+    def _system_event_patterns_matcher(self) -> MultiPatternMatcher:
+        return MultiPatternMatcher([pattern for pattern, _ in self._system_event_patterns])
+
     def _should_skip_decoding(self, event: LogEvent) -> bool:
         """Check if backtrace decoding should be skipped for this event.
 
@@ -112,6 +141,14 @@ class DbLogReader(Process):
 
         return False
 
+    def _has_new_data(self) -> bool:
+        """Check if the log has grown since the last pass, i.e., if the next pass can read anything."""
+
+        try:
+            return os.stat(self._system_log).st_size > self._last_log_position
+        except FileNotFoundError:
+            return False
+
     def _read_and_publish_events(self) -> None:  # noqa: PLR0912
         """Search for all known patterns listed in `sdcm.sct_events.database.SYSTEM_ERROR_EVENTS'."""
 
@@ -154,12 +191,13 @@ class DbLogReader(Process):
                     if json_log:
                         continue
 
-                    if match := self.BUILD_ID_REGEX.search(line):
+                    if "build-id" in line and (match := self.BUILD_ID_REGEX.search(line)):
                         self._build_id = match.groups()[0]
                         LOGGER.debug("Found build-id: %s", self._build_id)
 
+                    lowered_line = line.lower()
                     one_line_backtrace = []
-                    if ("backtrace:" in line.lower() or "report: at" in line.lower()) and "0x" in line:
+                    if ("backtrace:" in lowered_line or "report: at" in lowered_line) and "0x" in line:
                         # This part handles the backtrases are printed in one line.
                         # Example:
                         # [shard 2] seastar - Exceptional future ignored: exceptions::mutation_write_timeout_exception
@@ -180,24 +218,19 @@ class DbLogReader(Process):
 
                     # for each line, if it matches a continuous event pattern,
                     # call the appropriate function with the class tied to that pattern
-                    for item in self._continuous_event_patterns:
-                        if event_match := item.pattern.search(line):
-                            item.period_func(match=event_match)
-                            break
+                    # (only patterns which literals are found in the line are tried, first matched wins)
+                    if found := self._continuous_event_patterns_matcher.search(line, lowered_line=lowered_line):
+                        item_index, event_match = found
+                        self._continuous_event_patterns[item_index].period_func(match=event_match)
 
-                    skip_to_next_line = False
                     # for each line use all regexes to match, and if found send an event
-                    for pattern, event in self._system_event_patterns:
-                        if pattern.search(line):
-                            if event.severity == Severity.SUPPRESS:
-                                skip_to_next_line = True
-                                break
-                            cloned_event = event.clone().add_info(node=self._node_name, line_number=index, line=line)
-                            backtraces.append(dict(event=cloned_event, backtrace=[]))
-                            break  # Stop iterating patterns to avoid creating two events for one line of the log
-
-                    if skip_to_next_line:
-                        continue
+                    # (stop on the first matched pattern to avoid creating two events for one line of the log)
+                    if found := self._system_event_patterns_matcher.search(line, lowered_line=lowered_line):
+                        _, event = self._system_event_patterns[found[0]]
+                        if event.severity == Severity.SUPPRESS:
+                            continue
+                        cloned_event = event.clone().add_info(node=self._node_name, line_number=index, line=line)
+                        backtraces.append(dict(event=cloned_event, backtrace=[]))
 
                     if one_line_backtrace and backtraces:
                         backtraces[-1]["backtrace"] = one_line_backtrace
@@ -258,9 +291,12 @@ class DbLogReader(Process):
             self._decoding_queue is not None,
         )
         make_threads_be_daemonic_by_default()
+        events_device = enable_batched_events_publishing() if self._batched_events_publishing else None
         while not self._terminate_event.wait(0.1):
             try:
                 self._read_and_publish_events()
+                if events_device:
+                    events_device.flush_published_events()
             except (SystemExit, KeyboardInterrupt) as ex:
                 LOGGER.debug("db_log_reader_thread() stopped by %s", ex.__class__.__name__)
             except Exception:
@@ -289,3 +325,155 @@ class DbLogReader(Process):
 
     def stop(self):
         self._terminate_event.set()
+
+
+class DbLogReaderPoolWorker(Process):
+    """Read and parse a set of db logs in one process.
+
+    All state of a log (offsets, backtraces, build-id, continuous events) is kept by a DbLogReader object, which is
+    not started as a separate process, but polled by the worker's loop: a log is read only if it has grown.
+    """
+
+    def __init__(self, decoding_queue: Optional[Queue], poll_interval: float, index: int = 0):
+        self._decoding_queue = decoding_queue
+        self._poll_interval = poll_interval
+        self._commands = Queue()
+        self._terminate_event = Event()
+        self._readers: dict[str, DbLogReader] = {}
+        super().__init__(name=f"{self.__class__.__name__}-{index}", daemon=True)
+
+    def add_reader(self, reader_kwargs: dict) -> None:
+        self._commands.put(("add", reader_kwargs))
+
+    def remove_reader(self, system_log: str) -> None:
+        self._commands.put(("remove", system_log))
+
+    def _process_commands(self) -> None:
+        while True:
+            try:
+                command, arg = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            if command == "add":
+                reader = DbLogReader(remoter=None, decoding_queue=self._decoding_queue, **arg)
+                self._readers[arg["system_log"]] = reader
+                LOGGER.debug("Logging for node %s is started by %s", arg["node_name"], self.name)
+            elif self._readers.pop(arg, None):
+                LOGGER.debug("Logging of %s is stopped by %s", arg, self.name)
+
+    def _read_and_publish_events(self) -> None:
+        for reader in list(self._readers.values()):
+            if not reader._has_new_data():
+                continue
+            try:
+                reader._read_and_publish_events()
+            except Exception:
+                LOGGER.exception("failed to read db log %s", reader._system_log)
+
+    @raise_event_on_failure
+    def run(self):
+        make_threads_be_daemonic_by_default()
+        events_device = enable_batched_events_publishing()
+        while not self._terminate_event.wait(self._poll_interval):
+            try:
+                self._process_commands()
+                self._read_and_publish_events()
+                if events_device:
+                    events_device.flush_published_events()
+            except (SystemExit, KeyboardInterrupt) as ex:
+                LOGGER.debug("%s stopped by %s", self.name, ex.__class__.__name__)
+
+    def stop(self):
+        self._terminate_event.set()
+
+
+class PooledDbLogReader:
+    """Same interface as DbLogReader has for a node, but the log is read by a worker of DbLogReaderPool."""
+
+    def __init__(self, pool: "DbLogReaderPool", **reader_kwargs):
+        self._pool = pool
+        self._reader_kwargs = reader_kwargs
+        self.system_log = reader_kwargs["system_log"]
+
+    def start(self) -> None:
+        self._pool.add_reader(self._reader_kwargs)
+
+    def stop(self) -> None:
+        self._pool.remove_reader(self.system_log)
+
+    def is_alive(self) -> bool:
+        return self._pool.is_reading(self.system_log)
+
+
+class DbLogReaderPool:
+    """Read db logs of all nodes by a limited number of worker processes instead of a process per node.
+
+    Each log is pinned to one worker (the least loaded one) for its whole life, so, its state is the same as it would
+    be in a DbLogReader process.  Workers are started on demand, up to the `size' (number of CPU cores by default.)
+    """
+
+    poll_interval: float = 0.1
+
+    def __init__(self, decoding_queue: Optional[Queue] = None, size: Optional[int] = None):
+        self.size = size or os.cpu_count() or 1
+        self._decoding_queue = decoding_queue
+        self._workers: list[DbLogReaderPoolWorker] = []
+        self._log_to_worker: dict[str, DbLogReaderPoolWorker] = {}
+        self._lock = threading.Lock()
+
+    def reader(
+        self,
+        system_log: str,
+        node_name: str,
+        system_event_patterns: list,
+        log_lines: bool,
+        backtrace_stall_decoding: bool = True,
+        backtrace_decoding_disable_regex: Optional[str] = None,
+    ) -> PooledDbLogReader:
+        return PooledDbLogReader(
+            pool=self,
+            system_log=system_log,
+            node_name=node_name,
+            system_event_patterns=system_event_patterns,
+            log_lines=log_lines,
+            backtrace_stall_decoding=backtrace_stall_decoding,
+            backtrace_decoding_disable_regex=backtrace_decoding_disable_regex,
+        )
+
+    def _get_worker(self) -> DbLogReaderPoolWorker:
+        load = Counter(self._log_to_worker.values())
+        if len(self._workers) < self.size and all(load[worker] for worker in self._workers):
+            worker = DbLogReaderPoolWorker(
+                decoding_queue=self._decoding_queue, poll_interval=self.poll_interval, index=len(self._workers)
+            )
+            worker.start()
+            self._workers.append(worker)
+            return worker
+        return min(self._workers, key=lambda worker: load[worker])
+
+    def add_reader(self, reader_kwargs: dict) -> None:
+        with self._lock:
+            if reader_kwargs["system_log"] in self._log_to_worker:
+                raise ValueError(f"{reader_kwargs['system_log']} is already read by {self.__class__.__name__}")
+            worker = self._get_worker()
+            worker.add_reader(reader_kwargs)
+            self._log_to_worker[reader_kwargs["system_log"]] = worker
+
+    def remove_reader(self, system_log: str) -> None:
+        with self._lock:
+            if worker := self._log_to_worker.pop(system_log, None):
+                worker.remove_reader(system_log)
+
+    def is_reading(self, system_log: str) -> bool:
+        with self._lock:
+            worker = self._log_to_worker.get(system_log)
+        return worker is not None and worker.is_alive()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            self._log_to_worker.clear()
+            workers = self._workers.copy()
+        for worker in workers:
+            worker.stop()
+        for worker in workers:
+            worker.join(timeout)
@@ -15,11 +15,15 @@ import re
 import time
 import logging
 import json
+import threading
 import urllib.parse
 
+from array import array
 from textwrap import dedent
 from math import sqrt
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Hashable, Iterable, NamedTuple, Optional
 
 import yaml
 import requests
@@ -39,6 +43,10 @@ MB_SIZE = KB_SIZE * 1024
 GB_SIZE = MB_SIZE * 1024
 SCYLLA_DIR = "/var/lib/scylla"
 
+PROMETHEUS_QUERY_WORKERS: int = 8
+PROMETHEUS_QUERY_CACHE_SIZE: int = 512
+PROMETHEUS_QUERY_CACHE_SETTLE_TIME: float = 60  # seconds, results for more recent ranges can change and not cached
+
 
 class CassandraStressCmdParseError(Exception):
     def __init__(self, cmd, ex):
@@ -194,13 +202,85 @@ def get_cdcreader_cmd_params(cmd):
     return get_raw_cmd_params(cmd)
 
 
+class PrometheusQuery(NamedTuple):
+    query: str
+    start: float
+    end: float
+    scrap_metrics_step: Optional[int] = None
+
+
+class PrometheusSeries(NamedTuple):
+    """A range query result of one time series with timestamps and values parsed to arrays of floats."""
+
+    metric: dict
+    timestamps: array
+    values: array
+
+    @classmethod
+    def from_result(cls, result: dict) -> "PrometheusSeries":
+        values = result.get("values", ())
+        return cls(
+            metric=result.get("metric", {}),
+            timestamps=array("d", [timestamp for timestamp, _ in values]),
+            values=array("d", [float(value) for _, value in values]),  # float() parses "NaN" and "+Inf" too
+        )
+
+
+class PrometheusQueryCache:
+    """Thread-safe LRU cache of range query results."""
+
+    def __init__(self, maxsize: int = PROMETHEUS_QUERY_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[list]:
+        with self._lock:
+            if (result := self._results.get(key)) is not None:
+                self._results.move_to_end(key)
+            return result
+
+    def put(self, key: Hashable, result: list) -> None:
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._results)
+
+
+PROMETHEUS_QUERY_CACHE = PrometheusQueryCache()
+
+
 class PrometheusDBStats:
+    """
+    Prometheus HTTP API client.
+
+    All instances share one HTTP session per Prometheus server, so, connections are reused between instances.
+    Range queries which ended at least `PROMETHEUS_QUERY_CACHE_SETTLE_TIME' seconds ago are aligned to the step
+    and their results are cached in `PROMETHEUS_QUERY_CACHE'.  More recent ranges are queried as is.
+    Use `query_many()' to run independent queries concurrently.
+    """
+
+    query_workers = PROMETHEUS_QUERY_WORKERS
+
+    _sessions: dict[str, requests.Session] = {}
+    _sessions_lock = threading.Lock()
+
     def __init__(self, host, port=9090, protocol="http", alternator=None):
         self.host = host
         self.port = port
         self.protocol = protocol
-        self.range_query_url = f"{protocol}://{normalize_ipv6_url(host)}:{port}/api/v1/query_range?query="
-        self._session = self._create_session()
+        self.base_url = f"{protocol}://{normalize_ipv6_url(host)}:{port}"
+        self.range_query_url = f"{self.base_url}/api/v1/query_range?query="
+        self._session = self._get_session(self.base_url)
         self.config = self.get_configuration()
         self.alternator = alternator
 
@@ -208,6 +288,13 @@ class PrometheusDBStats:
     def _create_session(retries: int = 3) -> requests.Session:
         return create_retry_session(retries=retries)
 
+    @classmethod
+    def _get_session(cls, base_url: str) -> requests.Session:
+        with cls._sessions_lock:
+            if (session := cls._sessions.get(base_url)) is None:
+                session = cls._sessions[base_url] = cls._create_session()
+            return session
+
     @property
     def scylla_scrape_interval(self):
         return int(self.config["scrape_configs"]["scylla"]["scrape_interval"][:-1])
@@ -223,8 +310,8 @@ class PrometheusDBStats:
             response = self._session.get(url, **kwargs)
         response.raise_for_status()
 
+        LOGGER.debug("Response from Prometheus server: %s", response.content[:200].decode(errors="replace"))
         result = json.loads(response.content)
-        LOGGER.debug("Response from Prometheus server: %s", str(result)[:200])
         if result["status"] == "success":
             return result
         else:
@@ -232,7 +319,7 @@ class PrometheusDBStats:
         return None
 
     def get_configuration(self):
-        result = self.request(url=f"{self.protocol}://{normalize_ipv6_url(self.host)}:{self.port}/api/v1/status/config")
+        result = self.request(url=f"{self.base_url}/api/v1/status/config")
         configs = yaml.safe_load(result["data"]["yaml"])
         LOGGER.debug("Parsed Prometheus configs: %s", configs)
         new_scrape_configs = {}
@@ -251,19 +338,50 @@ class PrometheusDBStats:
                   metric: { },
                   values: [[linux_timestamp1, value1], [linux_timestamp2, value2]...[linux_timestampN, valueN]]
                  }
+        Note: returned results can be shared with other callers, don't modify them.
         """
-        url = f"{self.protocol}://{normalize_ipv6_url(self.host)}:{self.port}/api/v1/query_range?query="
         if not scrap_metrics_step:
             scrap_metrics_step = self.scylla_scrape_interval
-        _query = f"{url}{query}&start={start}&end={end}&step={scrap_metrics_step}"
+        cacheable = (
+            isinstance(scrap_metrics_step, int)
+            and isinstance(start, (int, float))
+            and isinstance(end, (int, float))
+            and end <= time.time() - PROMETHEUS_QUERY_CACHE_SETTLE_TIME
+        )
+        if cacheable:
+            # Align the range to the step to have the same points (and cache key) for close ranges, like Grafana does.
+            # Recent ranges are not aligned: it could cut the latest points off, or make a near-now point a past one.
+            start, end = (int(timestamp // scrap_metrics_step * scrap_metrics_step) for timestamp in (start, end))
+            cache_key = (self.base_url, query, start, end, scrap_metrics_step)
+            if (result := PROMETHEUS_QUERY_CACHE.get(cache_key)) is not None:
+                LOGGER.debug("Cached result for query to PrometheusDB: %s", cache_key)
+                return result
+        _query = f"{self.range_query_url}{query}&start={start}&end={end}&step={scrap_metrics_step}"
         LOGGER.debug("Query to PrometheusDB: %s", _query)
         result = self.request(url=_query)
         if result:
-            return result["data"]["result"]
+            result = result["data"]["result"]
+            if cacheable:
+                PROMETHEUS_QUERY_CACHE.put(cache_key, result)
+            return result
         else:
             LOGGER.error("Prometheus query unsuccessful!")
             return []
 
+    def query_many(self, queries: Iterable[PrometheusQuery]) -> list[list]:
+        """Run independent queries concurrently and return their results in the same order."""
+        queries = list(queries)
+        if len(queries) < 2:
+            return [self.query(*query) for query in queries]
+        with ThreadPoolExecutor(max_workers=min(self.query_workers, len(queries))) as executor:
+            return list(executor.map(lambda query: self.query(*query), queries))
+
+    def query_series(self, query, start, end, scrap_metrics_step=None) -> list[PrometheusSeries]:
+        return [PrometheusSeries.from_result(result) for result in self.query(query, start, end, scrap_metrics_step)]
+
+    def query_series_many(self, queries: Iterable[PrometheusQuery]) -> list[list[PrometheusSeries]]:
+        return [list(map(PrometheusSeries.from_result, results)) for results in self.query_many(queries)]
+
     @staticmethod
     def _check_start_end_time(start_time, end_time):
         if end_time - start_time < 120:
@@ -379,7 +497,13 @@ class PrometheusDBStats:
         used_capacity_query = f"{filesystem_capacity_query}-{AVAIL_SIZE_METRIC}{node_capacity_query_postfix}"
         LOGGER.debug("filesystem_capacity_query: %s", filesystem_capacity_query)
 
-        fs_size_res = self.query(query=filesystem_capacity_query, start=int(time.time()) - 5, end=int(time.time()))
+        now = int(time.time())
+        fs_size_res, used_cap_res = self.query_many(
+            [
+                PrometheusQuery(filesystem_capacity_query, now - 5, now),
+                PrometheusQuery(used_capacity_query, now - 5, now),
+            ]
+        )
         if not fs_size_res:
             LOGGER.warning("No results from Prometheus query: %s", filesystem_capacity_query)
             return 0
@@ -388,11 +512,15 @@ class PrometheusDBStats:
             filesystem_capacity_query = f"{FS_SIZE_METRIC_OLD}{node_capacity_query_postfix}"
             used_capacity_query = f"{filesystem_capacity_query}-{AVAIL_SIZE_METRIC_OLD}{node_capacity_query_postfix}"
             LOGGER.debug("filesystem_capacity_query: %s", filesystem_capacity_query)
-            fs_size_res = self.query(query=filesystem_capacity_query, start=int(time.time()) - 5, end=int(time.time()))
+            fs_size_res, used_cap_res = self.query_many(
+                [
+                    PrometheusQuery(filesystem_capacity_query, now - 5, now),
+                    PrometheusQuery(used_capacity_query, now - 5, now),
+                ]
+            )
 
         assert fs_size_res[0], "Could not resolve capacity query result."
         LOGGER.debug("used_capacity_query: %s", used_capacity_query)
-        used_cap_res = self.query(query=used_capacity_query, start=int(time.time()) - 5, end=int(time.time()))
         assert used_cap_res, "No results from Prometheus"
         used_size_mb = float(used_cap_res[0]["values"][0][1]) / float(MB_SIZE)
         used_size_gb = round(float(used_size_mb / 1024), 2)
@@ -24,7 +24,7 @@ import traceback
 from collections import OrderedDict
 from typing import Optional, Tuple, List
 from pathlib import Path
-from functools import cached_property
+from functools import cached_property, partial
 from dataclasses import dataclass
 
 import requests
@@ -67,6 +67,7 @@ from sdcm.utils.distro import Distro
 from sdcm.utils.decorators import retrying
 from sdcm.utils.docker_utils import get_docker_bridge_gateway
 from sdcm.utils.k8s import KubernetesOps
+from sdcm.utils.logs_upload import ArchiveUploadPipeline, LogsStorage, S3LogsStorage
 from sdcm.utils.s3_remote_uploader import upload_remote_files_directly_to_s3
 from sdcm.utils.gce_utils import gce_public_addresses, gce_private_addresses
 from sdcm.localhost import LocalHost
@@ -77,6 +78,9 @@ from sdcm.remote.libssh2_client.exceptions import Failure as Libssh2_Failure
 
 LOGGER = logging.getLogger(__name__)
 
+ARCHIVE_PER_NODE_MIN_NODES: int = 10
+UPLOAD_REPORT_FILE = "upload.report"
+
 
 def _create_retry_session(retries: int = 3) -> requests.Session:
     retry_strategy = Retry(
@@ -669,6 +673,10 @@ class LogCollector:
         cluster_log_type {str} -- Type of cluster
         log_entities {list} -- List of log entities, which should be collected on remote hosts
         USER {str} -- name of user, for which search local file log versions
+        logs_storage {LogsStorage} -- where archives are uploaded to, S3 by default
+        archive_per_node_min_nodes {int} -- for clusters of this size and bigger, logs of each node are
+            archived and uploaded as soon as they're collected, instead of a single archive for all nodes
+        zstd_threads {int} -- number of zstd compression threads per archive, 0 means one per CPU core
     """
 
     _current_run = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -677,6 +685,9 @@ class LogCollector:
     log_entities = []
     node_remote_dir = "/tmp"
     collect_timeout = 300
+    logs_storage: Optional[LogsStorage] = None
+    archive_per_node_min_nodes = ARCHIVE_PER_NODE_MIN_NODES
+    zstd_threads = 0
 
     @property
     def current_run(self):
@@ -691,6 +702,21 @@ class LogCollector:
             if self.params:
                 entity.set_params(self.params)
 
+    @property
+    def storage(self) -> LogsStorage:
+        if self.logs_storage is None:
+            self.logs_storage = S3LogsStorage()
+        return self.logs_storage
+
+    def create_upload_pipeline(self) -> ArchiveUploadPipeline:
+        return ArchiveUploadPipeline(
+            storage=self.storage,
+            dest_dir=f"{self.test_id}/{self.current_run}",
+            check_archive=lambda archive: check_archive(LocalCmdRunner(), archive),
+            report_path=os.path.join(os.path.dirname(self.local_dir), UPLOAD_REPORT_FILE),
+            name=type(self).__name__,
+        )
+
     def create_local_storage_dir(self, base_local_dir):
         local_dir = os.path.join(base_local_dir, self.current_run, f"{self.cluster_log_type}-{self.test_id[:8]}")
         try:
@@ -799,6 +825,13 @@ class LogCollector:
         return local_dir
 
     def collect_logs(self, local_search_path: Optional[str] = None) -> list[str]:
+        """Collect logs from all nodes in parallel, archive and upload them.
+
+        For big clusters (see `archive_per_node_min_nodes') logs of a node are archived and uploaded as soon as
+        they're collected, while logs of other nodes are still being collected.  Logs collected to the parent dir
+        (and logs of nodes failed to be archived) are archived and uploaded as one more archive at the end.
+        """
+
         def collect_logs_per_node(node):
             LOGGER.info("Collecting logs on host: %s", node.name)
             remote_node_dir = self.create_remote_storage_dir(node)
@@ -816,32 +849,43 @@ class LogCollector:
                     LOGGER.error(
                         "Error occured during collecting of %s on host: %s\n%s", log_entity.name, node.name, details
                     )
+            if archive_per_node and os.path.isdir(local_node_dir):
+                # Keep the cluster type in the name of the archive, it's used to find logs of the test by type.
+                pipeline.submit(
+                    partial(
+                        self.archive_to_tarfile,
+                        local_node_dir,
+                        archive_dir=pipeline.work_dir,
+                        archive_name=f"{self.cluster_log_type}-{self.test_id[:8]}-{node.name}",
+                    ),
+                    cleanup=[local_node_dir],
+                )
 
         LOGGER.debug("Nodes list %s", [node.name for node in self.nodes])
 
         if not self.nodes and not os.listdir(self.local_dir):
             LOGGER.warning("No nodes found for %s cluster. Logs will not be collected", self.cluster_log_type)
             return []
-        if workers_number := len(self.nodes):
-            workers_number = min(workers_number, 30)
-            try:
-                ParallelObject(self.nodes, num_workers=workers_number, timeout=self.collect_timeout).run(
-                    collect_logs_per_node, ignore_exceptions=True
-                )
-            except Exception as details:  # noqa: BLE001
-                LOGGER.error("Error occured during collecting logs %s", details)
-
-        if not os.listdir(self.local_dir):
-            LOGGER.warning("Directory %s is empty", self.local_dir)
-            return []
-
-        final_archive = self.archive_to_tarfile(self.local_dir)
-        if not final_archive:
-            return []
-        s3_link = upload_archive_to_s3(final_archive, f"{self.test_id}/{self.current_run}")
+        archive_per_node = len(self.nodes) >= self.archive_per_node_min_nodes
+        pipeline = self.create_upload_pipeline()
+        try:
+            if workers_number := len(self.nodes):
+                workers_number = min(workers_number, 30)
+                try:
+                    ParallelObject(self.nodes, num_workers=workers_number, timeout=self.collect_timeout).run(
+                        collect_logs_per_node, ignore_exceptions=True
+                    )
+                except Exception as details:  # noqa: BLE001
+                    LOGGER.error("Error occured during collecting logs %s", details)
+            pipeline.wait_for_archives()
+            if os.listdir(self.local_dir):
+                pipeline.submit(partial(self.archive_to_tarfile, self.local_dir, archive_dir=pipeline.work_dir))
+            elif not archive_per_node:
+                LOGGER.warning("Directory %s is empty", self.local_dir)
+        finally:
+            s3_links = pipeline.join()
         remove_files(self.local_dir)
-        remove_files(final_archive)
-        return [s3_link]
+        return s3_links
 
     def collect_logs_for_inactive_nodes(self, local_search_path=None):
         node_names = {node.name for node in self.nodes}
@@ -866,25 +910,37 @@ class LogCollector:
     def update_db_info(self):
         pass
 
-    def _compress_file(self, src_path: str, src_name: str) -> str:
-        archive_name = f"{src_name}.tar.zst"
-        archive_dir, log_filename = os.path.split(src_path)
+    def _compress_file(self, src_path: str, src_name: str, archive_dir: str) -> str:
+        archive_name = os.path.join(archive_dir, f"{src_name}.tar.zst")
+        src_dir, log_filename = os.path.split(src_path)
 
         LocalCmdRunner().run(
-            cmd=f"tar --zstd --warning=no-file-changed -cf '{archive_name}' -C '{archive_dir}' --transform 's/{log_filename}/{src_name}/' '{log_filename}'"
+            cmd=f"tar --use-compress-program='zstd -T{self.zstd_threads}' --warning=no-file-changed"
+            f" -cf '{archive_name}' -C '{src_dir}' --transform 's/{log_filename}/{src_name}/' '{log_filename}'"
         )
 
         return archive_name
 
-    def archive_to_tarfile(self, src_path: str, add_test_id_to_archive: bool = False) -> str:
-        src_name = os.path.basename(src_path)
+    def archive_to_tarfile(
+        self,
+        src_path: str,
+        archive_dir: str,
+        add_test_id_to_archive: bool = False,
+        archive_name: Optional[str] = None,
+    ) -> str:
+        """Compress `src_path' to a new temporary directory inside of `archive_dir'.
+
+        Archives of files with same names (e.g., from different directories) can be created concurrently,
+        so, each archive gets its own directory.
+        """
+        src_name = archive_name or os.path.basename(src_path)
         if add_test_id_to_archive:
             # Add test_id to the archive name when archive is created per log file, like: sct.log
             extension = f".{src_name.split('.')[-1]}"
             if extension in [".log", ".json"]:
                 src_name = src_name.replace(extension, f"-{self.test_id.split('-')[0]}{extension}")
         try:
-            return self._compress_file(src_path, src_name)
+            return self._compress_file(src_path, src_name, tempfile.mkdtemp(dir=archive_dir))
         except Exception as details:  # noqa: BLE001
             LOGGER.error("Error during archive creation. Details: \n%s", details)
             return None
@@ -1261,25 +1317,30 @@ class BaseSCTLogCollector(LogCollector):
         return self.get_files_size() < self.too_big_log_size
 
     def create_single_archive_and_upload(self) -> list[str]:
-        final_archive = self.archive_to_tarfile(self.local_dir)
-
-        s3_link = upload_archive_to_s3(final_archive, f"{self.test_id}/{self.current_run}")
+        pipeline = self.create_upload_pipeline()
+        pipeline.submit(partial(self.archive_to_tarfile, self.local_dir, archive_dir=pipeline.work_dir))
+        s3_links = pipeline.join()
         remove_files(self.local_dir)
-        remove_files(final_archive)
-        return [s3_link]
+        return s3_links
 
     def create_archive_per_file_and_upload(self) -> list[str]:
-        s3_links = []
-        for root, _, files in os.walk(self.local_dir):
-            for current_file in files:
-                file_path = os.path.join(root, current_file)
-                LOGGER.info(file_path)
-                file_archive = self.archive_to_tarfile(file_path, add_test_id_to_archive=True)
-                LOGGER.info(file_archive)
-                s3_link = upload_archive_to_s3(file_archive, f"{self.test_id}/{self.current_run}")
-                s3_links.append(s3_link)
-                remove_files(file_path)
-                remove_files(file_archive)
+        pipeline = self.create_upload_pipeline()
+        try:
+            for root, _, files in os.walk(self.local_dir):
+                for current_file in files:
+                    file_path = os.path.join(root, current_file)
+                    LOGGER.info(file_path)
+                    pipeline.submit(
+                        partial(
+                            self.archive_to_tarfile,
+                            file_path,
+                            archive_dir=pipeline.work_dir,
+                            add_test_id_to_archive=True,
+                        ),
+                        cleanup=[file_path],
+                    )
+        finally:
+            s3_links = pipeline.join()
         return s3_links
 
     def create_archive_and_upload(self) -> list[str]:
@@ -1299,7 +1360,7 @@ class PythonSCTLogCollector(BaseSCTLogCollector):
     cluster_log_type = "sct-runner-python-log"
     cluster_dir_prefix = "sct-runner-python-log"
 
-    def _compress_file(self, src_path: str, src_name: str) -> list[str]:
+    def _compress_file(self, src_path: str, src_name: str, archive_dir: str) -> list[str]:
         """
         In case of big SCT.log file, it will be split into several GZ files by bash script
         that uses minimum disc space to mitigate concern: larger SCT disks translates to higher costs.
@@ -1308,33 +1369,27 @@ class PythonSCTLogCollector(BaseSCTLogCollector):
         only files, that will double the used space.
         """
         if os.path.getsize(src_path) < self.too_big_log_size:
-            return [super()._compress_file(src_path, src_name)]
+            return [super()._compress_file(src_path, src_name, archive_dir)]
         else:
             runner = LocalCmdRunner()
             runner.run(
-                f"bash {os.path.join(os.path.dirname(__file__), 'log_archive.sh')} "
-                f"{src_path} {self.too_big_log_size} {src_name}"
+                f"cd '{archive_dir}' && bash {os.path.join(os.path.dirname(__file__), 'log_archive.sh')} "
+                f"{os.path.abspath(src_path)} {self.too_big_log_size} {src_name}"
             )
-            res = runner.run(f"ls *{src_name}.zst")
+            res = runner.run(f"ls {archive_dir}/*{src_name}.zst")
             return res.stdout.rstrip("\n").split("\n")
 
     def create_archive_and_upload(self) -> list[str]:
-        file_archives = self.archive_to_tarfile(os.path.join(self.local_dir, "sct.log"), add_test_id_to_archive=True)
-        s3_links = []
-
-        def _upload_and_cleanup(file_archive):
-            link = upload_archive_to_s3(file_archive, f"{self.test_id}/{self.current_run}")
-            remove_files(file_archive)
-            return link
-
-        parallel = ParallelObject(file_archives, timeout=3600, num_workers=min(len(file_archives), 4))
-        results = parallel.run(_upload_and_cleanup, ignore_exceptions=True)
-        for result in results:
-            if result.exc:
-                LOGGER.error("Failed to upload archive chunk: %s", result.exc)
-            else:
-                s3_links.append(result.result)
-
+        pipeline = self.create_upload_pipeline()
+        pipeline.submit(
+            partial(
+                self.archive_to_tarfile,
+                os.path.join(self.local_dir, "sct.log"),
+                archive_dir=pipeline.work_dir,
+                add_test_id_to_archive=True,
+            )
+        )
+        s3_links = pipeline.join()
         remove_files(self.local_dir)
         return s3_links
 
@@ -2211,11 +2266,11 @@ def check_archive(remoter, path: str) -> bool:
     return archive_is_ok
 
 
-def upload_archive_to_s3(archive_path: str, storing_path: str) -> Optional[str]:
+def upload_archive_to_s3(archive_path: str, storing_path: str, storage: Optional[LogsStorage] = None) -> Optional[str]:
     if not check_archive(LocalCmdRunner(), archive_path):
         LOGGER.error("File `%s' will not be uploaded", archive_path)
         return None
-    return S3Storage().upload_file(file_path=archive_path, dest_dir=storing_path, public=False)
+    return (storage or S3LogsStorage()).upload(archive_path, storing_path)
 
 
 class XCloudParentClusterMock:
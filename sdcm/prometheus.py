@@ -35,6 +35,7 @@ STOP = "stop"
 
 LOGGER = logging.getLogger(__name__)
 NM_OBJ = {}
+BD_OBJ = None
 
 
 class _ThreadingSimpleServer(ThreadingMixIn, HTTPServer):
@@ -131,6 +132,39 @@ class NemesisMetrics:
             self.event_stop(disrupt)
 
 
+def backtrace_decoding_metrics_obj():
+    global BD_OBJ  # noqa: PLW0603
+    if BD_OBJ is None:
+        BD_OBJ = BacktraceDecodingMetrics()
+    return BD_OBJ
+
+
+class BacktraceDecodingMetrics:
+    NAME_PREFIX = "sct_backtrace_decoding"
+
+    def __init__(self):
+        self._queue_depth_gauge = NemesisMetrics.create_gauge(
+            f"{self.NAME_PREFIX}_queue_depth", "Number of backtraces waiting for decoding", []
+        )
+        try:
+            self._latency_histogram = prometheus_client.Histogram(
+                f"{self.NAME_PREFIX}_latency_seconds",
+                "Time spent to decode a backtrace",
+                buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, float("inf")),
+            )
+        except Exception as ex:  # noqa: BLE001
+            LOGGER.error("Cannot create metrics histogram: %s", ex)
+            self._latency_histogram = None
+
+    def set_queue_depth(self, depth: int):
+        if self._queue_depth_gauge is not None:
+            self._queue_depth_gauge.set(depth)
+
+    def observe_latency(self, seconds: float):
+        if self._latency_histogram is not None:
+            self._latency_histogram.observe(seconds)
+
+
 class PrometheusAlertManagerListener(threading.Thread):
     def __init__(self, ip, port=9093, interval=10, stop_flag: threading.Event = None):
         super().__init__(name=self.__class__.__name__, daemon=True)
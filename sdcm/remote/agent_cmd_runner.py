@@ -15,9 +15,12 @@ import base64
 import io
 import logging
 import os
+import shlex
 import tarfile
+import tempfile
 import threading
 import time
+import uuid
 from typing import Optional, List, Dict
 from invoke.runners import Result
 from invoke.watchers import StreamWatcher
@@ -48,6 +51,7 @@ class AgentCmdRunner(CommandRunner, RetryMixin):
 
     exception_retryable = (AgentConnectionError, AgentTimeoutError)
     default_run_retry = 3
+    streaming_poll_interval = 2.0  # seconds, used for agents which don't support incremental output
 
     def __init__(
         self,
@@ -102,60 +106,75 @@ class AgentCmdRunner(CommandRunner, RetryMixin):
             raise RetryableNetworkException(str(exc), original=exc)
         return True
 
+    @staticmethod
+    def _submit_lines(watcher_list: List[StreamWatcher], lines: List[str]) -> None:
+        for watcher in watcher_list:
+            if hasattr(watcher, "submit_line"):
+                for line in lines:
+                    watcher.submit_line(line)
+
     def _handle_streaming_job(
         self, job, cmd: str, watcher_list: List[StreamWatcher], verbose: bool, ignore_status: bool, start_time: float
     ) -> Result:
-        """Handle a streaming command that runs indefinitely until cancelled"""
+        """Handle a streaming command that runs indefinitely until cancelled
+
+        Only new output is requested from the agent (long-polling), older agents are polled every
+        `streaming_poll_interval' seconds.
+        Output is passed to watchers line by line, an incomplete last line is kept until the rest of it arrives.
+        """
         with self._streaming_lock:
             self._streaming_jobs[job.job_id] = {"cmd": cmd, "job": job}
 
         if verbose:
             self.log.debug("Streaming job %s started for command: %s", job.job_id, cmd)
 
-        poll_interval = 2.0
-        last_stdout_len = last_stderr_len = 0
+        output = {"stdout": [], "stderr": []}
+        offsets = {"stdout": 0, "stderr": 0}
+        incomplete_lines = {"stdout": "", "stderr": ""}
         current_job = job
 
         try:
             while True:
-                time.sleep(poll_interval)
-
                 try:
-                    current_job = self.agent_client.get_job(job.job_id)
+                    current_job = self.agent_client.get_job_output(
+                        job.job_id,
+                        stdout_offset=offsets["stdout"],
+                        stderr_offset=offsets["stderr"],
+                        wait=self.agent_client.long_poll_timeout,
+                    )
                 except AgentAPIError as exc:
                     if exc.status_code == 404:
                         self.log.debug("Streaming job %s no longer exists (cancelled)", job.job_id)
                         break
                     raise
 
-                for stream_name, last_len in [("stdout", last_stdout_len), ("stderr", last_stderr_len)]:
-                    stream_data = getattr(current_job, stream_name, "")
-                    if stream_data and len(stream_data) > last_len:
-                        new_data = stream_data[last_len:]
-                        if watcher_list:
-                            for watcher in watcher_list:
-                                if hasattr(watcher, "submit_line"):
-                                    for line in new_data.splitlines(True):
-                                        watcher.submit_line(line)
-                        if stream_name == "stdout":
-                            last_stdout_len = len(stream_data)
-                        else:
-                            last_stderr_len = len(stream_data)
-
-                if current_job.status in ("completed", "failed", "cancelled"):
+                for stream_name in ("stdout", "stderr"):
+                    if not (new_data := getattr(current_job, stream_name) or ""):
+                        continue
+                    output[stream_name].append(new_data)
+                    offsets[stream_name] = getattr(current_job, f"{stream_name}_offset") + len(new_data)
+                    lines = (incomplete_lines[stream_name] + new_data).splitlines(True)
+                    incomplete_lines[stream_name] = "" if lines[-1].endswith(("\n", "\r")) else lines.pop()
+                    self._submit_lines(watcher_list, lines)
+
+                if current_job.is_finished:
                     if verbose:
                         self.log.debug("Streaming job %s finished with status: %s", job.job_id, current_job.status)
                     break
 
+                if not self.agent_client.incremental_output:
+                    time.sleep(self.streaming_poll_interval)
+
         except AgentClientError as exc:
             self.log.warning("Streaming job %s encountered error: %s", job.job_id, exc)
         finally:
             with self._streaming_lock:
                 self._streaming_jobs.pop(job.job_id, None)
+            self._submit_lines(watcher_list, [line for line in incomplete_lines.values() if line])
 
         result = Result(
-            stdout=current_job.stdout or "",
-            stderr=current_job.stderr or "",
+            stdout="".join(output["stdout"]),
+            stderr="".join(output["stderr"]),
             exited=current_job.exit_code if current_job.exit_code is not None else 0,
             command=cmd,
         )
@@ -311,9 +330,9 @@ class AgentCmdRunner(CommandRunner, RetryMixin):
         sudo: bool = False,
     ) -> bool:
         """
-        Upload file or directory from local path to remote host using command execution.
+        Upload file or directory from local path to remote host.
 
-        This is a temp implementation until proper file transfer API is implemented in post MVP stages.
+        Uses the agent's files API, if available, and falls back to command execution for older agents.
 
         :param src: local file or directory path
         :param dst: remote destination path
@@ -326,7 +345,9 @@ class AgentCmdRunner(CommandRunner, RetryMixin):
         """
         src = os.path.expanduser(src)
         sudo_prefix = "sudo " if sudo else ""
-        if os.path.isdir(src):
+        if self.agent_client.is_file_transfer_supported():
+            self._send_files_by_api(src=src, dst=dst, sudo_prefix=sudo_prefix, verbose=verbose)
+        elif os.path.isdir(src):
             with tarfile.open(fileobj=(tar_buffer := io.BytesIO()), mode="w:gz") as tar:
                 tar.add(src, arcname=os.path.basename(src))
             encoded = base64.b64encode(tar_buffer.getvalue()).decode("ascii")
@@ -370,9 +391,10 @@ class AgentCmdRunner(CommandRunner, RetryMixin):
         sudo: bool = False,
     ) -> bool:
         """
-        Download file from remote host to local path using command execution.
+        Download file from remote host to local path.
 
-        This is a temp implementation until proper file transfer API is implemented in post MVP stages.
+        Uses the agent's files API, if available (directories are supported too), and falls back to command
+        execution for older agents.
 
         :param src: remote file path
         :param dst: local destination path
@@ -385,17 +407,64 @@ class AgentCmdRunner(CommandRunner, RetryMixin):
         :return: indication if operation was successful
         """
         sudo_prefix = "sudo " if sudo else ""
-        result = self.run(f"{sudo_prefix}cat {src}", timeout=timeout, ignore_status=False, verbose=False)
-
         if os.path.isdir(dst):
             dst = os.path.join(dst, os.path.basename(src))
-
         os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
-        with open(dst, "w") as f:
-            f.write(result.stdout)
+
+        if self.agent_client.is_file_transfer_supported():
+            self._receive_files_by_api(src=src, dst=dst, sudo_prefix=sudo_prefix, timeout=timeout)
+            return True
+
+        result = self.run(f"{sudo_prefix}base64 -w0 {src}", timeout=timeout, ignore_status=False, verbose=False)
+        with open(dst, "wb") as f:
+            f.write(base64.b64decode(result.stdout))
 
         return True
 
+    def _send_files_by_api(self, src: str, dst: str, sudo_prefix: str, verbose: bool) -> None:
+        if not os.path.isdir(src):
+            dst_info = self.agent_client.get_file_info(dst)
+            self.agent_client.upload_file(
+                src, os.path.join(dst, os.path.basename(src)) if dst_info.get("is_dir") else dst
+            )
+            return
+
+        # A directory is sent as an archive (which is already compressed), and extracted by a command.
+        remote_archive = f"/tmp/sct_agent_transfer_{uuid.uuid4().hex}.tar.gz"
+        with tempfile.NamedTemporaryFile(suffix=".tar.gz") as archive:
+            with tarfile.open(archive.name, mode="w:gz") as tar:
+                tar.add(src, arcname=os.path.basename(src))
+            self.agent_client.upload_file(archive.name, remote_archive, compress=False)
+        self.run(
+            f"{sudo_prefix}mkdir -p {shlex.quote(dst)} && {sudo_prefix}tar xzf {remote_archive} -C {shlex.quote(dst)};"
+            f" rc=$?; rm -f {remote_archive}; exit $rc",
+            verbose=verbose,
+            ignore_status=False,
+            timeout=600,
+        )
+
+    def _receive_files_by_api(self, src: str, dst: str, sudo_prefix: str, timeout: float) -> None:
+        if not self.agent_client.get_file_info(src).get("is_dir"):
+            self.agent_client.download_file(src, dst)
+            return
+
+        # A directory is archived by a command, received as a file, and its content is extracted to `dst'.
+        remote_archive = f"/tmp/sct_agent_transfer_{uuid.uuid4().hex}.tar.gz"
+        self.run(
+            f"{sudo_prefix}tar czf {remote_archive} -C {shlex.quote(src)} .",
+            timeout=timeout,
+            ignore_status=False,
+            verbose=False,
+        )
+        try:
+            with tempfile.NamedTemporaryFile(suffix=".tar.gz") as archive:
+                self.agent_client.download_file(remote_archive, archive.name, compress=False)
+                os.makedirs(dst, exist_ok=True)
+                with tarfile.open(archive.name, mode="r:gz") as tar:
+                    tar.extractall(dst, filter="tar")
+        finally:
+            self.run(f"{sudo_prefix}rm -f {remote_archive}", ignore_status=True, verbose=False)
+
     def ssh_debug_cmd(self) -> str:
         """Return debug command for interface compatibility (for agent, show API endpoint)"""
         scheme = "https" if self.tls else "http"
@@ -360,6 +360,25 @@ class FailuresWatcher(Responder):
             raise OutputCheckError(err)
 
 
+RETAIN_OUTPUT_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+RETAIN_OUTPUT_TAIL_RE = re.compile(r"^tail:\s*(\d+)\s*([KMG]?)B?$", re.IGNORECASE)
+
+
+def parse_retain_output(retain_output: Optional[str]) -> Optional[int]:
+    """
+    Parse `retain_output' option of `run()' and return number of characters of command output to keep in a result.
+
+    None or "all" means to keep the full output (returns None), "tail:<size>" means to keep last <size>
+    characters only, e.g., "tail:1MB" or "tail:4096".  KB/MB/GB are powers of 1024.
+    """
+    if retain_output is None or retain_output == "all":
+        return None
+    if not (match := RETAIN_OUTPUT_TAIL_RE.match(retain_output.strip())):
+        raise ValueError(f"Unsupported retain_output value: {retain_output!r}, expected 'all' or 'tail:<size>'")
+    size, unit = match.groups()
+    return int(size) * RETAIN_OUTPUT_SIZE_UNITS[unit.upper()]
+
+
 def shell_script_cmd(
     cmd: str, shell_cmd: str = "bash -cxe", quote: str = '"', preprocessor: Callable[[str], str] = dedent
 ) -> str:
@@ -1,8 +1,11 @@
 import time
+import codecs
 import tarfile
-from io import BytesIO
-from typing import TYPE_CHECKING
+from io import StringIO
+from typing import IO, TYPE_CHECKING, Iterable
 from shlex import quote
+from functools import partial
+from tempfile import SpooledTemporaryFile
 from pathlib import Path
 import shutil
 
@@ -19,6 +22,10 @@ if TYPE_CHECKING:
     from sdcm.cluster_docker import DockerNode
 
 
+DOCKER_TAR_SPOOL_MAX_SIZE: int = 32 * 1024 * 1024  # archives bigger than this are spooled to a temporary file
+DOCKER_ARCHIVE_CHUNK_SIZE: int = 1024 * 1024
+
+
 class DockerCmdRunner(CommandRunner):
     """Command runner for executing commands inside a Docker container on the node"""
 
@@ -112,19 +119,27 @@ class DockerCmdRunner(CommandRunner):
             return result
 
         try:
-            exec_output = container.exec_run(["sh", "-c", cmd], tty=False, demux=True, stream=False, user=user)
-            stdout_bytes, stderr_bytes = exec_output.output if isinstance(exec_output.output, tuple) else (b"", b"")
-
-            result = Result(
-                command=cmd,
-                exited=exec_output.exit_code,
-                stdout=stdout_bytes.decode(errors="replace") if stdout_bytes else "",
-                stderr=stderr_bytes.decode(errors="replace") if stderr_bytes else "",
-            )
+            if watchers:
+                exit_code, stdout, stderr = self._exec_streaming(container, cmd, watchers, user)
+            else:
+                exec_output = container.exec_run(["sh", "-c", cmd], tty=False, demux=True, stream=False, user=user)
+                exit_code = exec_output.exit_code
+                stdout_bytes, stderr_bytes = exec_output.output if isinstance(exec_output.output, tuple) else (b"", b"")
+                stdout = stdout_bytes.decode(errors="replace") if stdout_bytes else ""
+                stderr = stderr_bytes.decode(errors="replace") if stderr_bytes else ""
+
+            result = Result(command=cmd, exited=exit_code, stdout=stdout, stderr=stderr)
             result.duration = time.perf_counter() - start_time
-            result.exit_status = exec_output.exit_code
+            result.exit_status = exit_code
 
-            if verbose:
+            if verbose and watchers:  # the output was logged line by line already
+                self.log.debug(
+                    "<%s>: Docker exec result (status=%d, duration=%.2fs)",
+                    self.node.name,
+                    result.exited,
+                    result.duration,
+                )
+            elif verbose:
                 self.log.debug(
                     "<%s>: Docker exec result (status=%d, duration=%.2fs)\nStdout:\n%s\nStderr:\n%s",
                     self.node.name,
@@ -152,13 +167,52 @@ class DockerCmdRunner(CommandRunner):
             return result
 
     @staticmethod
-    def _create_tar_stream(src: str, dst: str) -> BytesIO:
+    def _exec_streaming(container, cmd: str, watchers: list[StreamWatcher], user: str | None = "") -> tuple:
+        """Run a command using the low-level exec API and pass its output to watchers as it arrives.
+
+        Output chunks are split to lines, an incomplete last line is kept until the rest of it arrives.
+        The exit code is taken using exec_inspect() after the output stream is closed.
+
+        Return a tuple of (exit code, stdout, stderr.)
+        """
+        api = container.client.api
+        exec_id = api.exec_create(container.id, ["sh", "-c", cmd], stdout=True, stderr=True, tty=False, user=user)["Id"]
+        decoders = [codecs.getincrementaldecoder("utf-8")(errors="replace") for _ in range(2)]
+        outputs = [StringIO(), StringIO()]
+        incomplete_lines = ["", ""]
+
+        def submit(idx: int, data: str) -> None:
+            outputs[idx].write(data)
+            lines = (incomplete_lines[idx] + data).splitlines(True)
+            incomplete_lines[idx] = "" if not lines or lines[-1].endswith(("\n", "\r")) else lines.pop()
+            for line in lines:
+                for watcher in watchers:
+                    watcher.submit_line(line)
+
+        try:
+            for chunks in api.exec_start(exec_id, stream=True, demux=True):
+                for idx, chunk in enumerate(chunks):
+                    if chunk:
+                        submit(idx, decoders[idx].decode(chunk))
+        finally:
+            for idx, decoder in enumerate(decoders):
+                submit(idx, decoder.decode(b"", final=True))
+                if incomplete_lines[idx]:
+                    for watcher in watchers:
+                        watcher.submit_line(incomplete_lines[idx])
+        exit_code = api.exec_inspect(exec_id)["ExitCode"]
+        return exit_code, outputs[0].getvalue(), outputs[1].getvalue()
+
+    @staticmethod
+    def _create_tar_stream(src: str, dst: str) -> IO[bytes]:
         """Create a tar stream from a file or directory.
 
         When src is a directory ending with '/', only the directory contents are
         archived (rsync-like semantics). Otherwise, the directory itself is included.
+
+        The archive is kept in memory up to DOCKER_TAR_SPOOL_MAX_SIZE and spooled to a temporary file above it.
         """
-        tar_stream = BytesIO()
+        tar_stream = SpooledTemporaryFile(max_size=DOCKER_TAR_SPOOL_MAX_SIZE)
         src_path = Path(src.rstrip("/"))
         with tarfile.open(fileobj=tar_stream, mode="w") as tar:
             if src_path.is_dir():
@@ -174,7 +228,12 @@ class DockerCmdRunner(CommandRunner):
         return tar_stream
 
     @staticmethod
-    def _extract_tar_stream(tar_bytes: BytesIO, dst: str):
+    def _iter_chunks(stream: IO[bytes], chunk_size: int = DOCKER_ARCHIVE_CHUNK_SIZE) -> Iterable[bytes]:
+        """Iterate over a stream in chunks, which makes requests send it using chunked transfer encoding."""
+        return iter(partial(stream.read, chunk_size), b"")
+
+    @staticmethod
+    def _extract_tar_stream(tar_bytes: IO[bytes], dst: str):
         """Extract a tar stream to the destination path"""
         dst_path = Path(dst)
         with tarfile.open(fileobj=tar_bytes, mode="r") as tar:
@@ -188,7 +247,7 @@ class DockerCmdRunner(CommandRunner):
                     with open(dst_path, "wb") as out_f:
                         tar_member = tar.extractfile(members[0])
                         if tar_member:
-                            out_f.write(tar_member.read())
+                            shutil.copyfileobj(tar_member, out_f, DOCKER_ARCHIVE_CHUNK_SIZE)
                 else:
                     dst_path.parent.mkdir(parents=True, exist_ok=True)
                     tar.extractall(path=str(dst_path.parent))
@@ -214,11 +273,11 @@ class DockerCmdRunner(CommandRunner):
             if delete_dst:
                 self.run(f"rm -rf {quote(dst)}", ignore_status=True, verbose=False)
 
-            tar_stream = self._create_tar_stream(src, dst)
             dst_path = Path(dst)
             extraction_dir = dst if dst.endswith("/") or not dst_path.suffix else str(dst_path.parent)
             self.run(f"mkdir -p {quote(extraction_dir)}", ignore_status=True, verbose=False)
-            container.put_archive(path=extraction_dir, data=tar_stream)
+            with self._create_tar_stream(src, dst) as tar_stream:
+                container.put_archive(path=extraction_dir, data=self._iter_chunks(tar_stream))
 
             if verbose:
                 self.log.info("Sent '%s' to '%s:%s'", src, container.name, dst)
@@ -252,13 +311,12 @@ class DockerCmdRunner(CommandRunner):
                 else:
                     dst_path.unlink()
 
-            tar_stream_bits, _ = container.get_archive(src)
-            tar_bytes = BytesIO()
-            for chunk in tar_stream_bits:
-                tar_bytes.write(chunk)
-            tar_bytes.seek(0)
-
-            self._extract_tar_stream(tar_bytes, dst)
+            tar_stream_bits, _ = container.get_archive(src, chunk_size=DOCKER_ARCHIVE_CHUNK_SIZE)
+            with SpooledTemporaryFile(max_size=DOCKER_TAR_SPOOL_MAX_SIZE) as tar_bytes:
+                for chunk in tar_stream_bits:
+                    tar_bytes.write(chunk)
+                tar_bytes.seek(0)
+                self._extract_tar_stream(tar_bytes, dst)
             self.log.info("Received '%s:%s' to local '%s'", container.name, src, dst)
             return True
 
@@ -210,6 +210,7 @@ class KubernetesCmdRunner(RemoteCmdRunnerBase):
         verbose: bool = True,
         new_session: bool = False,
         watchers: Optional[List[StreamWatcher]] = None,
+        output_tail_size: Optional[int] = None,
     ):
         # TODO: This should be removed than sudo calls will be done in more organized way.
         tmp = cmd.split(maxsplit=3)
@@ -229,7 +230,13 @@ class KubernetesCmdRunner(RemoteCmdRunnerBase):
                 cmd = cmd[cmd.find("sudo") + 5 :]
         # Session should be created for each run
         return super()._run_execute(
-            cmd, timeout=timeout, ignore_status=ignore_status, verbose=verbose, new_session=True, watchers=watchers
+            cmd,
+            timeout=timeout,
+            ignore_status=ignore_status,
+            verbose=verbose,
+            new_session=True,
+            watchers=watchers,
+            output_tail_size=output_tail_size,
         )
 
     @retrying(n=3, sleep_time=5, allowed_exceptions=(RetryableNetworkException,))
@@ -13,20 +13,21 @@
 
 from typing import List, Optional, Dict
 from time import perf_counter, sleep
+from collections import deque
 from os.path import normpath, expanduser, exists
 from sys import float_info
 from io import StringIO
 from warnings import warn
 from socket import socket, AF_INET, AF_INET6, SOCK_STREAM, gaierror, gethostbyname, error as sock_error
-from threading import Thread, Lock, Event, BoundedSemaphore
+from threading import Thread, Lock, Event, BoundedSemaphore, Condition
 from abc import abstractmethod, ABC
-from queue import SimpleQueue as Queue
 import codecs
 import ipaddress
 
 from ssh2.channel import Channel
 from ssh2.exceptions import AuthenticationError
 from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN
+from ssh2.session import LIBSSH2_FLAG_COMPRESS
 
 from .exceptions import (
     AuthenticationException,
@@ -45,7 +46,7 @@ from .session import Session
 from .timings import Timings, NullableTiming
 
 
-__all__ = ["Session", "Timings", "Client", "Channel", "FailedToRunCommand"]
+__all__ = ["Session", "Timings", "Client", "Channel", "FailedToRunCommand", "TailBuffer"]
 
 
 LINESEP = b"\n"
@@ -61,18 +62,52 @@ class StreamWatcher(ABC):
         pass
 
 
+class TailBuffer:
+    """
+    StringIO-like buffer that keeps only last `size` characters written to it.
+    Used to limit memory consumed by output of long-running commands, when the full output goes somewhere else.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._chunks = deque()
+        self._length = 0
+
+    def write(self, data: str) -> int:
+        if data:
+            self._chunks.append(data)
+            self._length += len(data)
+            while self._chunks and self._length - len(self._chunks[0]) >= self.size:
+                self._length -= len(self._chunks.popleft())
+        return len(data)
+
+    def getvalue(self) -> str:
+        value = "".join(self._chunks)
+        if len(self._chunks) > 1:
+            # Keep the joined value to not join chunks again on the next call.
+            self._chunks = deque((value,))
+        return value[-self.size :] if self.size else ""
+
+
 class SSHReaderThread(Thread):
     """
-    Thread that reads data from ssh session socket and forwards it to Queue.
+    Thread that reads data from ssh session socket and forwards it to lists of lines.
     It is needed because socket buffer gets overflowed if data is sent faster than watchers can process it, so
-      we have to have Queue as a buffer with 'endless' memory, and fast reader that reads data from the socket
-      and forward it to the Queue.
+      we have to have a buffer and fast reader that reads data from the socket and forward it to the buffer.
       As part of this process it splits data into lines, because watchers expect it is organized in this way.
+    Consumer waits on `new_data` condition and takes all lines collected so far at once.  If the consumer
+      is not able to keep up and more than `max_buffered_lines` lines are buffered, the reader stops reading
+      the channel till the consumer drains the buffer, so SSH flow control slows down the remote command
+      instead of the buffer growing without bounds.
     """
 
+    max_buffered_lines: int = 100_000
+
     def __init__(self, session: Session, channel: Channel, timeout: NullableTiming, timeout_read_data: NullableTiming):
-        self.stdout = Queue()
-        self.stderr = Queue()
+        self.stdout: List[bytes] = []
+        self.stderr: List[bytes] = []
+        self.new_data = Condition()
+        self.finished = False
         self.timeout_reached = False
         self._session = session
         self._channel = channel
@@ -85,11 +120,35 @@ class SSHReaderThread(Thread):
 
     def run(self):
         try:
-            self._read_output(
-                self._session, self._channel, self._timeout, self._timeout_read_data, self.stdout, self.stderr
-            )
+            self._read_output(self._session, self._channel, self._timeout, self._timeout_read_data)
         except Exception as exc:  # noqa: BLE001
             self.raised = exc
+        finally:
+            with self.new_data:
+                self.finished = True
+                self.new_data.notify_all()
+
+    def _put(self, stdout_lines: List[bytes], stderr_lines: List[bytes], end_time: float):
+        with self.new_data:
+            self.stdout.extend(stdout_lines)
+            self.stderr.extend(stderr_lines)
+            self.new_data.notify_all()
+            while (
+                len(self.stdout) + len(self.stderr) > self.max_buffered_lines
+                and self._can_run.is_set()
+                and perf_counter() < end_time
+            ):
+                self.new_data.wait(timeout=self._timeout_read_data or 0.5)
+
+    def drain(self, timeout: NullableTiming) -> tuple[List[bytes], List[bytes]]:
+        """Wait for new lines up to `timeout` seconds and return all lines from stdout and stderr buffers."""
+        with self.new_data:
+            if not (self.stdout or self.stderr or self.finished):
+                self.new_data.wait(timeout=timeout)
+            stdout, self.stdout = self.stdout, []
+            stderr, self.stderr = self.stderr, []
+            self.new_data.notify_all()
+        return stdout, stderr
 
     def _read_output(
         self,
@@ -97,10 +156,8 @@ class SSHReaderThread(Thread):
         channel: Channel,
         timeout: NullableTiming,
         timeout_read_data: NullableTiming,
-        stdout_stream: Queue,
-        stderr_stream: Queue,
     ):
-        """Reads data from ssh session, split it into lines and forward lines into stderr ad stdout pipes
+        """Reads data from ssh session, split it into lines and forward lines into stderr ad stdout buffers
         It is required for it to be fast, that is why there is code duplications and non-pythonic code
         """
 
@@ -123,34 +180,37 @@ class SSHReaderThread(Thread):
                 stderr_size, stderr_chunk = channel.read_stderr()
                 eof_result = channel.eof()
 
-            if stdout_chunk and stdout_stream is not None:
-                data_splitted = stdout_chunk.split(LINESEP)
-                if len(data_splitted) == 1:
-                    stdout_remainder = stdout_remainder + data_splitted.pop()
+            stdout_lines = stderr_lines = ()
+            if stdout_chunk:
+                stdout_lines = stdout_chunk.split(LINESEP)
+                if len(stdout_lines) == 1:
+                    stdout_remainder = stdout_remainder + stdout_lines.pop()
                 else:
                     if stdout_remainder:
-                        stdout_stream.put(stdout_remainder + data_splitted.pop(0))
-                    stdout_remainder = data_splitted.pop()
-                for chunk in data_splitted:
-                    stdout_stream.put(chunk)
+                        stdout_lines[0] = stdout_remainder + stdout_lines[0]
+                    stdout_remainder = stdout_lines.pop()
 
-            if stderr_chunk and stderr_stream is not None:
-                data_splitted = stderr_chunk.split(LINESEP)
-                if len(data_splitted) == 1:
-                    stderr_remainder = stderr_remainder + data_splitted.pop()
+            if stderr_chunk:
+                stderr_lines = stderr_chunk.split(LINESEP)
+                if len(stderr_lines) == 1:
+                    stderr_remainder = stderr_remainder + stderr_lines.pop()
                 else:
                     if stderr_remainder:
-                        stderr_stream.put(stderr_remainder + data_splitted.pop(0))
-                    stderr_remainder = data_splitted.pop()
-                for chunk in data_splitted:
-                    stderr_stream.put(chunk)
-        if stdout_remainder:
-            stdout_stream.put(stdout_remainder)
-        if stderr_remainder:
-            stderr_stream.put(stderr_remainder)
+                        stderr_lines[0] = stderr_remainder + stderr_lines[0]
+                    stderr_remainder = stderr_lines.pop()
+
+            if stdout_lines or stderr_lines:
+                self._put(stdout_lines, stderr_lines, end_time)
+        self._put(
+            [stdout_remainder] if stdout_remainder else (),
+            [stderr_remainder] if stderr_remainder else (),
+            end_time,
+        )
 
     def stop(self, timeout: float = None):
         self._can_run.clear()
+        with self.new_data:
+            self.new_data.notify_all()
         self.join(timeout)
 
 
@@ -297,6 +357,7 @@ class Client:
     keepalive_seconds: int = 60
     timings: Timings = Timings()
     flood_preventing: FloodPreventingFacility = DEFAULT_FLOOD_PREVENTING
+    compress: bool = False
 
     def __init__(
         self,
@@ -311,6 +372,7 @@ class Client:
         keepalive_seconds: int = None,
         timings: Timings = None,
         flood_preventing: FloodPreventingFacility = None,
+        compress: bool = None,
     ):
         self.host = host
         self.user = user
@@ -332,6 +394,8 @@ class Client:
             self.timings = timings
         if flood_preventing is not None:
             self.flood_preventing = flood_preventing
+        if compress is not None:
+            self.compress = compress
         self.channel_lock = Lock()
         self.session: Optional[Session] = None
         self.sock: Optional[socket] = None
@@ -349,6 +413,7 @@ class Client:
             self.keepalive_seconds,
             self.timings,
             self.flood_preventing,
+            self.compress,
         )
 
     def __enter__(self):
@@ -360,6 +425,9 @@ class Client:
     def _init_ssh(self):
         self.session = Session()
         with self.session.lock:
+            if self.compress:
+                # Should be set before the handshake.
+                self.session.flag(LIBSSH2_FLAG_COMPRESS)
             if self.timings.ssh_session_timeout:
                 # libssh2 timeout is in ms
                 self.session.set_timeout(self.timings.ssh_session_timeout * 1000)
@@ -492,6 +560,23 @@ class Client:
     def _make_decoder(encoding, stream):
         return codecs.getincrementaldecoder(encoding)(errors="replace") if stream is not None else None
 
+    @staticmethod
+    def _submit_lines(
+        watchers: List[StreamWatcher], decoder: codecs.IncrementalDecoder, stream: StringIO, lines: List[bytes]
+    ):
+        if stream is None or not lines:
+            return
+        data = decoder.decode(LINESEP.join(lines) + LINESEP)
+        stream.write(data)
+        if watchers:
+            for text in data.split("\n")[:-1]:
+                line = text + "\n"
+                try:
+                    for watcher in watchers:
+                        watcher.submit_line(line)
+                except Exception:  # noqa: BLE001
+                    pass
+
     @staticmethod
     def _process_output(
         watchers: List[StreamWatcher],
@@ -505,8 +590,9 @@ class Client:
         """Separate different approach for the case when watchers are present, since watchers are slow,
           we can loose data due to the socket buffer limit, if endpoint sending it faster than watchers can read it.
         To avoid that we run `SSHReaderThread` thread that picks data up from the socket, splits it into lines
-        and puts it to stdout and stderr `Queues`.
-        Meanwhile this function reads data from these `Queues` and store them in StringIO and throw it to the watchers
+        and puts it to stdout and stderr buffers.
+        Meanwhile this function wakes up on new data, takes all lines collected by the reader at once,
+        store them in StringIO and throw them to the watchers line by line
         """
         reader.start()
         if timeout:
@@ -515,34 +601,15 @@ class Client:
             end_time = float_info.max
         stdout_decoder = Client._make_decoder(encoding, stdout_stream)
         stderr_decoder = Client._make_decoder(encoding, stderr_stream)
-        while reader.is_alive() or reader.stdout.qsize() or reader.stderr.qsize():
+        finished = False
+        while not finished:
             if perf_counter() > end_time:
                 reader.stop()
                 return False
-
-            data_processed = False
-            if stdout_stream is not None and reader.stdout.qsize():
-                try:
-                    stdout = reader.stdout.get(timeout=timeout_read_data_chunk)
-                    data = stdout_decoder.decode(stdout) + "\n"
-                    stdout_stream.write(data)
-                    for watcher in watchers:
-                        watcher.submit_line(data)
-                    data_processed = True
-                except Exception:  # noqa: BLE001
-                    pass
-            if stderr_stream is not None and reader.stderr.qsize():
-                try:
-                    stderr = reader.stderr.get(timeout=timeout_read_data_chunk)
-                    data = stderr_decoder.decode(stderr) + "\n"
-                    stderr_stream.write(data)
-                    for watcher in watchers:
-                        watcher.submit_line(data)
-                    data_processed = True
-                except Exception:  # noqa: BLE001
-                    pass
-            if not data_processed:  # prevent unbounded loop in case no data on the streams
-                sleep(timeout_read_data_chunk or 0.5)
+            finished = reader.finished
+            stdout, stderr = reader.drain(timeout=timeout_read_data_chunk or 0.5)
+            Client._submit_lines(watchers, stdout_decoder, stdout_stream, stdout)
+            Client._submit_lines(watchers, stderr_decoder, stderr_stream, stderr)
         for decoder, stream in ((stdout_decoder, stdout_stream), (stderr_decoder, stderr_stream)):
             if decoder is not None:
                 stream.write(decoder.decode(b"", final=True))
@@ -657,19 +724,27 @@ class Client:
         replace_env=False,
         in_stream=False,
         timeout=None,
+        output_tail_size: int = None,
     ) -> Result:
         """Run command, wait till it ends and return result in Result class.
-        If `watchers` are defined it runs `SSHReaderThread` that reads data from the socket and forwards it to Queue.
+        If `watchers` are defined it runs `SSHReaderThread` that reads data from the socket and forwards it to
+          the watchers.
         If `hide` is True it does not collect stdout and stderr.
         if `env` is set it loads variables from the dict to the session environment.
+        If `output_tail_size` is set, only last `output_tail_size` characters of stdout and stderr are kept in
+          the result.
         Returns: instance of `Result`
         """
         if timeout is None:
             timeout = self.timings.read_command_output_timeout
         exception = None
         timeout_reached = False
-        stdout = StringIO()
-        stderr = StringIO()
+        if output_tail_size is None:
+            stdout = StringIO()
+            stderr = StringIO()
+        else:
+            stdout = TailBuffer(output_tail_size)
+            stderr = TailBuffer(output_tail_size)
         # TODO: Implement replace_env
         if env is None:
             shell = "/bin/bash"
@@ -27,7 +27,7 @@ from invoke.runners import Result
 
 from sdcm.utils.decorators import retrying
 
-from .base import RetryableNetworkException, CommandRunner, RetryMixin
+from .base import RetryableNetworkException, CommandRunner, RetryMixin, parse_retain_output
 from .local_cmd_runner import LocalCmdRunner
 
 
@@ -51,6 +51,7 @@ class RemoteCmdRunnerBase(CommandRunner, RetryMixin):
     exception_retryable: Tuple[Type[Exception]] = None
     connection_thread_map = threading.local()
     default_run_retry = 3
+    supports_output_tail = False  # if connection.run() accepts `output_tail_size' argument
 
     def __init__(  # noqa: PLR0913
         self,
@@ -673,6 +674,7 @@ class RemoteCmdRunnerBase(CommandRunner, RetryMixin):
         verbose: bool = True,
         new_session: bool = False,
         watchers: Optional[List[StreamWatcher]] = None,
+        output_tail_size: Optional[int] = None,
     ):
         if verbose:
             self.log.debug('<%s>: Running command "%s"...', self.hostname, cmd)
@@ -686,6 +688,8 @@ class RemoteCmdRunnerBase(CommandRunner, RetryMixin):
             timeout=timeout,
             in_stream=False,
         )
+        if output_tail_size is not None and self.supports_output_tail:
+            command_kwargs["output_tail_size"] = output_tail_size
         if new_session:
             with self._create_connection() as connection:
                 result = connection.run(**command_kwargs)
@@ -696,6 +700,10 @@ class RemoteCmdRunnerBase(CommandRunner, RetryMixin):
                 connection.open()
                 self._bind_generation_to_connection(connection)
             result = connection.run(**command_kwargs)
+        if output_tail_size is not None and not self.supports_output_tail:
+            # The connection doesn't support it, so, at least don't keep the full output in the result.
+            result.stdout = result.stdout[-output_tail_size:] if output_tail_size else ""
+            result.stderr = result.stderr[-output_tail_size:] if output_tail_size else ""
         result.duration = time.perf_counter() - start_time
         result.exit_status = result.exited
         return result
@@ -735,6 +743,7 @@ class RemoteCmdRunnerBase(CommandRunner, RetryMixin):
         change_context: bool = False,
         suppress_errors: bool = False,
         timestamp_logs: bool = False,
+        retain_output: str | None = None,
     ) -> Result:
         """
         Run command at the remote endpoint and return result
@@ -751,9 +760,13 @@ class RemoteCmdRunnerBase(CommandRunner, RetryMixin):
           for example group has been added to the user.
         :param suppress_errors: If True, suppress errors logging for retryable exceptions
         :param timestamp_logs: If True, log entries will be timestamped
+        :param retain_output: How much of stdout and stderr to keep in the result: "all" (default) or
+          "tail:<size>" (e.g., "tail:1MB") for long-running commands with `log_file' to keep the memory bounded.
+          In the latter case `result.log_file' is the path to the full output
         :return:
         """
 
+        output_tail_size = parse_retain_output(retain_output)
         watchers = self._setup_watchers(
             verbose=verbose, log_file=log_file, additional_watchers=watchers, timestamp_logs=timestamp_logs
         )
@@ -762,7 +775,9 @@ class RemoteCmdRunnerBase(CommandRunner, RetryMixin):
         def _run():
             self._run_pre_run(cmd, timeout, ignore_status, verbose, new_session, log_file, retry, watchers)
             try:
-                return self._run_execute(cmd, timeout, ignore_status, verbose, new_session, watchers)
+                return self._run_execute(
+                    cmd, timeout, ignore_status, verbose, new_session, watchers, output_tail_size=output_tail_size
+                )
             except self.exception_retryable as exc:
                 if self._run_on_retryable_exception(exc, new_session, suppress_errors):
                     raise
@@ -772,6 +787,7 @@ class RemoteCmdRunnerBase(CommandRunner, RetryMixin):
             return None
 
         result = _run()
+        result.log_file = log_file
         self._print_command_results(result, verbose, ignore_status)
         if change_context and result.ok:
             # Will trigger reconnect on next run for any connection that belongs to the remoter
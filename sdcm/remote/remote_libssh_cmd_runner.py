@@ -41,6 +41,8 @@ class RemoteLibSSH2CmdRunner(RemoteCmdRunnerBase, ssh_transport="libssh2", defau
     """
 
     connection: LibSSH2Client
+    ssh_compression: bool = False
+    supports_output_tail = True
     exception_unexpected = UnexpectedExit
     exception_failure = Failure
     exception_retryable = (
@@ -63,6 +65,7 @@ class RemoteLibSSH2CmdRunner(RemoteCmdRunnerBase, ssh_transport="libssh2", defau
             port=self.port,
             pkey=os.path.expanduser(self.key_file) if self.key_file else None,
             timings=Timings(keepalive_timeout=0, connect_timeout=self.connect_timeout),
+            compress=self.ssh_compression,
         )
 
     def is_up(self, timeout: float = 30) -> bool:
@@ -8,10 +8,11 @@ import threading
 import time
 import traceback
 from pathlib import Path
+from itertools import islice, zip_longest
 from abc import abstractmethod
 from string import Template
 from typing import Optional, Type, NamedTuple, TYPE_CHECKING
-from contextlib import contextmanager
+from contextlib import closing, contextmanager
 
 from pytz import utc
 from cassandra import ConsistencyLevel
@@ -19,7 +20,6 @@ from cassandra.cluster import ResponseFuture, ResultSet
 from cassandra.query import SimpleStatement
 from cassandra.policies import ExponentialBackoffRetryPolicy
 
-from sdcm.remote import LocalCmdRunner
 from sdcm.sct_events import Severity
 from sdcm.sct_events.database import (
     FullScanEvent,
@@ -32,6 +32,7 @@ from sdcm.utils.operations_thread import OperationThreadStats, OneOperationStat,
 from sdcm.db_stats import PrometheusDBStats
 from sdcm.test_config import TestConfig
 from sdcm.utils.decorators import retrying, Retry
+from sdcm.utils.file import read_lines_backwards
 from sdcm.utils.issues import SkipPerIssues
 
 if TYPE_CHECKING:
@@ -39,7 +40,7 @@ if TYPE_CHECKING:
 
 ERROR_SUBSTRINGS = ("timed out", "unpack requires", "timeout", "host has been marked down or removed")
 BYPASS_CACHE_VALUES = [" BYPASS CACHE", ""]
-LOCAL_CMD_RUNNER = LocalCmdRunner()
+MAX_REPORTED_MISMATCHES = 100
 
 
 class FullScanCommand(NamedTuple):
@@ -254,6 +255,7 @@ class FullPartitionScanOperation(FullscanOperationBase):
         "lt_and_gt": " and {} < {} and {} > {}",
         "no_filter": "",
     }
+    max_reported_mismatches = MAX_REPORTED_MISMATCHES
 
     def __init__(self, generator, **kwargs):
         super().__init__(generator, scan_event=FullPartitionScanReversedOrderEvent, **kwargs)
@@ -407,54 +409,57 @@ class FullPartitionScanOperation(FullscanOperationBase):
         self.normal_query_output = tempfile.NamedTemporaryFile(mode="w+", delete=False, encoding="utf-8")
 
     def _compare_output_files(self) -> bool:
+        """
+        Compare rows of the normal query with rows of the reversed query read backwards.
+
+        Both outputs are streamed in lockstep, so, memory usage doesn't depend on the partition size.  All mismatches
+        are counted, but only first `max_reported_mismatches' of them are saved to a log file in `fullscans' dir.
+        """
         self.normal_query_output.flush()
         self.reversed_query_output.flush()
-        result = False
-
-        with tempfile.NamedTemporaryFile(mode="w+", delete=True, encoding="utf-8") as reorder_normal_query_output:
-            cmd = f"tac {self.normal_query_output.name}"
 
-            if self.limit:
-                cmd += f" | head -n {self.limit}"
-
-            cmd += f" > {reorder_normal_query_output.name}"
-            LOCAL_CMD_RUNNER.run(cmd=cmd, ignore_status=True)
-            reorder_normal_query_output.flush()
-            LOCAL_CMD_RUNNER.run(
-                cmd=f"cp {reorder_normal_query_output.name} {self.normal_query_output.name}", ignore_status=True
-            )
-            self.normal_query_output.flush()
-            file_names = f" {self.normal_query_output.name} {self.reversed_query_output.name}"
-            diff_cmd = f"diff -y --suppress-common-lines {file_names}"
-            self.log.debug("Comparing scan queries output files by: %s", diff_cmd)
-            log_file = (
-                Path(TestConfig().logdir())
-                / "fullscans"
-                / f"partition_range_scan_diff_{datetime.datetime.now(tz=utc).strftime('%Y_%m_%d-%I_%M_%S')}.log"
-            )
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            result = LOCAL_CMD_RUNNER.run(cmd=diff_cmd, ignore_status=True, verbose=False, log_file=str(log_file))
+        mismatches = []
+        mismatches_count = 0
+        with (
+            closing(read_lines_backwards(self.normal_query_output.name)) as normal_rows,
+            open(self.reversed_query_output.name, encoding="utf-8") as reversed_rows,
+        ):
+            for row_num, (normal_row, reversed_row) in enumerate(
+                zip_longest(
+                    islice(normal_rows, self.limit or None),  # like `tac | head -n <limit>'
+                    (row.rstrip("\n") for row in reversed_rows),
+                ),
+                start=1,
+            ):
+                if normal_row != reversed_row:
+                    mismatches_count += 1
+                    if len(mismatches) < self.max_reported_mismatches:
+                        mismatches.append((row_num, normal_row or "<missing>", reversed_row or "<missing>"))
+        self.reset_output_files()
 
-        if not result.stderr:
-            if not result.stdout:
-                self.log.debug("Compared output of normal and reversed queries is identical!")
-                result = True
-            else:
-                self.log.warning("Normal and reversed queries output differs: output results in %s", log_file)
-                ls_cmd = f"ls -alh {file_names}"
-                head_cmd = f"head {file_names}"
-                for cmd in [ls_cmd, head_cmd]:
-                    result = LOCAL_CMD_RUNNER.run(cmd=cmd, ignore_status=True)
-                    if result.stdout:
-                        stdout = result.stdout.strip()
-                        self.log.debug("%s command output is: \n%s", cmd, stdout)
-        else:
-            self.log.warning(
-                "Comparison of output of normal and reversed queries failed with stderr:\n%s", result.stderr
-            )
+        if not mismatches_count:
+            self.log.debug("Compared output of normal and reversed queries is identical!")
+            return True
 
-        self.reset_output_files()
-        return result
+        log_file = (
+            Path(TestConfig().logdir())
+            / "fullscans"
+            / f"partition_range_scan_diff_{datetime.datetime.now(tz=utc).strftime('%Y_%m_%d-%I_%M_%S')}.log"
+        )
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        with log_file.open("w", encoding="utf-8") as diff_log:
+            diff_log.write("row #: normal query row (reversed) | reversed query row\n")
+            for row_num, normal_row, reversed_row in mismatches:
+                diff_log.write(f"{row_num}: {normal_row} | {reversed_row}\n")
+            if mismatches_count > len(mismatches):
+                diff_log.write(f"... {mismatches_count - len(mismatches)} more mismatched rows\n")
+        self.log.warning(
+            "Normal and reversed queries output differs in %s rows: first %s of them in %s",
+            mismatches_count,
+            len(mismatches),
+            log_file,
+        )
+        return False
 
     def run_scan_operation(self, cmd: str = None):
         self.table_clustering_order = self.get_table_clustering_order()
@@ -838,6 +838,14 @@ class SCTConfiguration(BaseModel):
          this regex, its backtrace will not be decoded. This can be used to reduce overhead in performance tests
          by skipping backtrace decoding for certain types of events. Only applies when backtrace_decoding is True.""",
     )
+    backtrace_decoding_workers: int = SctField(
+        description="""Number of threads on the monitor node which decode backtraces concurrently.
+         Only applies when backtrace_decoding is True.""",
+    )
+    db_log_reader_pool: Boolean = SctField(
+        description="""If True, db logs of all nodes are read and parsed by a shared pool of worker processes (sized to
+         the number of the runner's CPU cores) instead of a separate process per db node.""",
+    )
     print_kernel_callstack: Boolean = SctField(
         description="""Scylla will print kernel callstack to logs if True, otherwise, it will try and may print a message
          that it failed to.""",
@@ -2318,6 +2326,9 @@ class SCTConfiguration(BaseModel):
     use_hdrhistogram: Boolean = SctField(
         description="Enable hdr histogram logging for cs",
     )
+    hdrhistogram_compressed_transfer: Boolean = SctField(
+        description="Use SSH compression to transfer hdr histogram logs from loaders (useful for high-latency loaders)",
+    )
     stop_on_hw_perf_failure: Boolean = SctField(
         description="""Stop sct performance test if hardware performance test failed
 
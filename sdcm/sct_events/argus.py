@@ -14,7 +14,7 @@
 import time
 import logging
 import threading
-from typing import NewType, Dict, Any, Tuple, Optional, Callable, cast
+from typing import NewType, Dict, Any, List, Tuple, Optional, Callable, cast
 from functools import partial
 from collections import defaultdict
 
@@ -24,16 +24,19 @@ from sdcm.sct_events.events_processes import (
     EVENTS_ARGUS_AGGREGATOR_ID,
     EVENTS_ARGUS_POSTMAN_ID,
     EventsProcessesRegistry,
-    BaseEventsProcess,
+    EventsSubscription,
     EventsProcessPipe,
+    events_topics,
     start_events_process,
     get_events_process,
     verbose_suppress,
 )
+from sdcm.sct_events.postman import Delivery, EventsPostman
 from sdcm.utils.argus import Argus
 
 
 ARGUS_EVENT_AGGREGATOR_TIME_WINDOW: float = 90  # seconds
+ARGUS_EVENTS_DEAD_LETTER_SPOOL: str = "argus_events_dead_letters.jsonl"
 LOGGER = logging.getLogger(__name__)
 
 
@@ -42,6 +45,9 @@ SCTArgusEventKey = NewType("SCTArgusEventKey", Tuple[str, ...])
 
 
 class ArgusEventCollector(EventsProcessPipe[Tuple[str, Any], SCTArgusEvent]):
+    def get_events_subscription(self) -> EventsSubscription:
+        return EventsSubscription(topics=events_topics(publish_to_argus=True))
+
     def run(self) -> None:
         # Resolved fresh per event rather than once at thread-start: this is a real
         # ordering issue in production, not just under test doubles. ClusterTester's
@@ -103,30 +109,28 @@ class ArgusEventAggregator(EventsProcessPipe[SCTArgusEvent, SCTArgusEvent]):
         return SCTArgusEventKey(tuple([event["run_id"], event["severity"], event["event_type"], event.pop("event_id")]))
 
 
-class ArgusEventPostman(BaseEventsProcess[SCTArgusEvent, None], threading.Thread):
+class ArgusEventPostman(EventsPostman[SCTArgusEvent]):
+    """Submit events to Argus, all events of a batch in a single request."""
+
     inbound_events_process = EVENTS_ARGUS_AGGREGATOR_ID
+    dead_letter_spool = ARGUS_EVENTS_DEAD_LETTER_SPOOL
 
     def __init__(self, _registry: EventsProcessesRegistry):
         self.enabled = threading.Event()
         self._argus_client = None
         super().__init__(_registry=_registry)
 
-    def run(self) -> None:
+    def wait_until_ready(self) -> None:
         self.enabled.wait()
 
-        for event in self.inbound_events():  # events from ArgusAggregator
-            self._submit_event(event)
-
-    def _submit_event(self, event: SCTArgusEvent) -> None:
-        """Post a single event to Argus, swallowing and logging any failure (see verbose_suppress)."""
+    def make_deliveries(self, batch: List[SCTArgusEvent]) -> List[Delivery]:
         if not self._argus_client:
-            return
-        with verbose_suppress(
-            "ArgusEventPostman failed to post an event to '%s' endpoint.\nEvent: %s",
-            self._argus_client.Routes.SUBMIT_EVENT,
-            event,
-        ):
-            self._argus_client.submit_event(event)
+            return []
+        # A single event is submitted as is to keep requests (and the replay log) the same when there is no backlog.
+        return [Delivery(self._argus_client.Routes.SUBMIT_EVENT, batch[0] if len(batch) == 1 else batch)]
+
+    def deliver(self, delivery: Delivery) -> None:
+        self._argus_client.submit_event(delivery.payload)
 
     def enable_argus_posting(self) -> None:
         self._argus_client = Argus.get().client
@@ -13,6 +13,7 @@
 
 from __future__ import annotations
 
+import re
 import json
 import time
 import uuid
@@ -46,6 +47,48 @@ class SctEventTypesRegistry(Dict[str, Type["SctEvent"]]):
         with open(severities_conf, encoding="utf-8") as fobj:
             self.max_severities = {event_t: Severity[sev] for event_t, sev in yaml.safe_load(fobj).items()}
         self.limit_rules = []
+        self._compiled_limit_rules = None
+        self._max_severity_cache = {}
+
+    def add_limit_rule(self, pattern: str, severity: Severity) -> None:
+        self.limit_rules.insert(0, (pattern, severity))  # keep it reversed
+        self.clear_max_severity_cache()
+
+    def clear_max_severity_cache(self) -> None:
+        # Replace objects instead of clearing them: a concurrent lookup can only add a stale result to the old cache.
+        self._compiled_limit_rules = None
+        self._max_severity_cache = {}
+
+    def compiled_limit_rules(self) -> Tuple[Optional[re.Pattern], Tuple[Severity, ...]]:
+        """Return all limit rules as a single regex with a group `r<N>' per rule and severities of the groups."""
+
+        if self._compiled_limit_rules is None:
+            rules = list(self.limit_rules)
+            # Use named groups, because fnmatch.translate() may add groups of its own (e.g., on Python 3.10.)
+            regex = (
+                re.compile(
+                    "|".join(f"(?P<r{num}>{fnmatch.translate(pattern)})" for num, (pattern, _) in enumerate(rules))
+                )
+                if rules
+                else None
+            )
+            self._compiled_limit_rules = (regex, tuple(severity for _, severity in rules))
+        return self._compiled_limit_rules
+
+    def max_severity(self, keys: Tuple[str, ...], name: str) -> Severity:
+        cache, cache_key = self._max_severity_cache, (name, keys)
+        try:
+            return cache[cache_key]
+        except KeyError:
+            pass
+        # Alternatives are tried in order, so, the matched group is the rule with the highest priority for a key.
+        regex, severities = self.compiled_limit_rules()
+        if regex is not None and (matched := [int(match.lastgroup[1:]) for key in keys if (match := regex.match(key))]):
+            severity = severities[min(matched)]
+        else:
+            severity = self.max_severities[name]
+        cache[cache_key] = severity
+        return severity
 
     def __setitem__(self, key: str, value: Type[SctEvent]):
         if not value.is_abstract() and key not in self.max_severities:
@@ -363,16 +406,13 @@ def add_severity_limit_rules(rules: List[str]) -> None:
         try:
             pattern, severity = rule.split("=", 1)
             severity = Severity[severity.strip()]
-            SctEvent._sct_event_types_registry.limit_rules.insert(0, (pattern.strip(), severity))  # keep it reversed
+            SctEvent._sct_event_types_registry.add_limit_rule(pattern=pattern.strip(), severity=severity)
         except Exception:
             LOGGER.exception("Unable to add a max severity limit rule `%s'", rule)
 
 
 def _max_severity(keys: Tuple[str, ...], name: str) -> Severity:
-    for pattern, severity in SctEvent._sct_event_types_registry.limit_rules:
-        if fnmatch.filter(keys, pattern):
-            return severity
-    return SctEvent._sct_event_types_registry.max_severities[name]
+    return SctEvent._sct_event_types_registry.max_severity(keys=keys, name=name)
 
 
 def max_severity(event: SctEvent) -> Severity:
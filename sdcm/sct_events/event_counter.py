@@ -27,7 +27,9 @@ from sdcm.sct_events.events_device import get_events_main_device
 from sdcm.sct_events.events_processes import (
     EVENTS_COUNTER_ID,
     EventsProcessesRegistry,
+    EventsSubscription,
     BaseEventsProcess,
+    events_topics,
     start_events_process,
     get_events_process,
     verbose_suppress,
@@ -103,6 +105,18 @@ class EventsCounter(BaseEventsProcess[Tuple[str, Any], None], threading.Thread):
         self.counters_register = dict()
         super().__init__(_registry=_registry)
 
+    def get_events_subscription(self) -> EventsSubscription:
+        # Don't unpickle any event until some counter registered.
+        return EventsSubscription(topics=events_topics(), prefixes=())
+
+    def _update_events_subscription(self) -> None:
+        event_classes = {
+            event_type
+            for event_stat_data in self.counters_register.values()
+            for event_type in event_stat_data.event_types
+        }
+        self.events_subscription.set_prefixes(events_topics(event_classes=event_classes))
+
     def run(self) -> None:
         LOGGER.debug("Counting events is running")
         for event_tuple in self.inbound_events():
@@ -123,6 +137,7 @@ class EventsCounter(BaseEventsProcess[Tuple[str, Any], None], threading.Thread):
 
     def add_counter(self, counter_id: str, event_stat_data: EventStatData):
         self.counters_register[counter_id] = event_stat_data
+        self._update_events_subscription()
 
     def get_counter(self, counter_id: str) -> EventStatData | None:
         if counter_id in self.counters_register:
@@ -132,6 +147,7 @@ class EventsCounter(BaseEventsProcess[Tuple[str, Any], None], threading.Thread):
     def remove_counter(self, counter_id: str):
         if counter_id in self.counters_register:
             del self.counters_register[counter_id]
+            self._update_events_subscription()
 
 
 start_events_counter = partial(start_events_process, EVENTS_COUNTER_ID, EventsCounter)
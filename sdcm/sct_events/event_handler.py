@@ -19,7 +19,9 @@ from typing import Tuple, Any
 from sdcm.cluster import TestConfig
 from sdcm.sct_events.events_processes import (
     EVENTS_HANDLER_ID,
+    EventsSubscription,
     BaseEventsProcess,
+    events_topics,
     start_events_process,
     verbose_suppress,
 )
@@ -41,6 +43,9 @@ class EventsHandler(BaseEventsProcess[Tuple[str, Any], None], threading.Thread):
         "CassandraStressLogEvent.SchemaDisagreement": SchemaDisagreementHandler(),
     }
 
+    def get_events_subscription(self) -> EventsSubscription:
+        return EventsSubscription(topics=events_topics(event_classes=self.handlers))
+
     def run(self) -> None:
         LOGGER.debug("Started events handler")
         for event_tuple in self.inbound_events():
@@ -22,7 +22,9 @@ from sdcm.sct_events import Severity
 from sdcm.sct_events.events_processes import (
     EVENTS_ANALYZER_ID,
     EventsProcessesRegistry,
+    EventsSubscription,
     BaseEventsProcess,
+    events_topics,
     start_events_process,
     get_events_process,
     verbose_suppress,
@@ -44,7 +46,22 @@ class TestFailure(Exception):
     pass
 
 
+class CriticalEventsSubscription(EventsSubscription):
+    """Unpickle critical events only and events which can become critical because of EventsSeverityChangerFilter."""
+
+    def __init__(self):
+        super().__init__(topics=events_topics(), prefixes=events_topics(severities=[Severity.CRITICAL]))
+
+    def filter_added(self, event_filter) -> None:
+        if getattr(event_filter, "new_severity", None) == Severity.CRITICAL:
+            event_class = getattr(event_filter, "event_class", None)
+            self.add_prefixes(events_topics(event_classes=[event_class] if event_class else None))
+
+
 class EventsAnalyzer(BaseEventsProcess[Tuple[str, Any], None], threading.Thread):
+    def get_events_subscription(self) -> EventsSubscription:
+        return CriticalEventsSubscription()
+
     def run(self) -> None:
         for event_tuple in self.inbound_events():
             with verbose_suppress("EventsAnalyzer failed to process %s", event_tuple):
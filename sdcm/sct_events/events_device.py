@@ -12,13 +12,18 @@
 # Copyright (c) 2020 ScyllaDB
 
 import time
+import os
 import queue
+import struct
 import ctypes
 import pickle
 import signal
 import logging
+import threading
 import multiprocessing
-from typing import Optional, Generator, Any, Tuple, Callable, cast, Dict
+import multiprocessing.util
+from typing import Optional, Generator, Any, Tuple, Callable, Iterable, cast, Dict
+from collections import OrderedDict
 from pathlib import Path
 from functools import cached_property, partial
 from uuid import UUID
@@ -34,6 +39,10 @@ import zmq
 
 from sdcm.sct_events.events_processes import (
     EVENTS_MAIN_DEVICE_ID,
+    EVENTS_TOPIC,
+    FILTERS_TOPIC,
+    SYSTEM_EVENTS_TOPIC,
+    EventsSubscription,
     StopEvent,
     EventsProcessesRegistry,
     start_events_process,
@@ -48,7 +57,11 @@ EVENTS_DEVICE_START_TIMEOUT: float = 30  # seconds
 SUB_POLLING_TIMEOUT: int = 1000  # milliseconds
 PUB_QUEUE_WAIT_TIMEOUT: float = 1  # seconds
 PUB_QUEUE_EVENTS_RATE: float = 0  # seconds
+DELIVERY_VERIFICATION_WINDOW: int = 1000  # events sent but not verified yet; 1 means verify events one by one
+EVENTS_SOCKET_HWM: int = 100_000  # messages queued per PUB/SUB socket before they're dropped
 PUBLISH_EVENT_TIMEOUT: float = 5  # seconds
+PUBLISH_BATCH_SIZE: int = 100  # events
+PUBLISH_BATCH_FLUSH_PERIOD: float = 0.5  # seconds
 FILTERS_GC_PERIOD: float = 60  # Cleanup old filters once in a while
 
 EVENTS_LOG_DIR: str = "events_log"
@@ -57,6 +70,76 @@ RAW_EVENTS_LOG: str = "raw_events.log"
 LOGGER = logging.getLogger(__name__)
 ACTION_LOGGER = get_action_logger("event")
 
+SEQ_NUMBER = struct.Struct("!Q")
+
+
+def event_topic(event) -> bytes:
+    """Return a topic of the event (see `sdcm.sct_events.events_processes.events_topics()'.)"""
+
+    if isinstance(event, BaseFilter):
+        return FILTERS_TOPIC
+    if isinstance(event, SystemEvent):
+        return SYSTEM_EVENTS_TOPIC
+    return b"%s%s|%d%d|%s." % (
+        EVENTS_TOPIC,
+        event.severity.name.encode(),
+        event.publish_to_grafana,
+        event.publish_to_argus,
+        type(event).__name__.encode(),
+    )
+
+
+class EventsBatcher:
+    """Buffer events published by a single process and hand them over to EventsDevice in batches.
+
+    Lines of raw_events.log are written with one append per batch and pickled events are put to the
+    publish queue as a list, so both happen once per batch instead of once per event.  A batch is
+    flushed when it reaches `batch_size' events, every `flush_period' seconds, and on process exit.
+    """
+
+    def __init__(self, device: "EventsDevice", batch_size: int, flush_period: float):
+        self._device = device
+        self.batch_size = batch_size
+        self.flush_period = flush_period
+        self._lock = threading.RLock()
+        self._raw_lines: list[bytes] = []
+        self._events: list[tuple[bytes, bytes]] = []
+        self._stop_event = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="EventsBatcherFlusher", daemon=True)
+        self._flusher.start()
+
+        # Should run before the finalizer of multiprocessing.Queue which closes the queue (exitpriority=10.)
+        multiprocessing.util.Finalize(self, self.close, exitpriority=20)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, event, timeout: float = PUBLISH_EVENT_TIMEOUT) -> None:
+        raw_line = event.to_json().encode("utf-8") + b"\n"
+        pickled_event = (event_topic(event), pickle.dumps(event))
+        with self._lock:
+            self._raw_lines.append(raw_line)
+            self._events.append(pickled_event)
+            if len(self._events) >= self.batch_size:
+                self.flush(timeout=timeout)
+
+    def flush(self, timeout: float = PUBLISH_EVENT_TIMEOUT) -> None:
+        with self._lock:
+            if not self._events:
+                return
+            raw_lines, self._raw_lines = self._raw_lines, []
+            events, self._events = self._events, []
+            self._device.publish_raw_events_batch(raw_lines=raw_lines, events=events, timeout=timeout)
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_event.wait(self.flush_period):
+            with verbose_suppress("%s: failed to flush events batch", self):
+                self.flush()
+
+    def close(self) -> None:
+        self._stop_event.set()
+        self.flush()
+
 
 class EventsDevice(multiprocessing.Process):
     start_delay = EVENTS_DEVICE_START_DELAY
@@ -64,15 +147,19 @@ class EventsDevice(multiprocessing.Process):
     sub_polling_timeout = SUB_POLLING_TIMEOUT
     pub_queue_wait_timeout = PUB_QUEUE_WAIT_TIMEOUT
     pub_queue_events_rate = PUB_QUEUE_EVENTS_RATE
+    delivery_verification_window = DELIVERY_VERIFICATION_WINDOW
+    socket_hwm = EVENTS_SOCKET_HWM
 
     def __init__(self, _registry: EventsProcessesRegistry):
         self._registry = _registry
         self._events_counter = multiprocessing.Value(ctypes.c_uint32, 0)
+        self._undelivered_events_counter = multiprocessing.Value(ctypes.c_uint32, 0)
 
         self._running = multiprocessing.Event()
         self._sub_port = multiprocessing.Value(ctypes.c_uint16, 0)
         self._queue = multiprocessing.Queue()
         self._raw_events_lock = multiprocessing.RLock()
+        self._events_batchers: Dict[int, EventsBatcher] = {}  # keyed by PID: each process has own buffer.
         self.events_log_base_dir.mkdir(parents=True, exist_ok=True)
 
         super().__init__(daemon=True)
@@ -81,6 +168,10 @@ class EventsDevice(multiprocessing.Process):
     def events_counter(self):
         return self._events_counter.value
 
+    @property
+    def undelivered_events_counter(self):
+        return self._undelivered_events_counter.value
+
     @cached_property
     def events_log_base_dir(self) -> Path:
         return self._registry.log_dir / EVENTS_LOG_DIR
@@ -90,6 +181,8 @@ class EventsDevice(multiprocessing.Process):
         return self.events_log_base_dir / RAW_EVENTS_LOG
 
     def stop(self, timeout: Optional[float] = None) -> None:
+        if (batcher := self._events_batchers.pop(os.getpid(), None)) is not None:
+            batcher.close()
         self._running.clear()
         self.join(timeout)
         if super().is_alive():
@@ -111,17 +204,27 @@ class EventsDevice(multiprocessing.Process):
         signal.signal(signal.SIGTERM, lambda *_: self._running.clear())
         with verbose_suppress("EventsDevice failed"):
             with zmq.Context() as ctx, ctx.socket(zmq.PUB) as pub, ctx.socket(zmq.SUB) as sub:
+                # We don't wait for a verification of each event anymore, so, use high-water marks much bigger than
+                # ZMQ's default to not drop events for slow subscribers.  Still keep them finite to not grow memory
+                # without a limit if a subscriber is stalled: dropped events are counted as undelivered, or reported
+                # as gaps in sequence numbers by subscribers.
+                pub.setsockopt(zmq.SNDHWM, self.socket_hwm)
                 self._sub_port.value = pub.bind_to_random_port("tcp://*")
                 self._running.set()
 
                 LOGGER.debug("EventsDevice listen on %s", self.subscribe_address)
 
                 # Delivery verification subscriber.
+                sub.setsockopt(zmq.RCVHWM, self.socket_hwm)
                 sub.connect(self.subscribe_address)
                 sub.subscribe(b"")
 
                 time.sleep(self.start_delay)
 
+                # Events are sent with sequence numbers and verified asynchronously: up to
+                # `delivery_verification_window' events can be in flight before we wait for the verification subscriber.
+                in_flight: OrderedDict[int, bytes] = OrderedDict()
+                seq_number = 0
                 drain_deadline = None
                 while True:
                     if not self._running.is_set():
@@ -129,55 +232,163 @@ class EventsDevice(multiprocessing.Process):
                             drain_deadline = time.monotonic() + 5.0
                         if time.monotonic() >= drain_deadline:
                             break
+                    if len(in_flight) >= self.delivery_verification_window:
+                        self._verify_delivery(sub=sub, in_flight=in_flight, timeout=self.sub_polling_timeout)
+                        continue
                     try:
-                        event = self._queue.get(timeout=self.pub_queue_wait_timeout)
-                        try:
-                            pub.send(event)
-                        except zmq.ZMQError:
-                            LOGGER.exception("EventsDevice failed to send %s", pickle.loads(event))
-                        else:
-                            try:
-                                if sub.poll(timeout=self.sub_polling_timeout) and sub.recv(zmq.NOBLOCK) == event:
-                                    continue  # everything is OK, we can go to send next event in the queue.
-                            except zmq.ZMQError:
-                                pass
-                            LOGGER.error("EventsDevice failed to verify delivery of %s", pickle.loads(event))
-                        time.sleep(self.pub_queue_events_rate)
+                        item = self._queue.get(block=not in_flight, timeout=self.pub_queue_wait_timeout)
                     except queue.Empty:
-                        if not self._running.is_set():
+                        if in_flight:
+                            self._verify_delivery(sub=sub, in_flight=in_flight, timeout=self.sub_polling_timeout)
+                        elif not self._running.is_set():
                             break
                         continue
+                    for topic, event in item if isinstance(item, list) else (item,):
+                        if self._send_event(pub=pub, topic=topic, seq_number=seq_number + 1, event=event):
+                            seq_number += 1
+                            in_flight[seq_number] = event
+                        else:
+                            time.sleep(self.pub_queue_events_rate)
+                        if len(in_flight) >= self.delivery_verification_window:
+                            self._verify_delivery(sub=sub, in_flight=in_flight, timeout=self.sub_polling_timeout)
+                    self._verify_delivery(sub=sub, in_flight=in_flight, timeout=0)
+
+                for seq_number, event in in_flight.items():
+                    self._report_undelivered_event(seq_number=seq_number, event=event)
+
+    @staticmethod
+    def _send_event(pub: zmq.Socket, topic: bytes, seq_number: int, event: bytes) -> bool:
+        try:
+            pub.send_multipart((topic, SEQ_NUMBER.pack(seq_number), event))
+        except zmq.ZMQError:
+            LOGGER.exception("EventsDevice failed to send %s", pickle.loads(event))
+            return False
+        return True
+
+    def _verify_delivery(self, sub: zmq.Socket, in_flight: OrderedDict[int, bytes], timeout: int) -> None:
+        """Receive sent events back and match them to in-flight events by sequence numbers.
+
+        All in-flight events with sequence numbers lower than received one are lost (a gap in the stream.)
+        If nothing received during `timeout' milliseconds (when it's not 0) the oldest in-flight event
+        considered as lost too.
+        """
+        if not sub.poll(timeout=timeout):
+            if timeout and in_flight:
+                self._report_undelivered_event(*in_flight.popitem(last=False))
+            return
+        while True:
+            try:
+                _, seq_frame, event = sub.recv_multipart(zmq.NOBLOCK)
+            except zmq.Again:
+                return
+            except zmq.ZMQError:
+                LOGGER.exception("EventsDevice failed to receive an event for delivery verification")
+                return
+            seq_number = SEQ_NUMBER.unpack(seq_frame)[0]
+            while in_flight and next(iter(in_flight)) < seq_number:
+                self._report_undelivered_event(*in_flight.popitem(last=False))
+            if (sent_event := in_flight.pop(seq_number, None)) is not None and sent_event != event:
+                self._report_undelivered_event(seq_number=seq_number, event=sent_event)
+
+    def _report_undelivered_event(self, seq_number: int, event: bytes) -> None:
+        self._undelivered_events_counter.value += 1
+        LOGGER.error("EventsDevice failed to verify delivery of %s (seq_number=%s)", pickle.loads(event), seq_number)
+
+    def enable_batched_publishing(
+        self, batch_size: int = PUBLISH_BATCH_SIZE, flush_period: float = PUBLISH_BATCH_FLUSH_PERIOD
+    ) -> EventsBatcher:
+        """Switch publish_event() to buffered, batched mode for the current process only."""
+
+        pid = os.getpid()
+        if (batcher := self._events_batchers.get(pid)) is None:
+            batcher = self._events_batchers[pid] = EventsBatcher(
+                device=self, batch_size=batch_size, flush_period=flush_period
+            )
+        return batcher
+
+    def flush_published_events(self) -> None:
+        if (batcher := self._events_batchers.get(os.getpid())) is not None:
+            batcher.flush()
 
     def publish_event(self, event, timeout=PUBLISH_EVENT_TIMEOUT) -> None:
+        if (batcher := self._events_batchers.get(os.getpid())) is not None:
+            with verbose_suppress("%s: failed to publish %s", self, event):
+                batcher.add(event, timeout=timeout)
+            return
+
         with verbose_suppress("%s: failed to write %s to %s", self, event, self.raw_events_log):
             with self._raw_events_lock, open(self.raw_events_log, "ab+", buffering=0) as log_file:
                 log_file.write(event.to_json().encode("utf-8") + b"\n")
 
         with verbose_suppress("%s: failed to publish %s", self, event):
-            self._queue.put(pickle.dumps(event), timeout=timeout)
+            self._queue.put((event_topic(event), pickle.dumps(event)), timeout=timeout)
             self._events_counter.value += 1
 
-    def _sub_socket(self, ctx: zmq.Context) -> zmq.Socket:
+    def publish_raw_events_batch(
+        self, raw_lines: list[bytes], events: list[tuple[bytes, bytes]], timeout=PUBLISH_EVENT_TIMEOUT
+    ) -> None:
+        with verbose_suppress("%s: failed to write %d events to %s", self, len(raw_lines), self.raw_events_log):
+            with self._raw_events_lock, open(self.raw_events_log, "ab+") as log_file:
+                log_file.write(b"".join(raw_lines))
+
+        with verbose_suppress("%s: failed to publish batch of %d events", self, len(events)):
+            self._queue.put(events, timeout=timeout)
+            self._events_counter.value += len(events)
+
+    def _sub_socket(self, ctx: zmq.Context, topics: Iterable[bytes]) -> zmq.Socket:
         LOGGER.debug("Subscribe to %s", self.subscribe_address)
         sub = ctx.socket(zmq.SUB)
+        sub.setsockopt(zmq.RCVHWM, self.socket_hwm)
         sub.connect(self.subscribe_address)
-        sub.subscribe(b"")
+        for topic in topics:
+            sub.subscribe(topic)
         return sub
 
-    def inbound_events(self, stop_event: StopEvent) -> Generator[Any, None, None]:
-        with zmq.Context() as ctx, self._sub_socket(ctx) as sub:
+    def inbound_events(
+        self,
+        stop_event: StopEvent,
+        subscription: Optional[EventsSubscription] = None,
+        events_counter: Optional[multiprocessing.Value] = None,
+    ) -> Generator[Any, None, None]:
+        if subscription is None:
+            subscription = EventsSubscription()
+        # Sequence numbers have gaps if the socket subscribed to some topics only.
+        check_gaps = subscription.all_topics
+        last_seq_number = None
+        with zmq.Context() as ctx, self._sub_socket(ctx, topics=subscription.topics) as sub:
             while not stop_event.is_set():
                 if sub.poll(timeout=self.sub_polling_timeout):
-                    yield sub.recv_pyobj(flags=zmq.NOBLOCK)
+                    topic, seq_frame, event = sub.recv_multipart(flags=zmq.NOBLOCK)
+                    seq_number = SEQ_NUMBER.unpack(seq_frame)[0]
+                    if check_gaps and last_seq_number is not None and seq_number > last_seq_number + 1:
+                        LOGGER.error(
+                            "%s: missed %d events (seq_number %d..%d)",
+                            self,
+                            seq_number - last_seq_number - 1,
+                            last_seq_number + 1,
+                            seq_number - 1,
+                        )
+                    last_seq_number = seq_number
+                    if events_counter is not None:
+                        events_counter.value += 1  # count all received events, even skipped ones
+                    if subscription.match(topic):
+                        yield pickle.loads(event)
 
     def outbound_events(
-        self, stop_event: StopEvent, events_counter: multiprocessing.Value
+        self,
+        stop_event: StopEvent,
+        events_counter: multiprocessing.Value,
+        subscription: Optional[EventsSubscription] = None,
     ) -> Generator[Tuple[str, Any], None, None]:
         filters: Dict[UUID, BaseFilter] = {}
         filters_gc_next_hit = time.perf_counter() + FILTERS_GC_PERIOD
+        with_filtered = subscription is not None and subscription.with_filtered
 
         with suppress_interrupt():
-            for events_counter.value, obj in enumerate(self.inbound_events(stop_event=stop_event), start=1):
+            events_counter.value = 0
+            for obj in self.inbound_events(
+                stop_event=stop_event, subscription=subscription, events_counter=events_counter
+            ):
                 if filters_gc_next_hit < time.perf_counter():
                     # Run filter GC once in FILTERS_GC_PERIOD seconds
                     for filter_key, filter_obj in list(filters.items()):
@@ -197,13 +408,21 @@ class EventsDevice(multiprocessing.Process):
                     else:
                         LOGGER.debug("%s: add filter %s with uuid=%s", self, obj, obj.uuid)
                         filters[obj.uuid] = obj
+                        if subscription is not None:
+                            subscription.filter_added(obj)
 
                 if isinstance(obj, SystemEvent):
                     continue
 
+                if with_filtered:
+                    obj._original_severity = obj.severity  # filters can change the severity
+
                 obj_filtered = any(f.eval_filter(obj) for f in filters.values())
 
                 if obj_filtered:
+                    if with_filtered:
+                        obj._filtered = True
+                        yield obj.base, obj
                     continue
 
                 if (obj_max_severity := max_severity(obj)).value < obj.severity.value:
@@ -239,6 +458,8 @@ get_events_main_device = cast(Callable[..., EventsDevice], partial(get_events_pr
 
 
 __all__ = (
+    "event_topic",
+    "EventsBatcher",
     "EventsDevice",
     "start_events_main_device",
     "get_events_main_device",
@@ -19,15 +19,19 @@ import ctypes
 import logging
 import threading
 import multiprocessing
-from typing import Union, Generator, Protocol, TypeVar, Generic, Type, Optional, cast
+from typing import Union, Generator, Protocol, TypeVar, Generic, Type, Optional, Iterable, cast
 from pathlib import Path
+from itertools import product
 from contextlib import contextmanager
 
 from weakref import proxy as weakproxy
 
+from sdcm.sct_events import Severity
+
 
 EVENTS_MAIN_DEVICE_ID = "MainDevice"
 EVENTS_FILE_LOGGER_ID = "EVENTS_FILE_LOGGER"
+EVENTS_STORE_ID = "EVENTS_STORE"
 EVENTS_GRAFANA_ANNOTATOR_ID = "EVENTS_GRAFANA_ANNOTATOR"
 EVENTS_GRAFANA_AGGREGATOR_ID = "EVENTS_GRAFANA_AGGREGATOR"
 EVENTS_GRAFANA_POSTMAN_ID = "EVENTS_GRAFANA_POSTMAN"
@@ -41,6 +45,17 @@ EVENTS_COUNTER_ID = "EVENTS_COUNTER_ID"
 EVENTS_PROCESS_PIPE_OUTBOUND_QUEUE_WAIT_TIMEOUT: float = 1
 EVENTS_PROCESS_PIPE_OUTBOUND_QUEUE_EVENTS_RATE: float = 0
 
+# Each event published by EventsDevice has a topic frame, which is one of:
+#   - `F|' for filters (all consumers need them to filter events)
+#   - `S|' for other system events
+#   - `E|<severity>|<publish_to_grafana><publish_to_argus>|<event class name>.', e.g.,
+#     `E|CRITICAL|10|DatabaseLogEvent.BACKTRACE.'
+# ZMQ subscriptions are prefix-based, so, `E|CRITICAL|' matches all critical events.
+FILTERS_TOPIC = b"F|"
+SYSTEM_EVENTS_TOPIC = b"S|"
+EVENTS_TOPIC = b"E|"
+ALL_TOPICS = b""
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -54,9 +69,80 @@ InboundEventsGenerator = Generator[T_inbound_event, None, None]
 OutboundEventsGenerator = Generator[T_outbound_event, None, None]
 
 
+def events_topics(
+    severities: Optional[Iterable[Severity]] = None,
+    publish_to_grafana: Optional[bool] = None,
+    publish_to_argus: Optional[bool] = None,
+    event_classes: Optional[Iterable[Union[str, type]]] = None,
+) -> frozenset[bytes]:
+    """Build topic prefixes which match events with given attributes (None means any value.)
+
+    Filters' topic is always included because all consumers need filters.
+    """
+
+    if severities is None and publish_to_grafana is None and publish_to_argus is None and event_classes is None:
+        return frozenset((FILTERS_TOPIC, EVENTS_TOPIC))
+    severities = [severity.name for severity in (Severity if severities is None else severities)]
+    flags = [
+        f"{grafana:d}{argus:d}"
+        for grafana, argus in product((True, False), repeat=2)
+        if publish_to_grafana in (None, grafana) and publish_to_argus in (None, argus)
+    ]
+    if event_classes is None:
+        event_classes = [""]
+    else:
+        event_classes = [(cls if isinstance(cls, str) else cls.__name__).rstrip(".") + "." for cls in event_classes]
+    return frozenset(
+        (FILTERS_TOPIC,)
+        + tuple(
+            f"{EVENTS_TOPIC.decode()}{severity}|{flag}|{event_class}".encode()
+            for severity, flag, event_class in product(severities, flags, event_classes)
+        )
+    )
+
+
+class EventsSubscription:
+    """Topics of events an events consumer is interested in.
+
+    `topics' used to subscribe a ZMQ socket, so, events which don't match them are not sent to the consumer at all.
+    `prefixes' can be changed on the fly (also from other threads) and used to skip received events before unpickling.
+    If `with_filtered' is set, events dropped by filters are sent to the consumer too, with `_filtered' attribute set
+    (and `_original_severity', which is the severity the event was published with.)
+    """
+
+    def __init__(
+        self,
+        topics: Iterable[bytes] = (ALL_TOPICS,),
+        prefixes: Optional[Iterable[bytes]] = None,
+        with_filtered: bool = False,
+    ):
+        self.topics = frozenset(topics)
+        self.prefixes = tuple(self.topics if prefixes is None else {FILTERS_TOPIC, *prefixes})
+        self.with_filtered = with_filtered
+
+    @property
+    def all_topics(self) -> bool:
+        return ALL_TOPICS in self.topics
+
+    def match(self, topic: bytes) -> bool:
+        return topic.startswith(self.prefixes)
+
+    def set_prefixes(self, prefixes: Iterable[bytes]) -> None:
+        self.prefixes = tuple({FILTERS_TOPIC, *prefixes})  # replace the whole tuple to make it thread-safe
+
+    def add_prefixes(self, prefixes: Iterable[bytes]) -> None:
+        self.set_prefixes(self.prefixes + tuple(prefixes))
+
+    def filter_added(self, event_filter) -> None:
+        """Called for each new filter received by the consumer."""
+
+
 class OutboundEventsProtocol(Protocol[T_outbound_events_protocol]):
     def outbound_events(
-        self, stop_event: StopEvent, events_counter: multiprocessing.Value
+        self,
+        stop_event: StopEvent,
+        events_counter: multiprocessing.Value,
+        subscription: Optional[EventsSubscription] = None,
     ) -> Generator[T_outbound_events_protocol, None, None]: ...
 
 
@@ -67,6 +153,7 @@ class BaseEventsProcess(Generic[T_inbound_event, T_outbound_event], abc.ABC):
     def __init__(self, _registry: EventsProcessesRegistry):
         self._registry = _registry
         self._events_counter = multiprocessing.Value(ctypes.c_uint32, 0)
+        self.events_subscription = self.get_events_subscription()
 
         if isinstance(self, threading.Thread):
             self.stop_event = threading.Event()
@@ -81,13 +168,25 @@ class BaseEventsProcess(Generic[T_inbound_event, T_outbound_event], abc.ABC):
     def events_counter(self) -> int:
         return self._events_counter.value
 
+    def get_events_subscription(self) -> EventsSubscription:
+        """Override to receive only some events from EventsDevice."""
+
+        return EventsSubscription()
+
     def inbound_events(self) -> InboundEventsGenerator:
         yield from cast(
             OutboundEventsProtocol[T_inbound_event],
             get_events_process(name=self.inbound_events_process, _registry=self._registry),
-        ).outbound_events(stop_event=self.stop_event, events_counter=self._events_counter)
+        ).outbound_events(
+            stop_event=self.stop_event, events_counter=self._events_counter, subscription=self.events_subscription
+        )
 
-    def outbound_events(self, stop_event: StopEvent, events_counter: multiprocessing.Value) -> OutboundEventsGenerator:
+    def outbound_events(
+        self,
+        stop_event: StopEvent,
+        events_counter: multiprocessing.Value,
+        subscription: Optional[EventsSubscription] = None,
+    ) -> OutboundEventsGenerator:
         yield from []
 
     def terminate(self) -> None:
@@ -118,7 +217,12 @@ class EventsProcessPipe(BaseEventsProcess[T_inbound_event, T_outbound_event], th
 
         super().__init__(_registry=_registry)
 
-    def outbound_events(self, stop_event: StopEvent, events_counter: multiprocessing.Value) -> OutboundEventsGenerator:
+    def outbound_events(
+        self,
+        stop_event: StopEvent,
+        events_counter: multiprocessing.Value,
+        subscription: Optional[EventsSubscription] = None,
+    ) -> OutboundEventsGenerator:
         while not stop_event.is_set():
             try:
                 yield self.outbound_queue.get(timeout=self.outbound_queue_wait_timeout)
@@ -220,11 +324,18 @@ def suppress_interrupt():
 __all__ = (
     "EVENTS_MAIN_DEVICE_ID",
     "EVENTS_FILE_LOGGER_ID",
+    "EVENTS_STORE_ID",
     "EVENTS_GRAFANA_ANNOTATOR_ID",
     "EVENTS_GRAFANA_AGGREGATOR_ID",
     "EVENTS_GRAFANA_POSTMAN_ID",
     "EVENTS_ANALYZER_ID",
     "EVENTS_HANDLER_ID",
+    "FILTERS_TOPIC",
+    "SYSTEM_EVENTS_TOPIC",
+    "EVENTS_TOPIC",
+    "ALL_TOPICS",
+    "events_topics",
+    "EventsSubscription",
     "StopEvent",
     "BaseEventsProcess",
     "EventsProcessPipe",
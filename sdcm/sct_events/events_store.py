@@ -0,0 +1,372 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""Indexed store of events in an SQLite database (events_log/events.db).
+
+The database is written by `EventsStoreWriter' events consumer which receives the same events as events.log
+(i.e., after filters and severity changes applied) and also events dropped by filters.  Each row keeps the severity
+the event was published with (as in raw_events.log) and whether the event was filtered, and queries return only
+not filtered events by default.  It's opened in WAL mode, so, readers don't block the writer and see all committed
+events.  `import_raw_events_log()' builds the same index offline from raw_events.log.
+"""
+
+import json
+import sqlite3
+import logging
+import threading
+import multiprocessing
+from pathlib import Path
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union, cast
+
+from sdcm.sct_events import Severity
+from sdcm.sct_events.base import SctEvent
+from sdcm.sct_events.events_device import get_events_main_device
+from sdcm.sct_events.events_processes import (
+    EVENTS_STORE_ID,
+    EventsProcessesRegistry,
+    EventsSubscription,
+    BaseEventsProcess,
+    start_events_process,
+    get_events_process,
+    verbose_suppress,
+)
+
+
+EVENTS_DB: str = "events.db"
+
+EVENTS_STORE_COMMIT_INTERVAL: float = 0.5  # seconds
+EVENTS_STORE_IMPORT_BATCH_SIZE: int = 10_000  # events
+
+LOGGER = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT,
+    base TEXT NOT NULL,
+    type TEXT,
+    subtype TEXT,
+    severity TEXT NOT NULL,
+    original_severity TEXT NOT NULL,
+    filtered INTEGER,
+    node TEXT,
+    timestamp REAL,
+    save_to_files INTEGER NOT NULL DEFAULT 1,
+    formatted TEXT,
+    json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_event_class ON events (base, type, subtype);
+CREATE INDEX IF NOT EXISTS events_severity ON events (severity);
+CREATE INDEX IF NOT EXISTS events_original_severity ON events (original_severity);
+CREATE INDEX IF NOT EXISTS events_node ON events (node);
+CREATE INDEX IF NOT EXISTS events_timestamp ON events (timestamp);
+CREATE INDEX IF NOT EXISTS events_event_id ON events (event_id);
+"""
+
+INSERT_EVENT = """
+INSERT INTO events (
+    event_id, base, type, subtype, severity, original_severity, filtered, node, timestamp, save_to_files, formatted, json
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SeverityArg = Union[Severity, str, Iterable[Union[Severity, str]], None]
+
+
+class StoredEvent(NamedTuple):
+    id: int
+    event_id: Optional[str]
+    base: str
+    type: Optional[str]
+    subtype: Optional[str]
+    severity: str
+    original_severity: str
+    filtered: Optional[bool]  # None if unknown, e.g., for events imported from raw_events.log
+    node: Optional[str]
+    timestamp: Optional[float]
+    save_to_files: bool
+    formatted: Optional[str]
+    json: str
+
+    def as_dict(self) -> dict:
+        return json.loads(self.json)
+
+    def as_raw_dict(self) -> dict:
+        """Return the event as it was published, i.e., as it's saved in raw_events.log."""
+
+        return {**self.as_dict(), "severity": self.original_severity}
+
+
+def _optional_str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def event_row(event: SctEvent) -> tuple:
+    return (
+        _optional_str(event.event_id),
+        event.base,
+        _optional_str(getattr(event, "type", None)),
+        _optional_str(getattr(event, "subtype", None)),
+        Severity(event.severity).name,
+        Severity(getattr(event, "_original_severity", event.severity)).name,
+        int(getattr(event, "_filtered", False)),
+        _optional_str(getattr(event, "node", None)),
+        event.event_timestamp,
+        int(bool(getattr(event, "save_to_files", True))),
+        event.format_event(),
+        event.to_json(),
+    )
+
+
+def raw_event_row(raw_event: str) -> tuple:
+    """Make a row from a line of raw_events.log.  These lines don't have a formatted form of the event."""
+
+    event = json.loads(raw_event)
+    return (
+        _optional_str(event.get("event_id")),
+        event["base"],
+        _optional_str(event.get("type")),
+        _optional_str(event.get("subtype")),
+        event["severity"],
+        event["severity"],
+        None,
+        _optional_str(event.get("node")),
+        event.get("event_timestamp"),
+        int(bool(event.get("save_to_files", True))),
+        None,
+        raw_event.rstrip("\n"),
+    )
+
+
+class EventsStore:
+    """Events stored in an SQLite database and indexed by type, subtype, severity, node, timestamp and event_id.
+
+    Not thread-safe: a connection can be used by other threads only if calls are serialized by the caller.
+    """
+
+    def __init__(self, path: Union[str, Path], readonly: bool = False):
+        self.path = Path(path)
+        self.readonly = readonly
+        if readonly:
+            self._connection = sqlite3.connect(f"{self.path.absolute().as_uri()}?mode=ro", uri=True)
+        else:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+
+    def add_rows(self, rows: Iterable[tuple]) -> None:
+        self._connection.executemany(INSERT_EVENT, rows)
+
+    def add_events(self, events: Iterable[SctEvent]) -> None:
+        self.add_rows(map(event_row, events))
+
+    def commit(self) -> None:
+        self._connection.commit()
+
+    def close(self) -> None:
+        if not self.readonly:
+            self._connection.commit()
+        self._connection.close()
+
+    def __enter__(self) -> "EventsStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @staticmethod
+    def _where(  # noqa: PLR0913
+        base: Optional[str] = None,
+        type: Optional[str] = None,  # noqa: A002
+        subtype: Optional[str] = None,
+        severity: SeverityArg = None,
+        original_severity: SeverityArg = None,
+        node: Optional[str] = None,
+        event_id: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        save_to_files: Optional[bool] = None,
+        filtered: Optional[bool] = False,
+    ) -> Tuple[str, list]:
+        conditions, params = [], []
+        for column, value in (
+            ("base", base),
+            ("type", type),
+            ("subtype", subtype),
+            ("node", node),
+            ("event_id", event_id),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        for column, value in (("severity", severity), ("original_severity", original_severity)):
+            if value is not None:
+                values = (value,) if isinstance(value, (Severity, str)) else value
+                severities = [Severity[s].name if isinstance(s, str) else Severity(s).name for s in values]
+                conditions.append(f"{column} IN ({', '.join('?' * len(severities))})")
+                params.extend(severities)
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("timestamp < ?")
+            params.append(until)
+        if save_to_files is not None:
+            conditions.append("save_to_files = ?")
+            params.append(int(save_to_files))
+        if filtered is not None:
+            conditions.append("filtered = 1" if filtered else "filtered IS NOT 1")
+        return (f" WHERE {' AND '.join(conditions)}" if conditions else ""), params
+
+    def query(self, limit: Optional[int] = None, newest_first: bool = False, **filters) -> Iterator[StoredEvent]:
+        """Return events which match all filters, in order of arrival.
+
+        Accepted filters: base, type, subtype, severity and original_severity (one or many), node, event_id,
+        since and until (event timestamps), save_to_files, filtered (False by default; None to get all events.)
+        If `newest_first' is set, return last `limit' events in reversed order.
+        """
+
+        where, params = self._where(**filters)
+        sql = f"SELECT * FROM events{where} ORDER BY id {'DESC' if newest_first else 'ASC'}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        cursor = self._connection.cursor()
+        cursor.row_factory = lambda _, row: StoredEvent(*row)
+        yield from cursor.execute(sql, params)
+
+    def count(self, **filters) -> int:
+        where, params = self._where(**filters)
+        return self._connection.execute(f"SELECT COUNT(*) FROM events{where}", params).fetchone()[0]
+
+    def count_by_severity(self, **filters) -> dict:
+        where, params = self._where(**filters)
+        return dict(self._connection.execute(f"SELECT severity, COUNT(*) FROM events{where} GROUP BY severity", params))
+
+
+class EventsStoreWriter(BaseEventsProcess[Tuple[str, Any], None], multiprocessing.Process):
+    """Write all events received from the events device to the events store.
+
+    Events are inserted in batches: a batch is committed every `commit_interval' seconds, immediately for
+    ERROR and CRITICAL events (also if filtered), and on stop.
+    """
+
+    commit_interval = EVENTS_STORE_COMMIT_INTERVAL
+
+    def __init__(self, _registry: EventsProcessesRegistry):
+        self.events_db = get_events_main_device(_registry=_registry).events_log_base_dir / EVENTS_DB
+        super().__init__(_registry=_registry)
+
+    def get_events_subscription(self) -> EventsSubscription:
+        return EventsSubscription(with_filtered=True)
+
+    def run(self) -> None:
+        LOGGER.debug("Writing to %s", self.events_db)
+
+        store = EventsStore(self.events_db)
+        rows: List[tuple] = []
+        rows_lock = threading.Lock()
+
+        def commit() -> None:
+            with rows_lock, verbose_suppress("%s: failed to write %d events", self, len(rows)):
+                if rows:
+                    store.add_rows(rows)
+                    store.commit()
+                    rows.clear()
+
+        def commit_periodically() -> None:
+            while not committer_stop_event.wait(self.commit_interval):
+                commit()
+
+        committer_stop_event = threading.Event()
+        committer = threading.Thread(target=commit_periodically, name="EventsStoreCommitter", daemon=True)
+        committer.start()
+        try:
+            for event_tuple in self.inbound_events():
+                with verbose_suppress("EventsStoreWriter failed to process %s", event_tuple):
+                    _, event = event_tuple  # try to unpack event from EventsDevice
+                    row = event_row(event)
+                    with rows_lock:
+                        rows.append(row)
+                    if max(event.severity.value, event._original_severity.value) > Severity.WARNING.value:
+                        commit()
+        finally:
+            committer_stop_event.set()
+            committer.join()
+            commit()
+            store.close()
+
+
+start_events_store = partial(start_events_process, EVENTS_STORE_ID, EventsStoreWriter)
+get_events_store_writer = cast(Callable[..., EventsStoreWriter], partial(get_events_process, EVENTS_STORE_ID))
+
+
+def events_db_path(events_log_base_dir: Union[str, Path]) -> Path:
+    return Path(events_log_base_dir) / EVENTS_DB
+
+
+def open_events_store(events_log_base_dir: Union[str, Path]) -> Optional[EventsStore]:
+    """Open the events store of a test run for reading, or return None if the store doesn't exist."""
+
+    if not (events_db := events_db_path(events_log_base_dir)).is_file():
+        return None
+    return EventsStore(events_db, readonly=True)
+
+
+def import_raw_events_log(
+    raw_events_log: Union[str, Path],
+    events_db: Optional[Union[str, Path]] = None,
+    batch_size: int = EVENTS_STORE_IMPORT_BATCH_SIZE,
+) -> Path:
+    """Build the events store from raw_events.log (by default, next to it.)
+
+    raw_events.log is written before events filtered, so, the store contains all events with their original
+    severities.  Lines which can't be parsed (e.g., the last one if it's partially written) are skipped.
+    """
+
+    raw_events_log = Path(raw_events_log)
+    events_db = raw_events_log.with_name(EVENTS_DB) if events_db is None else Path(events_db)
+    events_db.unlink(missing_ok=True)
+
+    imported = skipped = 0
+    with EventsStore(events_db) as store, raw_events_log.open(encoding="utf-8") as raw_events:
+        batch = []
+        for line in raw_events:
+            try:
+                batch.append(raw_event_row(line))
+            except (ValueError, KeyError):
+                skipped += 1
+                continue
+            if len(batch) >= batch_size:
+                store.add_rows(batch)
+                imported += len(batch)
+                batch.clear()
+        store.add_rows(batch)
+        imported += len(batch)
+    LOGGER.info("Imported %d events from %s to %s (%d lines skipped)", imported, raw_events_log, events_db, skipped)
+    return events_db
+
+
+__all__ = (
+    "EVENTS_DB",
+    "EventsStore",
+    "EventsStoreWriter",
+    "StoredEvent",
+    "start_events_store",
+    "get_events_store_writer",
+    "events_db_path",
+    "open_events_store",
+    "import_raw_events_log",
+)
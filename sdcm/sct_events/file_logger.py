@@ -11,12 +11,14 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
+import os
 import re
 import json
 import logging
+import threading
 import collections
 import multiprocessing
-from typing import Tuple, Optional, Callable, Any, Dict, List, cast
+from typing import Tuple, Optional, Callable, Any, Dict, List, BinaryIO, cast
 from pathlib import Path
 from functools import partial
 from itertools import chain
@@ -26,6 +28,7 @@ from sdcm.sct_events import Severity
 from sdcm.sct_events.base import SctEvent
 from sdcm.sct_events.system import TestResultEvent
 from sdcm.sct_events.events_device import get_events_main_device
+from sdcm.sct_events.events_store import EventsStore, open_events_store
 from sdcm.sct_events.events_processes import (
     EVENTS_FILE_LOGGER_ID,
     EventsProcessesRegistry,
@@ -46,6 +49,9 @@ DEBUG_LOG: str = "debug.log"
 
 LINE_START_RE = re.compile(r"^\d{4}-\d{2}-\d{2} ")  # date in YYYY-MM-DD format
 
+EVENTS_FILE_LOGGER_FLUSH_INTERVAL: float = 0.2  # seconds
+EVENTS_FILE_LOGGER_BUFFER_SIZE: int = 64 * 1024  # bytes
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -62,6 +68,17 @@ class head(list):
 
 
 class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing.Process):
+    """Write events to events.log and per-severity logs, and keep statistics in summary.log.
+
+    Inside the process log files are kept open and buffered.  They're flushed and summary.log is updated
+    every `flush_interval' seconds, immediately for ERROR and CRITICAL events, and on stop.  If `write_event()'
+    is called outside of the running process (e.g., when the events device is dead), every event is written
+    to the files immediately.
+    """
+
+    flush_interval = EVENTS_FILE_LOGGER_FLUSH_INTERVAL
+    buffer_size = EVENTS_FILE_LOGGER_BUFFER_SIZE
+
     def __init__(self, _registry: EventsProcessesRegistry):
         base_dir: Path = get_events_main_device(_registry=_registry).events_log_base_dir
 
@@ -77,6 +94,11 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
         self.events_summary = collections.defaultdict(int)
         self.events_summary_log = base_dir / SUMMARY_LOG
 
+        self._log_files: Dict[Path, BinaryIO] = {}
+        self._summary_lock = threading.Lock()
+        self._summary_changed = False
+        self._flush_lock = threading.Lock()
+
         super().__init__(_registry=_registry)
 
     def run(self) -> None:
@@ -91,10 +113,62 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
         ):
             log_file.touch()
 
-        for event_tuple in self.inbound_events():
-            with verbose_suppress("EventsFileLogger failed to process %s", event_tuple):
-                _, event = event_tuple  # try to unpack event from EventsDevice
-                self.write_event(event=event)
+        self.open_log_files()
+        flusher_stop_event = threading.Event()
+        flusher = threading.Thread(
+            target=self._flush_periodically, args=(flusher_stop_event,), name="EventsFileLoggerFlusher", daemon=True
+        )
+        flusher.start()
+        try:
+            for event_tuple in self.inbound_events():
+                with verbose_suppress("EventsFileLogger failed to process %s", event_tuple):
+                    _, event = event_tuple  # try to unpack event from EventsDevice
+                    self.write_event(event=event)
+        finally:
+            flusher_stop_event.set()
+            flusher.join()
+            self.close_log_files()
+
+    def open_log_files(self) -> None:
+        for log_file in chain((self.events_log,), self.events_logs_by_severity.values()):
+            self._log_files[log_file] = log_file.open("ab", buffering=self.buffer_size)
+
+    def close_log_files(self) -> None:
+        self.flush()
+        while self._log_files:
+            log_file, fobj = self._log_files.popitem()
+            with verbose_suppress("%s: failed to close %s", self, log_file):
+                fobj.close()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            for log_file, fobj in self._log_files.items():
+                with verbose_suppress("%s: failed to flush %s", self, log_file):
+                    fobj.flush()
+
+            with self._summary_lock:
+                if not self._summary_changed:
+                    return
+                events_summary = dict(self.events_summary)
+                self._summary_changed = False
+
+            # Write to a temporary file and rename it to not expose partially written summary to readers.
+            with verbose_suppress("%s: failed to update %s", self, self.events_summary_log):
+                summary_tmp = self.events_summary_log.with_name(f".{SUMMARY_LOG}.tmp")
+                summary_tmp.write_bytes(json.dumps(events_summary, indent=4).encode("utf-8"))
+                os.replace(summary_tmp, self.events_summary_log)
+
+    def _flush_periodically(self, stop_event: threading.Event) -> None:
+        while not stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def _write_to_file(self, log_file: Path, data: bytes) -> None:
+        with verbose_suppress("%s: failed to write to %s", self, log_file):
+            if fobj := self._log_files.get(log_file):
+                fobj.write(data)
+            else:
+                with log_file.open("ab+", buffering=0) as fobj:
+                    fobj.write(data)
 
     def write_event(self, event: SctEvent) -> None:
         message = event.format_event()
@@ -109,22 +183,26 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
 
         # Write event to events.log file
         if getattr(event, "save_to_files", False):
-            with verbose_suppress("%s: failed to write %s to %s", self, event, self.events_log):
-                with self.events_log.open("ab+", buffering=0) as fobj:
-                    fobj.write(message_bin)
-
+            self._write_to_file(self.events_log, message_bin)
             if log_file := self.events_logs_by_severity.get(event.severity):
-                with verbose_suppress("%s: failed to write %s to %s", self, event, log_file):
-                    with log_file.open("ab+", buffering=0) as fobj:
-                        fobj.write(message_bin)
+                self._write_to_file(log_file, message_bin)
 
-        # Update summary.log file (statistics.)
-        self.events_summary[Severity(event.severity).name] += 1
-        with verbose_suppress("%s: failed to update %s", self, self.events_summary_log):
-            with self.events_summary_log.open("wb", buffering=0) as fobj:
-                fobj.write(json.dumps(dict(self.events_summary), indent=4).encode("utf-8"))
+        # Update statistics for summary.log file.
+        with self._summary_lock:
+            self.events_summary[Severity(event.severity).name] += 1
+            self._summary_changed = True
+
+        if not self._log_files or event.severity.value > Severity.WARNING.value:
+            self.flush()
 
     def get_events_by_category(self, limit: Optional[int] = None) -> Dict[str, List[str]]:
+        with verbose_suppress("%s: failed to get events from the events store", self):
+            if (store := open_events_store(self.events_log.parent)) is not None:
+                with store:
+                    return self.get_events_by_category_from_store(store=store, limit=limit)
+        return self.get_events_by_category_from_files(limit=limit)
+
+    def get_events_by_category_from_files(self, limit: Optional[int] = None) -> Dict[str, List[str]]:
         output = {}
         for severity, log_file in self.events_logs_by_severity.items():
             # Get first `limit' events with CRITICAL severity and last `limit' for other severities.
@@ -149,6 +227,20 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
             output[severity.name] = list(events_bucket)
         return output
 
+    def get_events_by_category_from_store(
+        self, store: EventsStore, limit: Optional[int] = None
+    ) -> Dict[str, List[str]]:
+        output = {}
+        for severity in self.events_logs_by_severity:
+            # Get first `limit' events with CRITICAL severity and last `limit' for other severities.
+            newest_first = severity is not Severity.CRITICAL
+            events = [
+                "\n".join(filter(None, map(str.rstrip, (event.formatted or event.json).splitlines())))
+                for event in store.query(severity=severity, save_to_files=True, limit=limit, newest_first=newest_first)
+            ]
+            output[severity.name] = events[::-1] if newest_first else events
+        return output
+
 
 start_events_logger = partial(start_events_process, EVENTS_FILE_LOGGER_ID, EventsFileLogger)
 get_events_logger = cast(Callable[..., EventsFileLogger], partial(get_events_process, EVENTS_FILE_LOGGER_ID))
@@ -14,7 +14,7 @@
 import time
 import logging
 import threading
-from typing import NewType, Dict, Any, Tuple, Optional, Callable, cast
+from typing import NewType, Dict, Any, List, Tuple, Optional, Callable, cast
 from functools import partial
 from collections import defaultdict
 
@@ -25,12 +25,14 @@ from sdcm.sct_events.events_processes import (
     EVENTS_GRAFANA_AGGREGATOR_ID,
     EVENTS_GRAFANA_POSTMAN_ID,
     EventsProcessesRegistry,
-    BaseEventsProcess,
+    EventsSubscription,
     EventsProcessPipe,
+    events_topics,
     start_events_process,
     get_events_process,
     verbose_suppress,
 )
+from sdcm.sct_events.postman import Delivery, EventsPostman
 
 
 GRAFANA_EVENT_AGGREGATOR_TIME_WINDOW: float = 90  # seconds
@@ -41,6 +43,8 @@ GRAFANA_ANNOTATIONS_API_AUTH: Tuple[str, str] = (
     "admin",
     "admin",
 )
+GRAFANA_ANNOTATIONS_API_TIMEOUT: float = 30  # seconds
+GRAFANA_ANNOTATIONS_DEAD_LETTER_SPOOL: str = "grafana_annotations_dead_letters.jsonl"
 
 LOGGER = logging.getLogger(__name__)
 
@@ -50,6 +54,9 @@ AnnotationKey = NewType("AnnotationKey", Tuple[str, ...])
 
 
 class GrafanaAnnotator(EventsProcessPipe[Tuple[str, Any], Annotation]):
+    def get_events_subscription(self) -> EventsSubscription:
+        return EventsSubscription(topics=events_topics(publish_to_grafana=True))
+
     def run(self) -> None:
         for event_tuple in self.inbound_events():
             with verbose_suppress("GrafanaAnnotator failed to process %s", event_tuple):
@@ -111,28 +118,43 @@ class GrafanaEventAggregator(EventsProcessPipe[Annotation, Annotation]):
         return AnnotationKey(tuple(annotation["tags"]))
 
 
-class GrafanaEventPostman(BaseEventsProcess[Annotation, None], threading.Thread):
+class GrafanaEventPostman(EventsPostman[Annotation]):
+    """Post annotations to all Grafana URLs.
+
+    Grafana API has no bulk endpoint for annotations, so, each annotation is posted separately, in order,
+    by the lane of its Grafana URL using a keep-alive connection.
+    """
+
     inbound_events_process = EVENTS_GRAFANA_AGGREGATOR_ID
     api_endpoint = GRAFANA_ANNOTATIONS_API_ENDPOINT
     api_auth = GRAFANA_ANNOTATIONS_API_AUTH
+    api_timeout = GRAFANA_ANNOTATIONS_API_TIMEOUT
+    dead_letter_spool = GRAFANA_ANNOTATIONS_DEAD_LETTER_SPOOL
 
     def __init__(self, _registry: EventsProcessesRegistry):
         self.url_set = threading.Event()
         self._grafana_post_urls = []
+        self._sessions = threading.local()
         super().__init__(_registry=_registry)
 
-    def run(self) -> None:
+    def wait_until_ready(self) -> None:
         # Waiting until the monitor URL is set, and we can start using the API.
         self.url_set.wait()
 
-        for annotation in self.inbound_events():  # events from GrafanaAggregator
-            for grafana_post_url in self._grafana_post_urls:
-                with verbose_suppress(
-                    "GrafanaEventPostman failed to post an annotation to '%s' endpoint.\nAnnotation: %s",
-                    grafana_post_url,
-                    annotation,
-                ):
-                    requests.post(grafana_post_url, json=annotation, auth=self.api_auth, timeout=30).raise_for_status()
+    @property
+    def session(self) -> requests.Session:
+        """Session of the current worker thread to reuse its connections."""
+
+        if (session := getattr(self._sessions, "session", None)) is None:
+            session = self._sessions.session = requests.Session()
+            session.auth = self.api_auth
+        return session
+
+    def make_deliveries(self, batch: List[Annotation]) -> List[Delivery]:
+        return [Delivery(url, annotation) for annotation in batch for url in self._grafana_post_urls]
+
+    def deliver(self, delivery: Delivery) -> None:
+        self.session.post(delivery.target, json=delivery.payload, timeout=self.api_timeout).raise_for_status()
 
     def set_grafana_url(self, grafana_base_url: str) -> None:
         if not grafana_base_url:
@@ -0,0 +1,183 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import abc
+import json
+import time
+import queue
+import logging
+import threading
+from typing import Any, Iterable, List, NamedTuple, Optional
+
+from sdcm.sct_events.events_device import EVENTS_LOG_DIR
+from sdcm.sct_events.events_processes import (
+    T_inbound_event,
+    BaseEventsProcess,
+    EventsProcessesRegistry,
+    verbose_suppress,
+)
+
+
+EVENTS_POSTMAN_BATCH_SIZE: int = 100
+EVENTS_POSTMAN_MAX_WORKERS: int = 4
+EVENTS_POSTMAN_RETRY_ATTEMPTS: int = 4
+EVENTS_POSTMAN_RETRY_BACKOFF: float = 0.5  # seconds, doubled after each failed attempt
+EVENTS_POSTMAN_RETRY_BACKOFF_MAX: float = 8  # seconds
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Delivery(NamedTuple):
+    target: str
+    payload: Any
+
+
+class Lane(NamedTuple):
+    deliveries: queue.SimpleQueue
+    thread: threading.Thread
+
+
+class EventsPostman(BaseEventsProcess[T_inbound_event, None], threading.Thread):
+    """Deliver events to an external service in batches using a serial lane per target.
+
+    Events received from the upstream process are queued and a dispatcher takes all queued events (up to
+    `batch_size') as a batch, converts the batch to deliveries using `make_deliveries()' and passes each of
+    them to the lane of its target.  A lane is a daemon thread which delivers to its target one by one, so,
+    the order of events is kept per target, and a hung delivery blocks neither stop() nor interpreter exit.
+    At most `max_workers' deliveries are in flight: while there are so many the dispatcher waits, so,
+    batches grow under load.
+
+    A failed delivery is retried `retry_attempts' times with exponential backoff.  If all attempts failed
+    (or the postman is stopping), the delivery is appended to the dead-letter spool file in events_log dir.
+    """
+
+    batch_size = EVENTS_POSTMAN_BATCH_SIZE
+    max_workers = EVENTS_POSTMAN_MAX_WORKERS
+    retry_attempts = EVENTS_POSTMAN_RETRY_ATTEMPTS
+    retry_backoff = EVENTS_POSTMAN_RETRY_BACKOFF
+    retry_backoff_max = EVENTS_POSTMAN_RETRY_BACKOFF_MAX
+    dead_letter_spool: str = "dead_letters.jsonl"
+
+    def __init__(self, _registry: EventsProcessesRegistry):
+        self._pending = queue.SimpleQueue()
+        self._spool_lock = threading.Lock()
+        self.dead_letters_counter = 0
+        super().__init__(_registry=_registry)
+
+    @abc.abstractmethod
+    def make_deliveries(self, batch: List[T_inbound_event]) -> Iterable[Delivery]: ...
+
+    @abc.abstractmethod
+    def deliver(self, delivery: Delivery) -> None:
+        """Deliver a payload to the target, raise an exception on failure."""
+
+    def wait_until_ready(self) -> None:
+        """Override to postpone delivery until the target service is configured."""
+
+    def run(self) -> None:
+        self.wait_until_ready()
+
+        dispatcher = threading.Thread(target=self._dispatch, name=f"{type(self).__name__}Dispatcher", daemon=True)
+        dispatcher.start()
+        try:
+            for event in self.inbound_events():
+                self._pending.put(event)
+        finally:
+            self._pending.put(None)
+            dispatcher.join()
+
+    def _next_batch(self) -> Optional[list]:
+        if (event := self._pending.get()) is None:
+            return None
+        batch = [event]
+        while len(batch) < self.batch_size:
+            try:
+                event = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            if event is None:
+                self._pending.put(None)  # return the end mark to finish after this batch delivered
+                break
+            batch.append(event)
+        return batch
+
+    def _dispatch(self) -> None:
+        in_flight = threading.BoundedSemaphore(self.max_workers)
+        lanes = {}
+        try:
+            while True:
+                with in_flight:  # wait for a free slot before taking the next batch to let it grow meanwhile
+                    batch = self._next_batch()
+                if batch is None:
+                    break
+                with verbose_suppress("%s failed to deliver a batch of %d events", type(self).__name__, len(batch)):
+                    for delivery in self.make_deliveries(batch):
+                        in_flight.acquire()
+                        if (lane := lanes.get(delivery.target)) is None:
+                            lane = lanes[delivery.target] = self._start_lane(in_flight, num=len(lanes) + 1)
+                        lane.deliveries.put(delivery)
+        finally:
+            for lane in lanes.values():
+                lane.deliveries.put(None)
+            for lane in lanes.values():
+                lane.thread.join()
+
+    def _start_lane(self, in_flight: threading.BoundedSemaphore, num: int) -> Lane:
+        deliveries = queue.SimpleQueue()
+        thread = threading.Thread(
+            target=self._run_lane, args=(deliveries, in_flight), name=f"{type(self).__name__}Lane-{num}", daemon=True
+        )
+        thread.start()
+        return Lane(deliveries=deliveries, thread=thread)
+
+    def _run_lane(self, deliveries: queue.SimpleQueue, in_flight: threading.BoundedSemaphore) -> None:
+        while (delivery := deliveries.get()) is not None:
+            try:
+                self._deliver_with_retries(delivery)
+            finally:
+                in_flight.release()
+
+    def _deliver_with_retries(self, delivery: Delivery) -> None:
+        backoff = self.retry_backoff
+        for attempt in range(1, self.retry_attempts + 1):
+            try:
+                self.deliver(delivery)
+                return
+            except Exception as exc:  # noqa: BLE001
+                error = exc
+                if attempt == self.retry_attempts or self.stop_event.is_set():
+                    break
+                LOGGER.debug("%s: attempt #%d to deliver to %s failed: %s", self, attempt, delivery.target, exc)
+                self.stop_event.wait(backoff)
+                backoff = min(backoff * 2, self.retry_backoff_max)
+        LOGGER.error(
+            "%s failed to deliver to '%s' after %d attempt(s): %s\nPayload: %s",
+            type(self).__name__,
+            delivery.target,
+            attempt,
+            error,
+            delivery.payload,
+        )
+        self.spool(delivery=delivery, error=error)
+
+    def spool(self, delivery: Delivery, error: Exception) -> None:
+        record = {"time": time.time(), "target": delivery.target, "error": repr(error), "payload": delivery.payload}
+        with verbose_suppress("%s: failed to write to the dead-letter spool", self), self._spool_lock:
+            self.dead_letters_counter += 1
+            spool_file = self._registry.log_dir / EVENTS_LOG_DIR / self.dead_letter_spool
+            spool_file.parent.mkdir(parents=True, exist_ok=True)
+            with spool_file.open("a", encoding="utf-8") as fobj:
+                fobj.write(json.dumps(record, default=str) + "\n")
+
+
+__all__ = ("Delivery", "EventsPostman")
@@ -26,6 +26,7 @@ from sdcm.sct_events.filters import DbEventsFilter, EventsSeverityChangerFilter
 from sdcm.sct_events.database import DatabaseLogEvent
 from sdcm.sct_events.loaders import CassandraStressEvent, CassandraStressLogEvent
 from sdcm.sct_events.file_logger import start_events_logger
+from sdcm.sct_events.events_store import start_events_store
 from sdcm.sct_events.events_device import start_events_main_device
 from sdcm.sct_events.events_analyzer import start_events_analyzer
 from sdcm.sct_events.event_counter import start_events_counter
@@ -35,6 +36,7 @@ from sdcm.sct_events.events_processes import (
     EVENTS_ARGUS_POSTMAN_ID,
     EVENTS_MAIN_DEVICE_ID,
     EVENTS_FILE_LOGGER_ID,
+    EVENTS_STORE_ID,
     EVENTS_ANALYZER_ID,
     EVENTS_GRAFANA_ANNOTATOR_ID,
     EVENTS_GRAFANA_AGGREGATOR_ID,
@@ -68,6 +70,7 @@ def start_events_device(
     time.sleep(EVENTS_DEVICE_START_DELAY)
 
     start_events_logger(_registry=_registry)
+    start_events_store(_registry=_registry)
     start_grafana_pipeline(_registry=_registry)
     start_argus_pipeline(_registry=_registry)
     start_events_analyzer(_registry=_registry)
@@ -81,6 +84,7 @@ def stop_events_device(_registry: Optional[EventsProcessesRegistry] = None) -> N
     LOGGER.debug("Stop all events consumers...")
     processes = (
         EVENTS_FILE_LOGGER_ID,
+        EVENTS_STORE_ID,
         EVENTS_GRAFANA_ANNOTATOR_ID,
         EVENTS_GRAFANA_AGGREGATOR_ID,
         EVENTS_GRAFANA_POSTMAN_ID,
@@ -292,6 +292,7 @@ class LatteStressThread(DockerBasedStressThread):
                 node=loader,
                 remote_log_file=remote_hdr_file_name_full_path,
                 target_log_file=os.path.join(loader.logdir, remote_hdr_file_name),
+                compressed_transfer=self.params.get("hdrhistogram_compressed_transfer"),
             )
             # NOTE: running dozens of commands in parallel on a single SCT runner
             #       it is easy to get stress command to run earlier than the HDRH file
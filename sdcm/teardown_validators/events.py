@@ -1,10 +1,12 @@
 import json
 import logging
 import re
+from pathlib import Path
 from functools import reduce
 from typing import Optional, Union
 
 from sdcm.sct_events.events_device import get_events_main_device
+from sdcm.sct_events.events_store import open_events_store
 from sdcm.sct_events import Severity
 from sdcm.teardown_validators.base import TeardownValidator
 
@@ -57,9 +59,21 @@ class ErrorEventsValidator(TeardownValidator):
         filters = [FailingEventsFilter(**event) for event in self.configuration.get("failing_events")]
         raw_events_log = get_events_main_device(_registry=self.tester.events_processes_registry).raw_events_log
 
-        with open(raw_events_log, encoding="utf-8") as events_file:
-            initial_events = (json.loads(line) for line in events_file)
+        if (store := open_events_store(Path(raw_events_log).parent)) is not None:
+            # Every filter should match a failing event, so, use the index to get candidates for the first one.
+            # Check events as they were published (like in raw_events.log), i.e., also filtered ones.
+            query = (
+                dict(base=filters[0].event_class, type=filters[0].event_type, original_severity=Severity.ERROR)
+                if filters
+                else {}
+            )
+            with store:
+                initial_events = [event.as_raw_dict() for event in store.query(filtered=None, **query)]
             failing_events = reduce(lambda events, f: f.filter_events(events), filters, initial_events)
+        else:
+            with open(raw_events_log, encoding="utf-8") as events_file:
+                initial_events = (json.loads(line) for line in events_file)
+                failing_events = reduce(lambda events, f: f.filter_events(events), filters, initial_events)
 
         critical_events = self.tester.get_event_summary().get(Severity.CRITICAL.name, 0)
         self.tester.get_test_status = lambda: "FAILED" if (failing_events or critical_events) else "SUCCESS"
@@ -29,6 +29,7 @@ from sdcm.utils.metaclasses import Singleton
 from sdcm.utils.sct_agent_installer import generate_agent_api_key, save_agent_api_key, load_agent_api_key
 
 if TYPE_CHECKING:
+    from sdcm.db_log_reader import DbLogReaderPool
     from sdcm.sct_config import SCTConfiguration
 
 LOGGER = logging.getLogger(__name__)
@@ -54,12 +55,14 @@ class TestConfig(metaclass=Singleton):
     MIXED_CLUSTER = False
     MULTI_REGION = False
     BACKTRACE_DECODING = False
+    BACKTRACE_DECODING_WORKERS = 4
     INTRA_NODE_COMM_PUBLIC = False
     SYSLOGNG_ADDRESS = None
     VECTOR_ADDRESS = None
     LDAP_ADDRESS = None
     LDAP_USERS_ON_SCYLLA: bool = False
     DECODING_QUEUE = None
+    DB_LOG_READER_POOL: DbLogReaderPool | None = None
     RESOLVED_PLACEMENT_FILENAME = "resolved_placement.yaml"
 
     _test_id = None
@@ -261,6 +264,18 @@ class TestConfig(metaclass=Singleton):
     def set_decoding_queue(cls):
         cls.DECODING_QUEUE = multiprocessing.Queue()
 
+    @classmethod
+    def set_db_log_reader_pool(cls):
+        from sdcm.db_log_reader import DbLogReaderPool  # noqa: PLC0415
+
+        cls.DB_LOG_READER_POOL = DbLogReaderPool(decoding_queue=cls.DECODING_QUEUE)
+
+    @classmethod
+    def stop_db_log_reader_pool(cls):
+        if cls.DB_LOG_READER_POOL:
+            cls.DB_LOG_READER_POOL.stop(timeout=60)
+            cls.DB_LOG_READER_POOL = None
+
     @classmethod
     def set_intra_node_comm_public(cls, intra_node_comm_public):
         cls.INTRA_NODE_COMM_PUBLIC = intra_node_comm_public
@@ -1295,6 +1295,9 @@ class ClusterTester(unittest.TestCase):
         self.test_config.BACKTRACE_DECODING = self.params.get("backtrace_decoding")
         if self.test_config.BACKTRACE_DECODING:
             self.test_config.set_decoding_queue()
+            self.test_config.BACKTRACE_DECODING_WORKERS = self.params.get("backtrace_decoding_workers")
+        if self.params.get("db_log_reader_pool"):
+            self.test_config.set_db_log_reader_pool()
         self.test_config.set_intra_node_comm_public(self.params.get("intra_node_comm_public"))
 
         # for saving test details in DB
@@ -4185,6 +4188,9 @@ class ClusterTester(unittest.TestCase):
         self.stop_event_analyzer()
         self.stop_resources()
 
+        with silence(parent=self, name="stopping db log reader pool"):
+            self.test_config.stop_db_log_reader_pool()
+
         with silence(parent=self, name="closing decoding queue as needed"):
             if self.test_config.BACKTRACE_DECODING and hasattr(self.test_config.DECODING_QUEUE, "close"):
                 self.test_config.DECODING_QUEUE.close()
@@ -11,7 +11,10 @@
 #
 # Copyright (c) 2025 ScyllaDB
 
+import gzip
+import hashlib
 import logging
+import os
 import time
 from typing import Optional, Dict, List, Any
 from dataclasses import dataclass
@@ -23,6 +26,11 @@ from urllib3.util.retry import Retry
 
 LOGGER = logging.getLogger(__name__)
 
+AGENT_JOB_FINAL_STATUSES = ("completed", "failed", "cancelled")
+AGENT_OUTPUT_LONG_POLL_TIMEOUT: float = 10  # seconds
+AGENT_FILE_TRANSFER_CHUNK_SIZE: int = 8 * 1024 * 1024
+AGENT_FILE_TRANSFER_RETRIES: int = 3
+
 
 @dataclass
 class AgentJob:
@@ -43,6 +51,8 @@ class AgentJob:
     working_dir: str = ""
     env: Dict[str, str] = None
     timeout: int = 0
+    stdout_offset: int = 0  # position of `stdout' in the whole output of the job, if only a part of it returned
+    stderr_offset: int = 0
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AgentJob":
@@ -62,8 +72,14 @@ class AgentJob:
             working_dir=data.get("working_dir", ""),
             env=data.get("env", {}),
             timeout=data.get("timeout", 0),
+            stdout_offset=data.get("stdout_offset", 0),
+            stderr_offset=data.get("stderr_offset", 0),
         )
 
+    @property
+    def is_finished(self) -> bool:
+        return self.status in AGENT_JOB_FINAL_STATUSES
+
     @staticmethod
     def _parse_datetime(dt_str: Optional[str]) -> Optional[datetime]:
         """Parse datetime string from API response"""
@@ -94,9 +110,17 @@ class AgentTimeoutError(AgentClientError):
     pass
 
 
+class AgentChecksumError(AgentClientError):
+    pass
+
+
 class AgentClient:
     """HTTP client for SCT agent API"""
 
+    long_poll_timeout = AGENT_OUTPUT_LONG_POLL_TIMEOUT
+    file_transfer_chunk_size = AGENT_FILE_TRANSFER_CHUNK_SIZE
+    file_transfer_retries = AGENT_FILE_TRANSFER_RETRIES
+
     def __init__(
         self,
         hostname: str,
@@ -112,6 +136,8 @@ class AgentClient:
         self.tls = tls
         self.timeout = timeout
         self.base_url = f"{'https' if tls else 'http'}://{hostname}:{port}"
+        self.incremental_output: Optional[bool] = None  # if the agent supports output offsets, None until known
+        self.file_transfer_supported: Optional[bool] = None  # if the agent has the files API, None until known
 
         self.session = requests.Session()
         adapter = HTTPAdapter(
@@ -147,18 +173,19 @@ class AgentClient:
         :param method: HTTP method
         :param url: request URL
         :param operation_name: name of operation for error messages
-        :param kwargs: arguments to pass to requests (json, params, etc.)
+        :param kwargs: arguments to pass to requests (json, params, timeout, etc.)
 
         :return: response object
         """
+        timeout = kwargs.pop("timeout", self.timeout)
         try:
-            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            response = self.session.request(method, url, timeout=timeout, **kwargs)
             response.raise_for_status()
             return response
         except requests.exceptions.ConnectionError as exc:
             raise AgentConnectionError(f"Cannot connect to agent at {self.base_url}: {exc}") from exc
         except requests.exceptions.Timeout as exc:
-            raise AgentTimeoutError(f"{operation_name.capitalize()} timed out after {self.timeout}s") from exc
+            raise AgentTimeoutError(f"{operation_name.capitalize()} timed out after {timeout}s") from exc
         except requests.exceptions.HTTPError as exc:
             error_data = exc.response.json() if exc.response.content else {}
             raise AgentAPIError(
@@ -230,14 +257,59 @@ class AgentClient:
                 raise AgentAPIError(f"Job {job_id} not found", status_code=404) from exc
             raise
 
+    def get_job_output(self, job_id: str, stdout_offset: int = 0, stderr_offset: int = 0, wait: float = 0) -> AgentJob:
+        """
+        Get job status and its output after the given offsets.
+
+        An agent which supports incremental output returns only the output after the offsets (and its offsets as
+        `stdout_offset' and `stderr_offset' fields), and, if `wait' is set, holds the request up to `wait' seconds
+        until there is new output or the job is finished.  An older agent ignores these parameters and returns
+        the whole output right away, in this case, the output is cut here and `incremental_output' is set to False
+        to let callers fall back to polling.
+        """
+        params = {"stdout_offset": stdout_offset, "stderr_offset": stderr_offset, **({"wait": wait} if wait else {})}
+        try:
+            response = self._make_request(
+                "GET",
+                f"{self.base_url}/api/v1/commands/{job_id}",
+                "get job output",
+                params=params,
+                timeout=self.timeout + wait,
+            )
+        except AgentAPIError as exc:
+            if exc.status_code == 404:
+                raise AgentAPIError(f"Job {job_id} not found", status_code=404) from exc
+            raise
+        data = response.json()
+        job = AgentJob.from_dict(data)
+        self.incremental_output = "stdout_offset" in data
+        if not self.incremental_output:
+            job.stdout, job.stderr = (job.stdout or "")[stdout_offset:], (job.stderr or "")[stderr_offset:]
+            job.stdout_offset, job.stderr_offset = stdout_offset, stderr_offset
+        return job
+
     def wait_for_job(self, job_id: str, timeout: int = 300, poll_interval: float = 1.0) -> AgentJob:
-        """Wait for job to complete and return results"""
+        """
+        Wait for job to complete and return results
+
+        The output is read incrementally using long-polling, so, the job's completion is noticed right away.
+        Older agents are polled every `poll_interval' seconds.
+        """
         start_time = time.time()
-        while time.time() - start_time < timeout:
-            job = self.get_job(job_id)
-            if job.status in ("completed", "failed", "cancelled"):
+        stdout, stderr = [], []
+        stdout_offset = stderr_offset = 0
+        while (remaining := timeout - (time.time() - start_time)) > 0:
+            job = self.get_job_output(job_id, stdout_offset, stderr_offset, wait=min(remaining, self.long_poll_timeout))
+            stdout.append(job.stdout or "")
+            stderr.append(job.stderr or "")
+            stdout_offset = job.stdout_offset + len(stdout[-1])
+            stderr_offset = job.stderr_offset + len(stderr[-1])
+            if job.is_finished:
+                job.stdout, job.stderr = "".join(stdout), "".join(stderr)
+                job.stdout_offset = job.stderr_offset = 0
                 return job
-            time.sleep(poll_interval)
+            if not self.incremental_output:
+                time.sleep(poll_interval)
 
         raise AgentTimeoutError(f"Job {job_id} did not complete within {timeout} seconds")
 
@@ -266,5 +338,125 @@ class AgentClient:
                 raise AgentAPIError(f"Job {job_id} not found", status_code=404) from exc
             raise
 
+    def get_file_info(self, path: str, checksum: bool = False) -> Dict[str, Any]:
+        """
+        Get info of a file on the agent's host using the files API.
+
+        :param path: remote file path
+        :param checksum: if True, the agent calculates SHA-256 of the file
+
+        :return: dict like {"exists": true, "is_dir": false, "size": 1024, "mode": 420, "sha256": "..."}
+        """
+        params = {"path": path, **({"checksum": "sha256"} if checksum else {})}
+        response = self._make_request("GET", f"{self.base_url}/api/v1/files/info", "get file info", params=params)
+        return response.json()
+
+    def is_file_transfer_supported(self) -> bool:
+        """Check if the agent has the files API (older agents respond with 404 or 405 to it)"""
+        if self.file_transfer_supported is None:
+            try:
+                self.get_file_info("/")
+                self.file_transfer_supported = True
+            except AgentAPIError as exc:
+                if exc.status_code not in (404, 405):
+                    raise
+                self.file_transfer_supported = False
+        return self.file_transfer_supported
+
+    def upload_file(self, local_path: str, remote_path: str, compress: bool = True) -> str:
+        """
+        Upload a file to the agent's host by chunks of `file_transfer_chunk_size' bytes.
+
+        Each chunk is sent as a raw (optionally gzip-compressed) body of `PUT /api/v1/files' with the offset of the
+        chunk in the file.  The first chunk (offset 0) truncates the remote file.  If sending of a chunk failed,
+        the upload is resumed from the size of the remote file.  After all chunks sent, the SHA-256 checksum
+        calculated by the agent is compared with the local one.
+
+        :param local_path: local file path
+        :param remote_path: remote file path, parent directories are created by the agent
+        :param compress: compress chunks with gzip
+
+        :return: SHA-256 hex digest of the file
+        """
+        url = f"{self.base_url}/api/v1/files"
+        mode = os.stat(local_path).st_mode & 0o7777
+        headers = {"Content-Type": "application/octet-stream", **({"Content-Encoding": "gzip"} if compress else {})}
+        size = os.path.getsize(local_path)
+        offset, failures = 0, 0
+        with open(local_path, "rb") as fobj:
+            while True:
+                fobj.seek(offset)
+                chunk = fobj.read(self.file_transfer_chunk_size)
+                params = {"path": remote_path, "offset": offset, "mode": oct(mode)}
+                try:
+                    self._make_request(
+                        "PUT",
+                        url,
+                        "upload file",
+                        params=params,
+                        headers=headers,
+                        data=gzip.compress(chunk, compresslevel=1) if compress else chunk,
+                    )
+                except (AgentConnectionError, AgentTimeoutError) as exc:
+                    if (failures := failures + 1) > self.file_transfer_retries:
+                        raise
+                    offset = min(self.get_file_info(remote_path).get("size", 0), offset)
+                    LOGGER.debug("Failed to upload %s, resume from offset %s: %s", local_path, offset, exc)
+                    continue
+                offset += len(chunk)
+                if offset >= size:
+                    break
+        return self._verify_checksum(local_path, remote_path)
+
+    def download_file(self, remote_path: str, local_path: str, compress: bool = True) -> str:
+        """
+        Download a file from the agent's host as a stream.
+
+        The file is read by `GET /api/v1/files' from the offset of already received data, so, the download
+        resumes after a failure.  The SHA-256 checksum calculated by the agent is compared with the local one.
+
+        :param remote_path: remote file path
+        :param local_path: local file path
+        :param compress: ask the agent to compress the stream with gzip
+
+        :return: SHA-256 hex digest of the file
+        """
+        url = f"{self.base_url}/api/v1/files"
+        headers = {"Accept-Encoding": "gzip" if compress else "identity"}
+        failures = 0
+        with open(local_path, "wb") as fobj:
+            while True:
+                try:
+                    response = self._make_request(
+                        "GET",
+                        url,
+                        "download file",
+                        params={"path": remote_path, "offset": fobj.tell()},
+                        headers=headers,
+                        stream=True,
+                    )
+                    with response:
+                        for chunk in response.iter_content(chunk_size=1024 * 1024):  # decompressed by requests
+                            fobj.write(chunk)
+                    break
+                except (AgentConnectionError, AgentTimeoutError, requests.exceptions.RequestException) as exc:
+                    if (failures := failures + 1) > self.file_transfer_retries:
+                        raise AgentConnectionError(f"Failed to download {remote_path}: {exc}") from exc
+                    LOGGER.debug("Failed to download %s, resume from offset %s: %s", remote_path, fobj.tell(), exc)
+        return self._verify_checksum(local_path, remote_path)
+
+    def _verify_checksum(self, local_path: str, remote_path: str) -> str:
+        sha256 = hashlib.sha256()
+        with open(local_path, "rb") as fobj:
+            while block := fobj.read(1024 * 1024):
+                sha256.update(block)
+        local_checksum = sha256.hexdigest()
+        remote_checksum = self.get_file_info(remote_path, checksum=True).get("sha256")
+        if local_checksum != remote_checksum:
+            raise AgentChecksumError(
+                f"Checksum mismatch of {local_path} ({local_checksum}) and {remote_path} ({remote_checksum})"
+            )
+        return local_checksum
+
     def __repr__(self) -> str:
         return f"AgentClient(hostname={self.hostname}, port={self.port}, tls={self.tls})"
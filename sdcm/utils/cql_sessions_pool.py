@@ -0,0 +1,174 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import time
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, Hashable, NamedTuple
+
+from cassandra import OperationTimedOut
+from cassandra.cluster import NoHostAvailable, Session
+from cassandra.connection import ConnectionException
+
+from sdcm.utils.common import ScyllaCQLSession
+
+
+CQL_SESSIONS_POOL_IDLE_TIMEOUT: float = 300  # seconds
+CQL_SESSIONS_POOL_MAX_IDLE_PER_KEY: int = 4
+CQL_SESSIONS_POOL_EVICTION_INTERVAL: float = 30  # seconds
+
+# Session attributes which callers are allowed to change while a session leased.  They're restored on release.
+SESSION_DEFAULTS = (
+    "default_timeout",
+    "default_consistency_level",
+    "default_serial_consistency_level",
+    "default_fetch_size",
+    "row_factory",
+)
+
+# A session which failed with one of these errors is not returned to the pool.
+CONNECTION_ERRORS = (NoHostAvailable, ConnectionException, OperationTimedOut)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class IdleSession(NamedTuple):
+    session: Session
+    defaults: dict
+    released_at: float
+
+
+class PooledScyllaCQLSession(ScyllaCQLSession):
+    """Same as ScyllaCQLSession, but returns the session to the pool on exit instead of shutting it down."""
+
+    def __init__(self, session: Session, verbose: bool, pool: "CQLSessionsPool", key: Hashable, defaults: dict):
+        super().__init__(session=session, cluster=session.cluster, verbose=verbose)
+        self.pool = pool
+        self.key = key
+        self.defaults = defaults
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.session.__dict__.pop("execute_async", None)  # remove the verbose wrapper set by __enter__()
+        self.pool.release(self, discard=isinstance(exc_val, CONNECTION_ERRORS))
+
+
+class CQLSessionsPool:
+    """Pool of connected CQL sessions grouped by a key of connection options.
+
+    A session is leased to a single caller at a time, so, callers can change a session (e.g., `default_timeout')
+    as before.  On release, attributes from SESSION_DEFAULTS are restored and the session is kept idle for reuse
+    by the next lease with the same key.  A session is shut down instead, if it's unhealthy, if its keyspace was
+    changed, if there are `max_idle_per_key' idle sessions already, or if it's idle for more than `idle_timeout'.
+
+    Expired idle sessions are evicted on each lease and release, and every `eviction_interval' seconds by a daemon
+    thread which runs while there are idle sessions, so, they are shut down even if the pool is not used anymore.
+    """
+
+    idle_timeout = CQL_SESSIONS_POOL_IDLE_TIMEOUT
+    max_idle_per_key = CQL_SESSIONS_POOL_MAX_IDLE_PER_KEY
+    eviction_interval = CQL_SESSIONS_POOL_EVICTION_INTERVAL
+
+    def __init__(self, name: str = "CQLSessionsPool"):
+        self.name = name
+        self._idle: dict[Hashable, list[IdleSession]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._closing = threading.Event()
+        self._evictor: threading.Thread | None = None
+
+    def lease(self, key: Hashable, connect: Callable[[], Session], verbose: bool = True) -> PooledScyllaCQLSession:
+        """Return an idle healthy session with the key, or a new one made by `connect()'."""
+
+        self.evict_idle()
+        while (idle := self._pop_idle(key)) is not None:
+            if self.is_healthy(idle.session):
+                LOGGER.debug("%s: reuse CQL session %s", self.name, key)
+                return PooledScyllaCQLSession(idle.session, verbose, pool=self, key=key, defaults=idle.defaults)
+            self._shutdown(idle.session)
+        session = connect()
+        defaults = {attr: getattr(session, attr) for attr in SESSION_DEFAULTS}
+        defaults["keyspace"] = session.keyspace
+        return PooledScyllaCQLSession(session, verbose, pool=self, key=key, defaults=defaults)
+
+    def release(self, cql_session: PooledScyllaCQLSession, discard: bool = False) -> None:
+        self.evict_idle()
+        session, defaults = cql_session.session, cql_session.defaults
+        if discard or self._closed or session.keyspace != defaults["keyspace"] or not self.is_healthy(session):
+            self._shutdown(session)
+            return
+        for attr in SESSION_DEFAULTS:
+            setattr(session, attr, defaults[attr])
+        with self._lock:
+            if not self._closed and len(idle := self._idle[cql_session.key]) < self.max_idle_per_key:
+                idle.append(IdleSession(session=session, defaults=defaults, released_at=time.perf_counter()))
+                if self._evictor is None:
+                    self._evictor = threading.Thread(
+                        target=self._evict_idle_periodically, name=f"{self.name}:Evictor", daemon=True
+                    )
+                    self._evictor.start()
+                return
+        self._shutdown(session)
+
+    def _pop_idle(self, key: Hashable) -> IdleSession | None:
+        with self._lock:
+            if idle := self._idle.get(key):
+                return idle.pop()  # the most recently used one
+        return None
+
+    @staticmethod
+    def is_healthy(session: Session) -> bool:
+        if session.is_shutdown or session.cluster.is_shutdown:
+            return False
+        return any(state.get("open_count") for state in session.get_pool_state().values())
+
+    def evict_idle(self) -> None:
+        deadline = time.perf_counter() - self.idle_timeout
+        with self._lock:
+            evicted = [idle for sessions in self._idle.values() for idle in sessions if idle.released_at < deadline]
+            for key in list(self._idle):
+                self._idle[key] = [idle for idle in self._idle[key] if idle.released_at >= deadline]
+                if not self._idle[key]:
+                    del self._idle[key]
+        for idle in evicted:
+            self._shutdown(idle.session)
+
+    def _evict_idle_periodically(self) -> None:
+        while not self._closing.wait(self.eviction_interval):
+            self.evict_idle()
+            with self._lock:
+                if not self._idle:
+                    self._evictor = None  # the next release starts a new one
+                    return
+
+    def close(self) -> None:
+        self._closing.set()
+        with self._lock:
+            self._closed = True
+            idle_sessions = [idle for sessions in self._idle.values() for idle in sessions]
+            self._idle.clear()
+        for idle in idle_sessions:
+            self._shutdown(idle.session)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(map(len, self._idle.values()))
+
+    def _shutdown(self, session: Session) -> None:
+        try:
+            session.cluster.shutdown()
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.debug("%s: failed to shutdown CQL session: %s", self.name, exc)
+
+
+__all__ = ("CQLSessionsPool", "PooledScyllaCQLSession")
@@ -14,8 +14,9 @@
 # Data validation module may be used with cassandra-stress user profile only
 #
 # **************** Caution **************************************************************
-# BE AWARE: During data validation all materialized views/expected table rows will be read into the memory
-#           Be sure your dataset will be less then 2Gb.
+# BE AWARE: Rows are compared by digests of token ranges, but rows of mismatched token ranges (or of all the
+#           updated rows views, which partition keys differ from the expected data table) are read into the
+#           memory to find the difference. Be sure your dataset will be less then 2Gb.
 # ****************************************************************************************
 #
 # Here is described Data validation module and requirements for user profile.
@@ -134,13 +135,21 @@
 import json
 import os
 import re
+import hashlib
 import logging
 import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from typing import NamedTuple, Optional
 
+from cassandra import ConsistencyLevel
+
 from sdcm.sct_events import Severity
 from sdcm.test_config import TestConfig
 from sdcm.utils.database_query_utils import fetch_all_rows
+from sdcm.utils.decorators import retrying
 
 from sdcm.utils.user_profile import get_profile_content
 from sdcm.sct_events.health import DataValidatorEvent
@@ -148,6 +157,10 @@ from sdcm.sct_events.health import DataValidatorEvent
 
 LOGGER = logging.getLogger(__name__)
 
+MIN_TOKEN = -(2**63)
+MAX_TOKEN = 2**63 - 1
+ROW_DIGEST_MODULO = 2**128
+
 
 class DataForValidation(NamedTuple):
     views: tuple  # list of view names with data for validation
@@ -157,12 +170,43 @@ class DataForValidation(NamedTuple):
     after_update_rows: Optional[list]
 
 
+class RangeDigest(NamedTuple):
+    rows: int
+    digest: int  # sum of row digests, so, it doesn't depend on the rows order
+
+
+class TokenRangesComparison(NamedTuple):
+    statements: dict  # entity name -> prepared statement which selects rows of a token range
+    rows: dict  # entity name -> number of rows
+    actual_rows: int
+    expected_rows: int
+    mismatched_ranges: list  # token ranges (start, end] with different digests
+
+
+def split_token_ring(ranges_count: int) -> list[tuple[int, int]]:
+    """Split the Murmur3 token ring to (start, end] ranges.  The minimal token is never assigned to a partition."""
+    step = (MAX_TOKEN - MIN_TOKEN) // ranges_count
+    bounds = [MIN_TOKEN + step * index for index in range(ranges_count)] + [MAX_TOKEN]
+    return list(zip(bounds, bounds[1:]))
+
+
+def encode_row(row) -> str:
+    return repr(tuple(row))
+
+
+def row_digest(encoded_row: str) -> int:
+    return int.from_bytes(hashlib.blake2b(encoded_row.encode(), digest_size=16).digest(), "big")
+
+
 class LongevityDataValidator:
     SUFFIX_FOR_VIEW_AFTER_UPDATE = "_after_update"
     SUFFIX_EXPECTED_DATA_TABLE = "_expect"
     SUBSTRING_NOT_UPDATED = "_not_updated"
     SUBSTRING_DELETION = "_deletions"
     DEFAULT_FETCH_SIZE = 5000
+    TOKEN_RANGES_COUNT = 256
+    DIGEST_WORKERS = 8
+    MAX_REPORTED_ROWS_PER_RANGE = 100
 
     def __init__(
         self, longevity_self_object, user_profile_name, base_table_partition_keys, stress_cmds_part="prepare_write_cmd"
@@ -332,6 +376,89 @@ class LongevityDataValidator:
         result = session.execute(f"SELECT * FROM {entity_name} LIMIT 1")
         return result.column_names
 
+    def get_partition_key_columns(self, entity_name: str, session) -> list[str]:
+        result = session.execute(
+            "SELECT column_name, kind, position FROM system_schema.columns WHERE keyspace_name = %s AND table_name = %s",
+            (self.keyspace_name, entity_name),
+        )
+        return [row.column_name for row in sorted(result, key=lambda row: row.position) if row.kind == "partition_key"]
+
+    @retrying(n=4, sleep_time=5, message="Calculate token range digest")
+    def _token_range_digest(self, session, statement, token_range: tuple[int, int]) -> RangeDigest:
+        rows = digest = 0
+        for row in session.execute(statement, token_range):  # next pages are fetched while iterating
+            rows += 1
+            digest += row_digest(encode_row(row))
+        return RangeDigest(rows=rows, digest=digest % ROW_DIGEST_MODULO)
+
+    def compare_by_token_ranges(
+        self, session, actual_entities: tuple, expected_entity: str, columns: list[str]
+    ) -> TokenRangesComparison:
+        """Compare rows of the actual entities (together) with rows of the expected entity without fetching them all.
+
+        Rows are streamed by token ranges and a digest is calculated for each range.  If partition keys of the
+        entities are not the same, rows can't be matched by token ranges and the whole token ring is one range.
+        """
+        entities = (*actual_entities, expected_entity)
+        partition_keys = {entity: self.get_partition_key_columns(entity, session) for entity in entities}
+        if len({tuple(partition_key) for partition_key in partition_keys.values()}) == 1:
+            token_ranges = split_token_ring(self.TOKEN_RANGES_COUNT)
+        else:
+            token_ranges = split_token_ring(1)
+
+        statements, digests = {}, {}
+        with ThreadPoolExecutor(max_workers=self.DIGEST_WORKERS, thread_name_prefix="DataValidator") as executor:
+            for entity in entities:
+                token = f"token({', '.join(partition_keys[entity])})"
+                statements[entity] = session.prepare(
+                    f"SELECT {', '.join(columns)} FROM {entity} WHERE {token} > ? AND {token} <= ?"
+                )
+                statements[entity].fetch_size = self.DEFAULT_FETCH_SIZE
+                statements[entity].consistency_level = ConsistencyLevel.QUORUM
+                digests[entity] = executor.map(
+                    partial(self._token_range_digest, session, statements[entity]), token_ranges
+                )
+            digests = {entity: list(entity_digests) for entity, entity_digests in digests.items()}
+
+        mismatched_ranges = []
+        for index, token_range in enumerate(token_ranges):
+            actual_digest = sum(digests[entity][index].digest for entity in actual_entities) % ROW_DIGEST_MODULO
+            if actual_digest != digests[expected_entity][index].digest:
+                mismatched_ranges.append(token_range)
+        rows = {entity: sum(digest.rows for digest in entity_digests) for entity, entity_digests in digests.items()}
+        return TokenRangesComparison(
+            statements=statements,
+            rows=rows,
+            actual_rows=sum(rows[entity] for entity in actual_entities),
+            expected_rows=rows[expected_entity],
+            mismatched_ranges=mismatched_ranges,
+        )
+
+    def save_token_ranges_difference(self, session, comparison: TokenRangesComparison, logdir: str) -> str:
+        """Fetch rows of the mismatched token ranges only and save the difference, a JSON line per range."""
+        *actual_entities, expected_entity = comparison.statements
+        os.makedirs(logdir, exist_ok=True)
+        diff_file = os.path.join(logdir, f"{actual_entities[0]}_token_ranges_diff.jsonl")
+        with open(diff_file, "w", encoding="utf8") as diff:
+            for token_range in comparison.mismatched_ranges:
+                actual_rows = Counter()
+                for entity in actual_entities:
+                    actual_rows.update(map(encode_row, session.execute(comparison.statements[entity], token_range)))
+                expected_rows = Counter(
+                    map(encode_row, session.execute(comparison.statements[expected_entity], token_range))
+                )
+                missing, unexpected = expected_rows - actual_rows, actual_rows - expected_rows
+                record = {
+                    "token_range": token_range,
+                    "missing_rows_count": sum(missing.values()),
+                    "unexpected_rows_count": sum(unexpected.values()),
+                    "missing_rows": list(islice(missing.elements(), self.MAX_REPORTED_ROWS_PER_RANGE)),
+                    "unexpected_rows": list(islice(unexpected.elements(), self.MAX_REPORTED_ROWS_PER_RANGE)),
+                }
+                diff.write(json.dumps(record) + "\n")
+        LOGGER.info("Difference in %d token ranges: %s", len(comparison.mismatched_ranges), diff_file)
+        return diff_file
+
     def copy_immutable_expected_data(self):
         # Create expected data for immutable rows
         if self._validate_not_updated_data:
@@ -447,68 +574,71 @@ class LongevityDataValidator:
         if not during_nemesis:
             LOGGER.debug("Verify immutable rows")
 
-        actual_result = fetch_all_rows(
-            session=session,
-            default_fetch_size=self.DEFAULT_FETCH_SIZE,
-            statement=f"SELECT * FROM {self.view_name_for_not_updated_data}",
-            verbose=not during_nemesis,
-        )
-        if not actual_result:
+        try:
+            comparison = self.compare_by_token_ranges(
+                session=session,
+                actual_entities=(self.view_name_for_not_updated_data,),
+                expected_entity=self.expected_data_table_name,
+                columns=self.get_entity_columns(entity_name=self.expected_data_table_name, session=session),
+            )
+        except Exception as error:  # noqa: BLE001
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.WARNING,
                 message=f"Can't validate immutable rows. "
-                f"Fetch all rows from {self.view_name_for_not_updated_data} failed. "
-                f"See error above in the sct.log",
+                f"Fetch rows from {self.view_name_for_not_updated_data} and {self.expected_data_table_name} failed: "
+                f"{error}",
             ).publish()
             return
 
-        expected_result = fetch_all_rows(
-            session=session,
-            default_fetch_size=self.DEFAULT_FETCH_SIZE,
-            statement=f"SELECT * FROM {self.expected_data_table_name}",
-            verbose=not during_nemesis,
-        )
-        if not expected_result:
-            DataValidatorEvent.ImmutableRowsValidator(
-                severity=Severity.WARNING,
-                message=f"Can't validate immutable rows. Fetch all rows from {self.expected_data_table_name} failed. "
-                f"See error above in the sct.log",
-            ).publish()
-            return
+        for entity, rows in comparison.rows.items():
+            if not rows:
+                DataValidatorEvent.ImmutableRowsValidator(
+                    severity=Severity.WARNING,
+                    message=f"Can't validate immutable rows. No rows found in {entity}.",
+                ).publish()
+                return
 
+        actual_rows, expected_rows = comparison.actual_rows, comparison.expected_rows
         # Issue https://github.com/scylladb/scylla/issues/6181
         # Not fail the test if unexpected additional rows where found in actual result table
-        if len(actual_result) > len(expected_result):
+        if actual_rows > expected_rows:
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.WARNING,
-                message=f"Actual dataset length more then expected ({len(actual_result)} > {len(expected_result)}). "
-                f"Issue #6181",
+                message=f"Actual dataset length more then expected ({actual_rows} > {expected_rows}). Issue #6181",
             ).publish()
         elif not during_nemesis:
-            assert len(actual_result) == len(expected_result), (
+            diff_file = None
+            if comparison.mismatched_ranges:
+                logdir = os.path.join(TestConfig().logdir(), "lwt_validator_data_for_debug")
+                diff_file = self.save_token_ranges_difference(session=session, comparison=comparison, logdir=logdir)
+            assert actual_rows == expected_rows, (
                 "One or more rows are not as expected, suspected LWT wrong update. "
-                f"Actual dataset length: {len(actual_result)}, Expected dataset length: {len(expected_result)}"
+                f"Actual dataset length: {actual_rows}, Expected dataset length: {expected_rows}. "
+                f"Difference: {diff_file}"
             )
 
-            assert actual_result == expected_result, "One or more rows are not as expected, suspected LWT wrong update"
+            assert not comparison.mismatched_ranges, (
+                "One or more rows are not as expected, suspected LWT wrong update. "
+                f"Rows differ in {len(comparison.mismatched_ranges)} token ranges. Difference: {diff_file}"
+            )
 
             # Raise info event at the end of the test only.
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.NORMAL, message="Validation immutable rows finished successfully"
             ).publish()
-        elif len(actual_result) < len(expected_result):
+        elif actual_rows < expected_rows:
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.ERROR,
                 error=f"Verify immutable rows. "
                 f"One or more rows not found as expected, suspected LWT wrong update. "
-                f"Actual dataset length: {len(actual_result)}, "
-                f"Expected dataset length: {len(expected_result)}",
+                f"Actual dataset length: {actual_rows}, "
+                f"Expected dataset length: {expected_rows}",
             ).publish()
         else:
             LOGGER.debug(
                 "Verify immutable rows. Actual dataset length: %s, Expected dataset length: %s",
-                len(actual_result),
-                len(expected_result),
+                actual_rows,
+                expected_rows,
             )
 
     def list_of_view_names_for_update_test(self):
@@ -753,20 +883,35 @@ class LongevityDataValidator:
                 ).publish()
                 continue
 
-            data_for_validation = self.fetch_data_for_validation_after_update(
-                during_nemesis=during_nemesis, views_set=views_set, session=session
-            )
-            if data_for_validation is None:
+            try:
+                comparison = self.compare_by_token_ranges(
+                    session=session,
+                    actual_entities=views_set[:2],
+                    expected_entity=views_set[2],
+                    columns=self.base_table_partition_keys,
+                )
+            except Exception as error:  # noqa: BLE001
+                DataValidatorEvent.UpdatedRowsValidator(
+                    severity=Severity.WARNING,
+                    message=f"Can't validate updated rows. Fetch rows from {', '.join(views_set[:3])} failed: {error}",
+                ).publish()
+                continue
+
+            if empty_views := [view for view in views_set[:3] if not comparison.rows[view]]:
+                DataValidatorEvent.UpdatedRowsValidator(
+                    severity=Severity.WARNING,
+                    message=f"Can't validate updated rows. No rows found in {', '.join(empty_views)}.",
+                ).publish()
                 continue
 
             # Issue https://github.com/scylladb/scylla/issues/6181
             # Not fail the test if unexpected additional rows where found in actual result table
-            if len(data_for_validation.actual_data) > len(data_for_validation.expected_data):
+            if comparison.actual_rows > comparison.expected_rows:
                 DataValidatorEvent.UpdatedRowsValidator(
                     severity=Severity.WARNING,
                     message=f"View {views_set[0]}. "
-                    f"Actual dataset length {len(data_for_validation.actual_data)} "
-                    f"more then expected dataset length: {len(data_for_validation.expected_data)}. "
+                    f"Actual dataset length {comparison.actual_rows} "
+                    f"more then expected dataset length: {comparison.expected_rows}. "
                     f"Issue #6181",
                 ).publish()
                 continue
@@ -774,23 +919,28 @@ class LongevityDataValidator:
             if during_nemesis:
                 LOGGER.debug(
                     "Validation updated rows.  View %s. Actual dataset length %s, Expected dataset length: %s.",
-                    data_for_validation.views[0],
-                    len(data_for_validation.actual_data),
-                    len(data_for_validation.expected_data),
+                    views_set[0],
+                    comparison.actual_rows,
+                    comparison.expected_rows,
                 )
                 continue
 
-            if (
-                len(data_for_validation.actual_data) != len(data_for_validation.expected_data)
-            ) or data_for_validation.actual_data != data_for_validation.expected_data:
+            if comparison.actual_rows != comparison.expected_rows or comparison.mismatched_ranges:
                 LOGGER.debug(
                     "%s. Rows amount:\n  before update: %s\n  after update: %s\n  expected: %s\n actual: %s",
-                    data_for_validation.views[0],
-                    len(data_for_validation.before_update_rows),
-                    len(data_for_validation.after_update_rows),
-                    len(data_for_validation.expected_data),
-                    len(data_for_validation.actual_data),
+                    views_set[0],
+                    comparison.rows[views_set[0]],
+                    comparison.rows[views_set[1]],
+                    comparison.expected_rows,
+                    comparison.actual_rows,
+                )
+
+                # Rows are fetched for the analysis only if they don't match.
+                data_for_validation = self.fetch_data_for_validation_after_update(
+                    during_nemesis=during_nemesis, views_set=views_set, session=session
                 )
+                if data_for_validation is None:
+                    continue
 
                 logdir = self.save_data_for_debugging(data_for_validation)
 
@@ -800,7 +950,7 @@ class LongevityDataValidator:
             else:
                 DataValidatorEvent.UpdatedRowsValidator(
                     severity=Severity.NORMAL,
-                    message=f"Validation updated rows finished successfully. View {data_for_validation.views[0]}",
+                    message=f"Validation updated rows finished successfully. View {views_set[0]}",
                 ).publish()
 
     def validate_deleted_rows(self, session, during_nemesis=False):
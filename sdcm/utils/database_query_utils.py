@@ -17,9 +17,11 @@ from __future__ import absolute_import, annotations
 import logging
 import os
 import sys
+import time
 from typing import List
 
 from cassandra import ConsistencyLevel
+from cassandra.concurrent import execute_concurrent_with_args
 
 from sdcm.sct_events import Severity
 from sdcm.sct_events.health import PartitionRowsValidationEvent
@@ -29,6 +31,10 @@ from sdcm.utils.decorators import retrying, optional_stage
 
 LOGGER = logging.getLogger(__name__)
 
+PARTITIONS_COUNT_CONCURRENCY = 100
+PARTITIONS_COUNT_RETRIES = 3
+PARTITIONS_COUNT_RETRY_DELAY = 5  # seconds
+
 
 class PartitionsValidationAttributes:
     """
@@ -49,12 +55,17 @@ class PartitionsValidationAttributes:
         max_partitions_in_test_table: str | None = None,
         partition_range_with_data_validation: str | None = None,
         validate_partitions: bool = False,
+        count_concurrency: int = PARTITIONS_COUNT_CONCURRENCY,
+        count_retries: int = PARTITIONS_COUNT_RETRIES,
     ):
         """
         limit_rows_number is a limit for querying rows per partition.
         When running a health-check and calling "validate_partitions",
         it would nor read more than this number of rows-per-partition.
         The default is NO limit_rows_number, marked by '0'.
+
+        count_concurrency is a number of partitions counted in parallel, and count_retries is a number
+        of times the partitions which failed to be counted are retried.
         """
         self.tester = tester
         self.table_name = table_name
@@ -66,6 +77,8 @@ class PartitionsValidationAttributes:
         self.limit_rows_number = limit_rows_number
         self.partitions_dict_before = None
         self.validate_partitions = validate_partitions
+        self.count_concurrency = count_concurrency
+        self.count_retries = count_retries
 
     def _init_partition_range(self):
         if self.partition_range_with_data_validation:
@@ -100,64 +113,84 @@ class PartitionsValidationAttributes:
         # Unless ignore_limit_rows_number is True.
 
         error_message = "Failed to collect partition info. Error details: {}"
+        save_into_file_name = (
+            self.PARTITIONS_ROWS_BEFORE if not self.partitions_rows_collected else self.PARTITIONS_ROWS_AFTER
+        )
+        partitions_stats_file = os.path.join(self.tester.logdir, save_into_file_name)
         try:
             with self.db_cluster.cql_connection_patient(node=self.db_cluster.nodes[0], connect_timeout=600) as session:
                 session.default_consistency_level = ConsistencyLevel.QUORUM
                 pk_list = sorted(
                     get_partition_keys(ks_cf=self.table_name, session=session, pk_name=self.primary_key_column)
                 )
+                if self.partition_range_with_data_validation:
+                    # Count existing partitions that intersects with partition_range_with_data_validation
+                    pk_list = [
+                        partition
+                        for partition in pk_list
+                        if int(partition) in range(self.partition_start_range, self.partition_end_range)
+                    ]
+                LOGGER.debug("%s partition-keys to query are in range: %s - %s", len(pk_list), pk_list[0], pk_list[-1])
+
+                # Collect data about partitions' rows amount.
+                partitions = self.count_partitions_rows(
+                    session=session, pk_list=pk_list, ignore_limit_rows_number=ignore_limit_rows_number
+                )
         except Exception as exc:  # noqa: BLE001
             TestFrameworkEvent(
                 source=self.__class__.__name__, message=error_message.format(exc), severity=Severity.ERROR
             ).publish()
             return None
 
-        # Collect data about partitions' rows amount.
-        partitions = {}
-        if self.partition_range_with_data_validation:
-            # Count existing partitions that intersects with partition_range_with_data_validation
-            pk_list = [
-                partition
-                for partition in pk_list
-                if int(partition) in range(self.partition_start_range, self.partition_end_range)
-            ]
-        save_into_file_name = (
-            self.PARTITIONS_ROWS_BEFORE if not self.partitions_rows_collected else self.PARTITIONS_ROWS_AFTER
-        )
-        partitions_stats_file = os.path.join(self.tester.logdir, save_into_file_name)
-        LOGGER.debug("%s partition-keys to query are in range: %s - %s", len(pk_list), pk_list[0], pk_list[-1])
         with open(partitions_stats_file, "a", encoding="utf-8") as stats_file:
-            for i in pk_list:
-                count_pk_rows_cmd = self.get_count_pk_rows_query(
-                    key=i, ignore_limit_rows_number=ignore_limit_rows_number
-                )
-                try:
-                    with self.db_cluster.cql_connection_patient(
-                        node=self.db_cluster.nodes[0], connect_timeout=600
-                    ) as session:
-                        pk_rows_num_query_result = fetch_all_rows(
-                            session=session,
-                            default_fetch_size=3000,
-                            statement=count_pk_rows_cmd,
-                            retries=1,
-                            timeout=600,
-                            raise_on_exceeded=True,
-                            verbose=False,
-                        )
-                        pk_rows_num_result = pk_rows_num_query_result[0].count
-                except Exception as exc:  # noqa: BLE001
-                    TestFrameworkEvent(
-                        source=self.__class__.__name__, message=error_message.format(exc), severity=Severity.ERROR
-                    ).publish()
-                    return None
-
-                partitions[i] = pk_rows_num_result
-                stats_file.write(f"{i}:{partitions[i]}, ")
+            stats_file.write("".join(f"{key}:{rows_num}, " for key, rows_num in partitions.items()))
         LOGGER.info(f"File with partitions row data: {partitions_stats_file}")
         if save_into_file_name == self.PARTITIONS_ROWS_BEFORE:
             self.partitions_rows_collected = True
         return partitions
 
+    def count_partitions_rows(self, session, pk_list: list, ignore_limit_rows_number: bool = False) -> dict:
+        """Count rows of the partitions running `count_concurrency' queries in parallel using the same session.
+
+        Partitions which failed to be counted are retried `count_retries' times, then the last error is raised.
+        """
+        statement = session.prepare(
+            self.get_count_pk_rows_query(key="?", ignore_limit_rows_number=ignore_limit_rows_number)
+        )
+        session.default_timeout = 600
+        rows_per_partition = {}
+        pending, error = pk_list, None
+        for attempt in range(self.count_retries + 1):
+            if attempt:
+                LOGGER.warning(
+                    "Failed to count rows in %d partitions, retry #%d in %ss. Last error: %s",
+                    len(pending),
+                    attempt,
+                    PARTITIONS_COUNT_RETRY_DELAY,
+                    error,
+                )
+                time.sleep(PARTITIONS_COUNT_RETRY_DELAY)
+            results = execute_concurrent_with_args(
+                session=session,
+                statement=statement,
+                parameters=[(key,) for key in pending],
+                concurrency=self.count_concurrency,
+                raise_on_first_error=False,
+                results_generator=True,
+            )
+            failed = []
+            for key, (success, result) in zip(pending, results):
+                if success:
+                    rows_per_partition[key] = result.one().count
+                else:
+                    failed.append(key)
+                    error = result
+            if not (pending := failed):
+                break
+        else:
+            raise error
+        return {key: rows_per_partition[key] for key in pk_list}
+
     def collect_initial_partitions_info(self) -> None:
         LOGGER.debug("Save partitions info before reads")
         self.partitions_dict_before = self.collect_partitions_info(ignore_limit_rows_number=True)
@@ -11,9 +11,12 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
-from typing import Optional, TextIO, List, Union, AnyStr, Iterable
+import os
+from typing import Optional, TextIO, List, Union, AnyStr, Iterable, Iterator
 from re import Pattern
 
+READ_BACKWARDS_BLOCK_SIZE: int = 64 * 1024
+
 
 class ReiterableGenerator:
     def __init__(self, generator):
@@ -139,3 +142,28 @@ class File:
 
     def __getattr__(self, item):
         return getattr(self._io, item)
+
+
+def read_lines_backwards(
+    path: str, block_size: int = READ_BACKWARDS_BLOCK_SIZE, encoding: str = "utf-8"
+) -> Iterator[str]:
+    """
+    Yield lines of the file from the last one to the first one (without line separators, like `tac')
+
+    The file is read by blocks of `block_size' bytes from its end, so, memory usage is bounded by the block size
+    and the longest line.
+    """
+    with open(path, "rb") as fobj:
+        position = fobj.seek(0, os.SEEK_END)
+        tail = None  # a beginning of the line which continues in the previously read block
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            fobj.seek(position)
+            lines = (fobj.read(read_size) + (tail or b"")).split(b"\n")
+            if tail is None and lines[-1] == b"":
+                lines.pop()  # the trailing newline of the file
+            tail = lines.pop(0)
+            yield from (line.decode(encoding) for line in reversed(lines))
+        if tail is not None:
+            yield tail.decode(encoding)
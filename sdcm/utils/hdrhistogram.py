@@ -1,13 +1,16 @@
 import glob
-import os.path
+import os
 import time
+import bisect
 import logging
 import traceback
-from typing import Any
+from typing import Iterator
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, make_dataclass
 
 from hdrh.histogram import HdrHistogram
-from hdrh.log import HistogramLogReader
+from hdrh.log import HistogramLogReader, re_base_time, re_histogram_interval, re_start_time
 
 from sdcm.utils.decorators import log_run_info
 
@@ -131,6 +134,119 @@ class _HdrRangeHistogram:
     histogram: _HdrHistogram | None
 
 
+class _HdrIntervalsLogReader(HistogramLogReader):
+    """
+    Same parsing as HistogramLogReader does, but intervals are not decoded,
+    so a caller can decide which of them are needed.
+    """
+
+    def iter_intervals(self, absolute: bool = False) -> Iterator[tuple[str | None, float, float, float, str]]:
+        """
+        Yield (tag, timestamp to check a time range on, absolute start and end timestamps, encoded histogram)
+        """
+        for line in self.input_file:
+            if line[0] == "#":
+                if match_res := re_start_time.match(line):
+                    self.start_time_sec = float(match_res.group(1))
+                    self.observed_start_time = True
+                    continue
+                if match_res := re_base_time.match(line):
+                    self.base_time_sec = float(match_res.group(1))
+                    self.observed_base_time = True
+                    continue
+            if line.startswith("Tag="):
+                index = line.find(",")
+                tag = line[4:index]
+                line = line[index + 1 :]  # noqa: PLW2901
+            else:
+                tag = None
+            if not (match_res := re_histogram_interval.match(line)):
+                continue
+            log_time_stamp_in_sec = float(match_res.group(1))
+            interval_length_sec = float(match_res.group(2))
+            if not self.observed_start_time:
+                self.start_time_sec = log_time_stamp_in_sec
+                self.observed_start_time = True
+            if not self.observed_base_time:
+                if log_time_stamp_in_sec < self.start_time_sec - (365 * 24 * 3600.0):
+                    self.base_time_sec = self.start_time_sec
+                else:
+                    self.base_time_sec = 0.0
+                self.observed_base_time = True
+            absolute_start_time_stamp_sec = log_time_stamp_in_sec + self.base_time_sec
+            range_time_stamp = (
+                absolute_start_time_stamp_sec if absolute else absolute_start_time_stamp_sec - self.start_time_sec
+            )
+            yield (
+                tag,
+                range_time_stamp,
+                absolute_start_time_stamp_sec,
+                absolute_start_time_stamp_sec + interval_length_sec,
+                match_res.group(4),
+            )
+
+
+def _read_hdr_file_by_intervals(
+    hdr_file: str, hdr_tags: list[str], intervals: list[tuple[int, int]], absolute: bool
+) -> dict[tuple[int, int], tuple[str, float, float]]:
+    """
+    Build histograms for all (hdr tag, time interval) pairs in one pass over the file.
+
+    The result is the same as reading the file by HistogramLogReader for each pair: an interval goes to all
+    time ranges which include its start timestamp (both ends inclusive) until a timestamp later than the range's
+    end is met.  Histograms are returned encoded with their start and end timestamps, keyed by the indexes of
+    the hdr tag and of the time interval.
+    """
+    tags_indexes = {}
+    for tag_index, hdr_tag in enumerate(hdr_tags):
+        # The tag in the HDR file for the stress command with the user profile is in lowercase.
+        tags_indexes.setdefault(hdr_tag.lower(), []).append(tag_index)
+    starts = [start for start, _ in intervals]
+    ends = [end for _, end in intervals]
+
+    histograms = {}
+    index_errors = 0
+    latest_time_stamp = float("-inf")
+    LOGGER.debug("Parsing file: %s tags %s", hdr_file, hdr_tags)
+    try:
+        hdr_reader = _HdrIntervalsLogReader(hdr_file, _HdrHistogram())
+        try:
+            for tag, time_stamp, start_time_stamp, end_time_stamp, encoded_histogram in hdr_reader.iter_intervals(
+                absolute=absolute
+            ):
+                latest_time_stamp = max(latest_time_stamp, time_stamp)
+                if (first_open := bisect.bisect_left(ends, latest_time_stamp)) == len(ends):
+                    break  # the rest of the file is later than all time intervals
+                last_including = bisect.bisect_right(starts, time_stamp)
+                if first_open >= last_including or not (tag and (tags := tags_indexes.get(tag.lower()))):
+                    continue
+                try:
+                    interval_histogram = HdrHistogram.decode(encoded_histogram)
+                except IndexError:
+                    LOGGER.warning(f"IndexError in file {hdr_file} for the interval at {start_time_stamp}, skipping it")
+                    index_errors += 1
+                    continue
+                interval_histogram.set_start_time_stamp(start_time_stamp * 1000.0)
+                interval_histogram.set_end_time_stamp(end_time_stamp * 1000.0)
+                for key in ((tag_index, num) for tag_index in tags for num in range(first_open, last_including)):
+                    if (histogram := histograms.get(key)) is None:
+                        histogram = histograms[key] = _HdrHistogram()
+                        histogram.set_start_time_stamp(interval_histogram.get_start_time_stamp())
+                    histogram.add(interval_histogram)
+        finally:
+            hdr_reader.close()
+    except Exception as e:
+        LOGGER.error("Failed to parse file %s with tags %s: %s", hdr_file, hdr_tags, e)
+        LOGGER.error(traceback.format_exc())
+        raise
+    if index_errors > 0:
+        LOGGER.warning(f"{index_errors} lines were ignored in file {hdr_file} due to IndexError")
+    return {
+        key: (histogram.encode(), histogram.get_start_time_stamp(), histogram.get_end_time_stamp())
+        for key, histogram in histograms.items()
+    }
+
+
 class _HdrRangeHistogramBuilder:
     def __init__(
         self,
@@ -146,6 +262,7 @@ class _HdrRangeHistogramBuilder:
         self.end_time = end_time
         self.hdrh_files_pattern = hdr_file_pattern
         self.absolute_time = True
+        self.max_workers = None
 
     @log_run_info("HdrHistogram Summary Builder")
     def build_histogram_summary(self, path: str) -> list[dict[str, dict[str, int]]]:
@@ -186,53 +303,83 @@ class _HdrRangeHistogramBuilder:
             else:
                 window_step = interval or TIME_INTERVAL
 
-            interval_num = 0
-            start_intervals = range(start_ts, end_ts, window_step)
+            intervals = [
+                (start_interval, min(start_interval + window_step, end_ts))
+                for start_interval in range(start_ts, end_ts, window_step)
+            ]
             LOGGER.debug(
-                f"Building histogram summary for {path} with tags {self.hdr_tags} and intervals {len(start_intervals)}"
+                f"Building histogram summary for {path} with tags {self.hdr_tags} and intervals {len(intervals)}"
             )
 
-            results = {}
-            for start_interval in start_intervals:
-                end_interval = end_ts if start_interval + window_step > end_ts else start_interval + window_step
-                for hdr_tag in self.hdr_tags:
-                    summary_with_interval_by_tag = self._build_histograms_summary_with_interval_by_tag(
-                        path, hdr_tag, start_interval, end_interval, interval_num
-                    )
-                    LOGGER.debug(
-                        f"Got result for tag {hdr_tag} and interval #{interval_num}: {summary_with_interval_by_tag}"
-                    )
-                    if summary_with_interval_by_tag:
-                        if summary_with_interval_by_tag["interval_num"] not in results:
-                            results[summary_with_interval_by_tag["interval_num"]] = {}
-                        results[summary_with_interval_by_tag["interval_num"]].update(
-                            summary_with_interval_by_tag["result"]
-                        )
-                        LOGGER.debug(
-                            "Updated results for interval_num=%s", summary_with_interval_by_tag.get("interval_num")
-                        )
-                interval_num += 1
-
-                LOGGER.debug(
-                    f"Processing interval {interval_num} out of {len(start_intervals)} for tags {self.hdr_tags}"
+            if os.path.isfile(path):
+                hdr_files = [path]
+            elif os.path.isdir(path):
+                hdr_files = []
+                for hdr_file in self._get_list_of_hdr_files(path):
+                    if os.stat(hdr_file).st_size == 0:
+                        LOGGER.error("File %s is empty", hdr_file)
+                        continue
+                    hdr_files.append(hdr_file)
+            else:
+                LOGGER.info(f"No histogram for path {path}  - not a file or directory")
+                return []
+
+            with ProcessPoolExecutor(max_workers=self.max_workers or os.cpu_count()) as executor:
+                # Stage 1: read each file once and build its histograms for all (tag, interval) pairs.
+                files_histograms = {}
+                for file_histograms in executor.map(
+                    _read_hdr_file_by_intervals,
+                    hdr_files,
+                    repeat(self.hdr_tags),
+                    repeat(intervals),
+                    repeat(self.absolute_time),
+                ):
+                    for key, file_histogram in file_histograms.items():
+                        files_histograms.setdefault(key, []).append(file_histogram)
+
+                # Stage 2: merge histograms of all files and calculate percentiles for each (tag, interval) pair.
+                keys = [
+                    (tag_index, interval_num)
+                    for interval_num in range(len(intervals))
+                    for tag_index in range(len(self.hdr_tags))
+                    if (tag_index, interval_num) in files_histograms
+                ]
+                summaries = executor.map(
+                    self._build_interval_summary_by_tag,
+                    [self.hdr_tags[tag_index] for tag_index, _ in keys],
+                    [intervals[interval_num] for _, interval_num in keys],
+                    [files_histograms[key] for key in keys],
                 )
 
-            LOGGER.debug("Finalised results for path %s", path)
-            keys = list(results.keys())
-            LOGGER.debug("Finalised results keys for path %s: %s", path, keys)
-            keys.sort()
-            summary = []
-            for key in keys:
-                LOGGER.debug("Adding results for key %s", key)
-                summary.append(results[key])
-                LOGGER.debug("Added results for key %s", key)
-            return summary
+                results = {}
+                for (_, interval_num), summary_by_tag in zip(keys, summaries):
+                    if summary_by_tag:
+                        LOGGER.debug(f"Got result for interval #{interval_num}: {summary_by_tag}")
+                        results.setdefault(interval_num, {}).update(summary_by_tag)
+            return [results[interval_num] for interval_num in sorted(results)]
         except Exception as e:
             LOGGER.error(f"Error building histogram summary for {path} with tags {self.hdr_tags}: {e}")
             raise
         finally:
             LOGGER.debug(f"Finished building histogram summary for {path} with tags {self.hdr_tags}")
 
+    def _build_interval_summary_by_tag(
+        self, hdr_tag: str, interval: tuple[int, int], files_histograms: list[tuple[bytes, float, float]]
+    ) -> dict[str, dict[str, int]] | None:
+        histogram = _HdrHistogram()
+        histogram.set_tag(hdr_tag)
+        for encoded_histogram, start_time_stamp, end_time_stamp in files_histograms:
+            file_histogram = HdrHistogram.decode(encoded_histogram)
+            file_histogram.set_start_time_stamp(start_time_stamp)
+            file_histogram.set_end_time_stamp(end_time_stamp)
+            if histogram.get_start_time_stamp() == 0:
+                histogram.set_start_time_stamp(start_time_stamp)
+            histogram.add(file_histogram)
+        start_interval, end_interval = interval
+        return self._get_summary_for_operation_by_hdr_tag(
+            _HdrRangeHistogram(start_time=start_interval, end_time=end_interval, histogram=histogram, hdr_tag=hdr_tag)
+        )
+
     def build_from_log_line(self, log_line: str, hst_log_start_time: float) -> dict[str, dict[str, int]]:
         """
         Build Range Histogram Summary from provided log_line
@@ -479,16 +626,3 @@ class _HdrRangeHistogramBuilder:
         val = self._get_summary_for_operation_by_hdr_tag(histogram)
         LOGGER.debug(f"Path {path} generated histogram for tag {hdr_tag}: {val}")
         return val
-
-    def _build_histograms_summary_with_interval_by_tag(
-        self, path: str, hdr_tag: str, start_interval: int, end_interval: int, interval_num: int
-    ) -> dict[str, Any] | None:
-        result = _HdrRangeHistogramBuilder(
-            hdr_tags=[hdr_tag],
-            stress_operation=self.stress_operation,
-            start_time=start_interval,
-            end_time=end_interval,
-        ).build_histogram_summary_by_tag(path, hdr_tag)
-        if result:
-            return {"interval_num": interval_num, "result": result}
-        return None
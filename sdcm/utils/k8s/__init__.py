@@ -22,6 +22,8 @@ import re
 import threading
 import multiprocessing
 import contextlib
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
 from tempfile import NamedTemporaryFile
 from typing import Iterator, Optional, Union, Callable, List
 from functools import cached_property, partialmethod
@@ -51,6 +53,10 @@ HELM_IMAGE = "alpine/helm:3.8.0"
 
 KUBECTL_TIMEOUT = 300  # seconds
 
+K8S_LOGS_GATHERING_MAX_WORKERS = 16
+K8S_LOGS_GATHERING_PROGRESS_INTERVAL = 30  # seconds
+K8S_LOGS_GATHERING_REPORT = "k8s-logs-gathering.report"
+
 K8S_CONFIGS_PATH_SCT = sct_abs_path("sdcm/k8s_configs")
 
 JSON_PATCH_TYPE = "application/json-patch+json"
@@ -631,101 +637,249 @@ class KubernetesOps:
             )
 
     @classmethod
-    def gather_k8s_logs(cls, logdir_path, kubectl=None, namespaces=None) -> None:
-        # NOTE: reuse data where possible to minimize spent time due to API limiter restrictions
-        LOGGER.info("K8S-LOGS: starting logs gathering")
-        logdir = Path(logdir_path)
-        kubectl = kubectl or (lambda *args, **kwargs: KubernetesOps.kubectl(None, *args, **kwargs))
-        kubectl(f"version > {logdir / 'kubectl.version'} 2>&1", ignore_status=True)
-
-        # Gather cluster-scoped resources info
+    def gather_k8s_logs(
+        cls,
+        logdir_path,
+        kubectl=None,
+        namespaces=None,
+        api_call_rate_limiter: Optional[ApiCallRateLimiter] = None,
+    ) -> None:
+        """Gather k8s resources info and pod logs concurrently, see K8sLogsGatherer for details.
+
+        `api_call_rate_limiter' limits number of concurrent kubectl calls.  If `kubectl' is not given, calls are
+        also rate limited by it (kluster's kubectl() does this itself.)
+        """
+        if kubectl is None:
+
+            def kubectl(*args, **kwargs):
+                if api_call_rate_limiter:
+                    api_call_rate_limiter.wait()
+                return KubernetesOps.kubectl(None, *args, **kwargs)
+
+        K8sLogsGatherer(logdir=logdir_path, kubectl=kubectl, api_call_rate_limiter=api_call_rate_limiter).gather(
+            namespaces=namespaces
+        )
+
+
+class K8sLogsGatherer:
+    """Gather k8s resources info and pod logs using a pool of workers.
+
+    Each kubectl call is a task, and tasks can submit more tasks: e.g., a task which gets all pods of a namespace
+    at once (one `get -o yaml' call per resource type and namespace) submits tasks to get logs of their containers.
+    Pod logs are piped to gzip directly.
+
+    Number of concurrent kubectl calls is limited by `max_workers' and, if an API call rate limiter is given, by
+    its `queue_size', to not let waiting calls exceed its queue.  Progress is logged every `progress_interval'
+    seconds and timing of all tasks is saved to K8S_LOGS_GATHERING_REPORT file in the logdir.
+    """
+
+    max_workers = K8S_LOGS_GATHERING_MAX_WORKERS
+    progress_interval = K8S_LOGS_GATHERING_PROGRESS_INTERVAL
+
+    cluster_scope_dir = "cluster-scoped-resources"
+    namespace_scope_dir = "namespace-scoped-resources"
+
+    # NOTE: gather only small set of the cluster-wide objects which are needed for specific namespaces
+    namespaces_cluster_wide_resource_types = ("namespaces", "nodes", "persistentvolumes")
+
+    scylla_container_files_to_copy = (
+        ("/var/lib/scylla/io_properties.yaml", "io_properties.yaml"),
+        ("/etc/scylla.d/", "etc-scylla-d"),
+        ("/etc/scylla/", "etc-scylla"),
+    )
+
+    def __init__(self, logdir, kubectl: Callable, api_call_rate_limiter: Optional[ApiCallRateLimiter] = None):
+        self.logdir = Path(logdir)
+        self.kubectl = kubectl
+        self.workers = self.max_workers
+        if api_call_rate_limiter:
+            self.workers = max(1, min(self.workers, api_call_rate_limiter.queue_size))
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending: set[Future] = set()
+        self._timings: dict[str, list[float]] = defaultdict(list)
+        self._failures: dict[str, int] = defaultdict(int)
+        self._started_at = time.perf_counter()
+
+    def gather(self, namespaces: Union[str, List[str], None] = None) -> None:
+        LOGGER.info("K8S-LOGS: starting logs gathering using %d workers", self.workers)
+        self._started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=type(self).__name__) as self._executor:
+            self.submit(
+                "version", self.kubectl, f"version > {self.logdir / 'kubectl.version'} 2>&1", ignore_status=True
+            )
+            self.gather_cluster_scoped_resources(cluster_wide_only=bool(namespaces))
+            self.wait()
+            if not namespaces:
+                # Read all the namespaces from already saved file
+                with open(
+                    self.logdir / self.cluster_scope_dir / "namespaces.wide", encoding="utf-8"
+                ) as namespaces_file:
+                    # Reverse order of namespaces because preferred ones are there
+                    namespaces = [n.split()[0] for n in namespaces_file.readlines()[1:]][::-1]
+            elif isinstance(namespaces, str):
+                namespaces = [namespaces]
+            self.gather_namespace_scoped_resources(namespaces)
+            self.wait()
+        self.report()
+
+    def submit(self, kind: str, func: Callable, *args, **kwargs) -> None:
+        """Run `func' by a worker, its timing is reported under the `kind'."""
+
+        future = self._executor.submit(self._run_task, kind, func, *args, **kwargs)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._task_done)
+
+    def _task_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def _run_task(self, kind: str, func: Callable, *args, **kwargs) -> None:
+        started_at = time.perf_counter()
+        try:
+            func(*args, **kwargs)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("K8S-LOGS: failed to gather %s (%s): %s", kind, args[0] if args else func, exc)
+            with self._lock:
+                self._failures[kind] += 1
+        finally:
+            with self._lock:
+                self._timings[kind].append(time.perf_counter() - started_at)
+
+    def wait(self) -> None:
+        """Wait until all submitted tasks, including ones submitted by other tasks, are done."""
+
+        while True:
+            with self._lock:
+                pending = set(self._pending)
+            if not pending:
+                return
+            wait_futures(pending, timeout=self.progress_interval)
+            self.log_progress()
+
+    def log_progress(self) -> None:
+        with self._lock:
+            done = sum(map(len, self._timings.values()))
+            failed = sum(self._failures.values())
+            pending = len(self._pending)
+        LOGGER.info(
+            "K8S-LOGS: %d tasks done (%d failed), %d in progress or queued, %.0fs elapsed",
+            done,
+            failed,
+            pending,
+            time.perf_counter() - self._started_at,
+        )
+
+    def report(self) -> None:
+        elapsed = time.perf_counter() - self._started_at
+        lines = [f"{'task':<16}{'count':>8}{'failed':>8}{'total, s':>12}{'max, s':>10}"]
+        with self._lock:
+            for kind, timings in sorted(self._timings.items()):
+                lines.append(
+                    f"{kind:<16}{len(timings):>8}{self._failures[kind]:>8}{sum(timings):>12.1f}{max(timings):>10.1f}"
+                )
+        lines.append(f"K8S logs gathered in {elapsed:.1f}s using {self.workers} workers")
+        report = "\n".join(lines)
+        LOGGER.info("K8S-LOGS: finished logs gathering:\n%s", report)
+        with contextlib.suppress(OSError):
+            (self.logdir / K8S_LOGS_GATHERING_REPORT).write_text(report + "\n", encoding="utf-8")
+
+    def gather_cluster_scoped_resources(self, cluster_wide_only: bool) -> None:
         LOGGER.info("K8S-LOGS: gathering cluster scoped resources")
-        cluster_scope_dir = "cluster-scoped-resources"
-        os.makedirs(logdir / cluster_scope_dir, exist_ok=True)
-        if namespaces:
-            # NOTE: gather only small set of the cluster-wide objects which are needed for specific namespaces
-            cluster_wide_resource_types = ("namespaces", "nodes", "persistentvolumes")
+        cluster_scope_dir = self.logdir / self.cluster_scope_dir
+        os.makedirs(cluster_scope_dir, exist_ok=True)
+        if cluster_wide_only:
+            resource_types = self.namespaces_cluster_wide_resource_types
         else:
-            cluster_wide_resource_types = kubectl(
-                "api-resources --namespaced=false --verbs=list -o name"
-            ).stdout.split()
-        for resource_type in cluster_wide_resource_types:
+            resource_types = self.kubectl("api-resources --namespaced=false --verbs=list -o name").stdout.split()
+        for resource_type in resource_types:
             for output_format in ("yaml", "wide"):
-                logfile = logdir / cluster_scope_dir / f"{resource_type}.{output_format}"
-                kubectl(f"get {resource_type} -o {output_format} > {logfile}", ignore_status=True)
-        kubectl(f"describe nodes > {logdir / cluster_scope_dir / 'nodes.desc'}", timeout=600, ignore_status=True)
-
-        if not namespaces:
-            # Read all the namespaces from already saved file
-            with open(logdir / cluster_scope_dir / "namespaces.wide", mode="r", encoding="utf-8") as namespaces_file:
-                # Reverse order of namespaces because preferred ones are there
-                namespaces = [n.split()[0] for n in namespaces_file.readlines()[1:]][::-1]
-        elif isinstance(namespaces, str):
-            namespaces = [namespaces]
-
-        # Gather namespace-scoped resources info
+                logfile = cluster_scope_dir / f"{resource_type}.{output_format}"
+                self.submit(
+                    "cluster-scoped",
+                    self.kubectl,
+                    f"get {resource_type} -o {output_format} > {logfile}",
+                    ignore_status=True,
+                    verbose=False,
+                )
+        self.submit(
+            "cluster-scoped",
+            self.kubectl,
+            f"describe nodes > {cluster_scope_dir / 'nodes.desc'}",
+            timeout=600,
+            ignore_status=True,
+            verbose=False,
+        )
+
+    def gather_namespace_scoped_resources(self, namespaces: List[str]) -> None:
         LOGGER.info("K8S-LOGS: gathering namespace scoped resources. list of namespaces: %s", ", ".join(namespaces))
-        namespace_scope_dir = "namespace-scoped-resources"
-        os.makedirs(logdir / namespace_scope_dir, exist_ok=True)
-        for resource_type in kubectl("api-resources --namespaced=true --verbs=get,list -o name").stdout.split():
-            LOGGER.info("K8S-LOGS: gathering '%s' resources", resource_type)
-            logfile = logdir / namespace_scope_dir / f"{resource_type}.{output_format}"
-            resources_wide = kubectl(f"get {resource_type} -A -o wide 2>&1 | tee {logfile}", ignore_status=True).stdout
-            if resource_type.startswith("events"):
-                # NOTE: skip both kinds on 'events' available in k8s
-                continue
-            for namespace in namespaces:
-                if not re.search(f"\n{namespace} ", resources_wide):
-                    # NOTE: move to the next namespace because such resources are absent here
-                    continue
-                LOGGER.info("K8S-LOGS: gathering '%s' resources in the '%s' namespace", resource_type, namespace)
-                resource_dir = logdir / namespace_scope_dir / namespace / resource_type
-                os.makedirs(resource_dir, exist_ok=True)
-                for _res in resources_wide.split("\n"):
-                    if not re.match(f"{namespace} ", _res):
-                        continue
-                    res = _res.split()[1]
-                    logfile = resource_dir / f"{res}.yaml"
-                    res_stdout = kubectl(
-                        f"get {resource_type}/{res} -o yaml 2>&1 | tee {logfile}", namespace=namespace
-                    ).stdout
-                    if resource_type != "pods":
-                        continue
-                    try:
-                        container_names = [c["name"] for c in yaml.safe_load(res_stdout)["spec"]["containers"]]
-                    except KeyError:
-                        # NOTE: pod could be in 'deleting' state during 'list' command
-                        # and be absent during 'get' command. So, just skip it.
-                        continue
-                    os.makedirs(resource_dir / res, exist_ok=True)
-                    for container_name in container_names:
-                        logfile = resource_dir / res / f"{container_name}"
-                        # NOTE: ignore status because it may fail when pod is not ready/running
-                        kubectl(
-                            f"logs pod/{res} -c={container_name} > {logfile}.log",
-                            namespace=namespace,
-                            ignore_status=True,
-                        )
-                        kubectl(
-                            f"logs pod/{res} -c={container_name} --previous=true > {logfile}-previous.log",
-                            namespace=namespace,
-                            ignore_status=True,
-                        )
+        os.makedirs(self.logdir / self.namespace_scope_dir, exist_ok=True)
+        for resource_type in self.kubectl("api-resources --namespaced=true --verbs=get,list -o name").stdout.split():
+            self.submit("resources-list", self.gather_resource_type, resource_type, namespaces)
+
+    def gather_resource_type(self, resource_type: str, namespaces: List[str]) -> None:
+        logfile = self.logdir / self.namespace_scope_dir / f"{resource_type}.wide"
+        resources_wide = self.kubectl(
+            f"get {resource_type} -A -o wide 2>&1 | tee {logfile}", ignore_status=True, verbose=False
+        ).stdout
+        if resource_type.startswith("events"):
+            # NOTE: skip both kinds on 'events' available in k8s
+            return
+        present_in = {line.split(maxsplit=1)[0] for line in resources_wide.splitlines()[1:] if line.strip()}
+        for namespace in namespaces:
+            # NOTE: skip namespaces where such resources are absent
+            if namespace in present_in:
+                self.submit("resources", self.gather_namespaced_resources, resource_type, namespace)
+
+    def gather_namespaced_resources(self, resource_type: str, namespace: str) -> None:
+        """Get all resources of the type in the namespace by one call and save each one to a separate file."""
+
+        LOGGER.info("K8S-LOGS: gathering '%s' resources in the '%s' namespace", resource_type, namespace)
+        resource_dir = self.logdir / self.namespace_scope_dir / namespace / resource_type
+        os.makedirs(resource_dir, exist_ok=True)
+        resources_file = resource_dir / f".{resource_type}.yaml"
+        try:
+            self.kubectl(f"get {resource_type} -o yaml > {resources_file}", namespace=namespace, verbose=False)
+            with open(resources_file, encoding="utf-8") as resources:
+                items = (yaml.load(resources, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}).get("items")
+        finally:
+            resources_file.unlink(missing_ok=True)
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        for item in items or []:
+            res = item["metadata"]["name"]
+            with open(resource_dir / f"{res}.yaml", "w", encoding="utf-8") as resource_file:
+                yaml.dump(item, resource_file, Dumper=dumper, default_flow_style=False)
+            if resource_type == "pods":
+                os.makedirs(resource_dir / res, exist_ok=True)
+                for container in item.get("spec", {}).get("containers", []):
+                    self.gather_container_logs(namespace, res, container["name"], resource_dir / res)
+
+    def gather_container_logs(self, namespace: str, pod: str, container_name: str, pod_dir: Path) -> None:
+        logfile = pod_dir / container_name
+        # NOTE: ignore status because it may fail when pod is not ready/running
+        for kind, suffix, options in (("logs", "", ""), ("previous-logs", "-previous", " --previous=true")):
+            self.submit(
+                kind,
+                self.kubectl,
+                f"logs pod/{pod} -c={container_name}{options} | gzip -c > {logfile}{suffix}.log.gz",
+                namespace=namespace,
+                ignore_status=True,
+                verbose=False,
+            )
 
-                        # NOTE: pick up Scylla container-specific files
-                        if container_name != "scylla":
-                            continue
-                        scylla_container_files_to_copy = (
-                            ("/var/lib/scylla/io_properties.yaml", logfile / "io_properties.yaml"),
-                            ("/etc/scylla.d/", logfile / "etc-scylla-d"),
-                            ("/etc/scylla/", logfile / "etc-scylla"),
-                        )
-                        for src_path, dst_path in scylla_container_files_to_copy:
-                            kubectl(
-                                f"cp {res}:{src_path} {dst_path} -c {container_name}",
-                                namespace=namespace,
-                                ignore_status=True,
-                            )
+        # NOTE: pick up Scylla container-specific files
+        if container_name != "scylla":
+            return
+        for src_path, dst_name in self.scylla_container_files_to_copy:
+            self.submit(
+                "scylla-files",
+                self.kubectl,
+                f"cp {pod}:{src_path} {logfile / dst_name} -c {container_name}",
+                namespace=namespace,
+                ignore_status=True,
+                verbose=False,
+            )
 
 
 class HelmException(Exception): ...
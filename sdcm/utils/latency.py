@@ -11,10 +11,11 @@
 #
 # Copyright (c) 2020 ScyllaDB
 import statistics
+from math import isnan
 from typing import Any
 
 from sdcm.argus_results import LATENCY_ERROR_THRESHOLDS
-from sdcm.db_stats import PrometheusDBStats
+from sdcm.db_stats import PrometheusDBStats, PrometheusQuery
 
 
 def avg(values):
@@ -29,18 +30,36 @@ def collect_latency(monitor_node, start, end, load_type, cluster, nodes_list):
     scylla_precision = ["99"]  # in the future should include also '95', '5'
     threshold = 10  # ms
 
+    if load_type == "mixed":
+        loads = ["read", "write"]
+    elif load_type == "read_disk_only":
+        loads = ["read"]
+    else:
+        loads = [load_type]
+
+    # All queries are independent, so, run them concurrently.
+    cassandra_stress_queries = {}
     for precision in cassandra_stress_precision:
         metric = f"c-s {precision}" if precision == "max" else f"c-s P{precision}"
         if not precision == "max":
             precision = f"perc_{precision}"  # noqa: PLW2901
         query = f'sct_cassandra_stress_{load_type}_gauge{{type="lat_{precision}"}}'
-        query_res = prometheus.query(query, start, end)
+        cassandra_stress_queries[metric] = PrometheusQuery(query, start, end)
+    scylla_queries = {}
+    for load in loads:
+        for precision in scylla_precision:
+            query = (
+                f"histogram_quantile(0.{precision},sum(rate(scylla_storage_proxy_coordinator_{load}_"
+                f"latency_bucket{{}}[{duration}s])) by (instance, le))"
+            )
+            scylla_queries[(load, precision)] = PrometheusQuery(query, start, end)
+    queries_series = prometheus.query_series_many([*cassandra_stress_queries.values(), *scylla_queries.values()])
+
+    for metric, query_res in zip(cassandra_stress_queries, queries_series):
         latency_values_lst = []
         max_latency_values_lst = []
         for entry in query_res:
-            if not entry["values"]:
-                continue
-            sequence = [float(val[-1]) for val in entry["values"] if not val[-1].lower() == "nan"]
+            sequence = [value for value in entry.values if not isnan(value)]
             if not sequence or all(val == sequence[0] for val in sequence):
                 continue
             latency_values_lst.extend(sequence)
@@ -53,38 +72,27 @@ def collect_latency(monitor_node, start, end, load_type, cluster, nodes_list):
         if max_latency_values_lst:
             res[f"{metric} max"] = float(format(max(max_latency_values_lst), ".2f"))
 
-    if load_type == "mixed":
-        load_type = ["read", "write"]
-    elif load_type == "read_disk_only":
-        load_type = ["read"]
-    else:
-        load_type = [load_type]
+    node_names = {}  # resolve each instance only once
 
-    for load in load_type:
-        for precision in scylla_precision:
-            query = (
-                f"histogram_quantile(0.{precision},sum(rate(scylla_storage_proxy_coordinator_{load}_"
-                f"latency_bucket{{}}[{duration}s])) by (instance, le))"
-            )
-            query_res = prometheus.query(query, start, end)
-            for entry in query_res:
-                node_ip = entry["metric"]["instance"].replace("[", "").replace("]", "")
-                node = cluster.get_node_by_ip(node_ip)
-                if not node:
-                    for db_node in nodes_list:
-                        if db_node.ip_address == node_ip:
-                            node = db_node
-                if node:
-                    node_idx = node.name.split("-")[-1]
-                else:
-                    continue
-                node_name = f"node-{node_idx}"
-                metric = f"Scylla P{precision}_{load} - {node_name}"
-                if not entry["values"]:
-                    continue
-                sequence = [float(val[-1]) for val in entry["values"] if not val[-1].lower() == "nan"]
-                if sequence:
-                    res[metric] = float(format(avg(sequence) / 1000, ".2f"))
+    def get_node_name(node_ip):
+        if node_ip not in node_names:
+            node = cluster.get_node_by_ip(node_ip)
+            if not node:
+                for db_node in nodes_list:
+                    if db_node.ip_address == node_ip:
+                        node = db_node
+            node_names[node_ip] = f"node-{node.name.split('-')[-1]}" if node else None
+        return node_names[node_ip]
+
+    for (load, precision), query_res in zip(scylla_queries, queries_series[len(cassandra_stress_queries) :]):
+        for entry in query_res:
+            node_ip = entry.metric["instance"].replace("[", "").replace("]", "")
+            if not (node_name := get_node_name(node_ip)):
+                continue
+            metric = f"Scylla P{precision}_{load} - {node_name}"
+            sequence = [value for value in entry.values if not isnan(value)]
+            if sequence:
+                res[metric] = float(format(avg(sequence) / 1000, ".2f"))
 
     return res
 
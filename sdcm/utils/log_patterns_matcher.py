@@ -0,0 +1,137 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""Match a log line against many regular expressions at once.
+
+Each regex is analyzed once to find literal substrings which any match must contain, e.g.,
+`(^ERROR|!\\s*?ERR).*\\[shard.*\\]' requires `[shard' and one of `error' or `err'.  All distinct literals
+of all regexes are looked up once in a lowercased line (plain substring search is much faster than
+a combined alternation regex with Python's backtracking engine) and only regexes with all requirements
+satisfied are tried, in the original order.  For a typical log line no regex is tried at all.
+"""
+
+import re
+from typing import Iterable, Optional, Sequence, Tuple
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+    from re import _constants as sre_constants
+except ImportError:  # pragma: no cover
+    import sre_parse
+    import sre_constants
+
+REPEAT_OPS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, getattr(sre_constants, "POSSESSIVE_REPEAT", None))
+MIN_LITERAL_LENGTH = 3  # shorter literals are found in almost every line and useless for the prefiltering
+
+# A requirement is a set of literals and at least one of them should be found in a line.
+Requirement = frozenset[str]
+
+
+def _best(requirements: Iterable[Requirement]) -> Optional[Requirement]:
+    return max(requirements, key=lambda req: min(map(len, req)), default=None)
+
+
+def _required_literals(subpattern, ignore_case: bool) -> list[Requirement]:
+    """Return requirements (all should be satisfied) for a parsed regex sequence."""
+
+    requirements = []
+    literal = []
+
+    def flush():
+        if len(literal) >= MIN_LITERAL_LENGTH:
+            requirements.append(frozenset(("".join(literal).lower(),)))
+        literal.clear()
+
+    for op, av in subpattern:
+        if op is sre_constants.LITERAL:
+            if (char := chr(av)).isascii():
+                literal.append(char)
+                continue
+        flush()
+        if op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, group_subpattern = av
+            group_ignore_case = (ignore_case or bool(add_flags & re.IGNORECASE)) and not del_flags & re.IGNORECASE
+            requirements.extend(_required_literals(group_subpattern, ignore_case=group_ignore_case))
+        elif op is sre_constants.BRANCH:
+            branches = [_best(_required_literals(branch, ignore_case=ignore_case)) for branch in av[1]]
+            if branches and all(branches):
+                requirements.append(frozenset().union(*branches))
+        elif op in REPEAT_OPS:
+            min_repeat, _, repeat_subpattern = av
+            if min_repeat:
+                requirements.extend(_required_literals(repeat_subpattern, ignore_case=ignore_case))
+        # All other ops (character sets, anchors, lookarounds, group references, etc.) just break a literal.
+    flush()
+    return requirements
+
+
+def required_literals(pattern: re.Pattern) -> list[Requirement]:
+    """Return literals (lowercased) which should be in a string if the pattern matches it."""
+
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:  # noqa: BLE001
+        return []
+    return _required_literals(parsed, ignore_case=bool(pattern.flags & re.IGNORECASE))
+
+
+class MultiPatternMatcher:
+    """Find the first pattern from a sequence which matches a line.
+
+    Semantic is the same as
+
+        for index, pattern in enumerate(patterns):
+            if match := pattern.search(line):
+                return index, match
+
+    but literals required by the patterns are searched for all patterns at once and patterns which can't match
+    are not tried at all.
+    """
+
+    def __init__(self, patterns: Sequence[re.Pattern]):
+        self.patterns = tuple(patterns)
+        self._requirements = tuple(tuple(required_literals(pattern)) for pattern in self.patterns)
+        self._literals = tuple(sorted({lit for reqs in self._requirements for req in reqs for lit in req}))
+
+        # Patterns without any requirements should be tried for every line.
+        self._unconditional = [index for index, requirements in enumerate(self._requirements) if not requirements]
+
+    def found_literals(self, lowered_line: str) -> frozenset[str]:
+        return frozenset(lit for lit in self._literals if lit in lowered_line)
+
+    def candidates(self, lowered_line: str) -> list[int]:
+        """Return indexes of the patterns which can match the line."""
+
+        if not (found := self.found_literals(lowered_line)):
+            return self._unconditional
+        return [
+            index
+            for index, requirements in enumerate(self._requirements)
+            if all(not found.isdisjoint(req) for req in requirements)
+        ]
+
+    def search(self, line: str, lowered_line: Optional[str] = None) -> Optional[Tuple[int, re.Match]]:
+        """Return the index of the first pattern which matches the line and the match object."""
+
+        if not line.isascii():
+            # Case folding of non-ASCII characters can change a string in many ways, so, don't use the prefilter.
+            candidates = range(len(self.patterns))
+        else:
+            candidates = self.candidates(line.lower() if lowered_line is None else lowered_line)
+        for index in candidates:
+            if match := self.patterns[index].search(line):
+                return index, match
+        return None
+
+
+__all__ = ("MultiPatternMatcher", "required_literals")
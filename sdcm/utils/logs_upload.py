@@ -0,0 +1,245 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import os
+import abc
+import time
+import shutil
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import boto3
+
+from sdcm.utils.common import S3Storage, remove_files
+
+
+LOGS_UPLOAD_MULTIPART_THRESHOLD: int = 64 * 1024 * 1024
+LOGS_UPLOAD_MULTIPART_CHUNKSIZE: int = 16 * 1024 * 1024
+LOGS_UPLOAD_MULTIPART_CONCURRENCY: int = 8  # concurrent part uploads per archive
+LOGS_COMPRESS_WORKERS: int = 4
+LOGS_UPLOAD_WORKERS: int = 4
+
+LOGGER = logging.getLogger(__name__)
+
+CompressFunc = Callable[[], Union[str, List[str], None]]
+
+
+class LogsStorage(abc.ABC):
+    """Storage for archives of collected logs."""
+
+    @abc.abstractmethod
+    def upload(self, file_path: str, dest_dir: str) -> Optional[str]:
+        """Upload a file to `dest_dir' and return a link to it, or empty string/None on failure."""
+
+
+class S3LogsStorage(LogsStorage):
+    """Upload to S3 using multipart uploads for files bigger than `multipart_threshold'.
+
+    Parts of a file are uploaded concurrently by `multipart_concurrency' threads.  boto3 resources are not
+    thread-safe, so, each thread uses its own S3Storage.  The endpoint can be changed by AWS_ENDPOINT_URL
+    environment variable (e.g., to use a local S3-compatible server.)
+    """
+
+    multipart_threshold = LOGS_UPLOAD_MULTIPART_THRESHOLD
+    multipart_chunksize = LOGS_UPLOAD_MULTIPART_CHUNKSIZE
+    multipart_concurrency = LOGS_UPLOAD_MULTIPART_CONCURRENCY
+
+    def __init__(self, bucket: Optional[str] = None):
+        self.bucket = bucket
+        self._local = threading.local()
+
+    @property
+    def s3_storage(self) -> S3Storage:
+        if (s3_storage := getattr(self._local, "s3_storage", None)) is None:
+            s3_storage = self._local.s3_storage = S3Storage(bucket=self.bucket)
+            s3_storage.transfer_config = boto3.s3.transfer.TransferConfig(
+                multipart_threshold=self.multipart_threshold,
+                multipart_chunksize=self.multipart_chunksize,
+                max_concurrency=self.multipart_concurrency,
+                num_download_attempts=s3_storage.num_download_attempts,
+            )
+        return s3_storage
+
+    def upload(self, file_path: str, dest_dir: str) -> Optional[str]:
+        return self.s3_storage.upload_file(file_path=file_path, dest_dir=dest_dir, public=False)
+
+
+class LocalDirLogsStorage(LogsStorage):
+    """Copy files to a local directory, e.g., when there is no access to S3 or for tests."""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def upload(self, file_path: str, dest_dir: str) -> Optional[str]:
+        dest = self.root / dest_dir / os.path.basename(file_path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(file_path, dest)
+        return dest.absolute().as_uri()
+
+
+class UploadedArchive(NamedTuple):
+    archive: str
+    size: int
+    compress_time: float
+    upload_time: float
+    link: Optional[str]
+
+
+class ArchiveUploadPipeline:
+    """Compress logs to archives and upload them with compression and uploading running concurrently.
+
+    Each `submit()' passes a compress function to one of `compress_workers' threads.  As soon as an archive is
+    ready, it's checked by `check_archive' and uploaded by one of `upload_workers' threads, while next sources are
+    compressed.  Sources given as `cleanup' are removed once compressed, and an archive is removed after uploading.
+    Compress functions should create archives in `work_dir', which is a temporary directory removed by `join()'.
+
+    `join()' waits for all uploads and returns the links in the order of submission.  It also logs the sizes
+    and timings of all archives and saves them to `report_path', if given.
+    """
+
+    compress_workers = LOGS_COMPRESS_WORKERS
+    upload_workers = LOGS_UPLOAD_WORKERS
+
+    def __init__(
+        self,
+        storage: LogsStorage,
+        dest_dir: str,
+        check_archive: Optional[Callable[[str], bool]] = None,
+        report_path: Optional[str] = None,
+        name: str = "ArchiveUploadPipeline",
+    ):
+        self.storage = storage
+        self.dest_dir = dest_dir
+        self.check_archive = check_archive
+        self.report_path = report_path
+        self.name = name
+        self.uploaded: List[UploadedArchive] = []
+        self._lock = threading.Lock()
+        self._results: List[List[Future]] = []
+        self._started_at = time.perf_counter()
+        self.work_dir = tempfile.mkdtemp(prefix=f"{name}-")
+        self._compress_executor = ThreadPoolExecutor(self.compress_workers, thread_name_prefix=f"{name}-compress")
+        self._upload_executor = ThreadPoolExecutor(self.upload_workers, thread_name_prefix=f"{name}-upload")
+
+    def submit(self, compress: CompressFunc, cleanup: Optional[List[str]] = None) -> None:
+        """Run `compress()' by a compress worker and upload archive(s) returned by it."""
+
+        uploads = []
+        with self._lock:
+            self._results.append(uploads)
+        done = Future()
+        uploads.append(done)
+        self._compress_executor.submit(self._compress, compress, uploads, done, cleanup or [])
+
+    def _compress(self, compress: CompressFunc, uploads: List[Future], done: Future, cleanup: List[str]) -> None:
+        started_at = time.perf_counter()
+        try:
+            archives = compress()
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.error("%s: failed to create archive: %s", self.name, exc)
+            archives = None
+        compress_time = time.perf_counter() - started_at
+        if isinstance(archives, str):
+            archives = [archives]
+        with self._lock:
+            for archive in archives or []:
+                uploads.append(self._upload_executor.submit(self._upload, archive, compress_time))
+        if archives:
+            for path in cleanup:
+                remove_files(path)
+        done.set_result(None)
+
+    def _upload(self, archive: str, compress_time: float) -> Optional[str]:
+        started_at = time.perf_counter()
+        size = os.path.getsize(archive) if os.path.exists(archive) else 0
+        link = None
+        try:
+            if self.check_archive is None or self.check_archive(archive):
+                link = self.storage.upload(archive, self.dest_dir)
+            else:
+                LOGGER.error("%s: file `%s' will not be uploaded", self.name, archive)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.error("%s: failed to upload `%s': %s", self.name, archive, exc)
+        finally:
+            remove_files(archive)
+        with self._lock:
+            self.uploaded.append(
+                UploadedArchive(
+                    archive=os.path.basename(archive),
+                    size=size,
+                    compress_time=compress_time,
+                    upload_time=time.perf_counter() - started_at,
+                    link=link,
+                )
+            )
+        return link
+
+    def wait_for_archives(self) -> None:
+        """Wait until all submitted sources are compressed (uploads may be still in progress.)"""
+
+        with self._lock:
+            results = list(self._results)
+        for uploads in results:
+            uploads[0].result()
+
+    def join(self) -> List[str]:
+        """Wait for all submitted archives to be uploaded and return their links."""
+
+        links = []
+        try:
+            for uploads in self._results:
+                uploads[0].result()  # archives are added to the list before this future is done
+                links.extend(link for future in uploads[1:] if (link := future.result()))
+        finally:
+            self._compress_executor.shutdown()
+            self._upload_executor.shutdown()
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+        self.report()
+        return links
+
+    def report(self) -> None:
+        with self._lock:
+            uploaded = sorted(self.uploaded, key=lambda row: row.size, reverse=True)
+        total_size = sum(row.size for row in uploaded)
+        elapsed = time.perf_counter() - self._started_at
+        lines = [f"{'archive':<60}{'size, MB':>12}{'compress, s':>14}{'upload, s':>12}  link"]
+        lines.extend(
+            f"{row.archive:<60}{row.size / 1024**2:>12.1f}{row.compress_time:>14.1f}{row.upload_time:>12.1f}"
+            f"  {row.link or 'FAILED'}"
+            for row in uploaded
+        )
+        lines.append(
+            f"{len(uploaded)} archive(s), {total_size / 1024**2:.1f}MB, uploaded in {elapsed:.1f}s"
+            f" ({total_size / 1024**2 / max(elapsed, 0.001):.1f}MB/s)"
+        )
+        report = "\n".join(lines)
+        LOGGER.info("%s: upload report:\n%s", self.name, report)
+        if self.report_path:
+            try:
+                with open(self.report_path, "a", encoding="utf-8") as report_file:
+                    report_file.write(report + "\n")
+            except OSError as exc:
+                LOGGER.warning("%s: unable to save upload report to %s: %s", self.name, self.report_path, exc)
+
+
+__all__ = (
+    "ArchiveUploadPipeline",
+    "LocalDirLogsStorage",
+    "LogsStorage",
+    "S3LogsStorage",
+    "UploadedArchive",
+)
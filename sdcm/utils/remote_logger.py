@@ -16,6 +16,7 @@ from __future__ import annotations
 import os
 import time
 import socket
+import hashlib
 import logging
 import subprocess
 from abc import abstractmethod, ABCMeta
@@ -34,7 +35,7 @@ from urllib3.exceptions import (
     ReadTimeoutError,
 )
 
-from sdcm.remote import RemoteCmdRunnerBase
+from sdcm.remote import RemoteCmdRunnerBase, RemoteLibSSH2CmdRunner
 from sdcm.sct_events import Severity
 from sdcm.sct_events.decorators import raise_event_on_failure
 from sdcm.sct_events.loaders import HDRFileMissed
@@ -119,7 +120,7 @@ class SSHLoggerBase(LoggerBase):
         try:
             # Write the remote PID to a file before running the logger command
             remote_pid_file = f"/tmp/logger_{os.getpid()}.pid"
-            cmd = self._logger_cmd_template.format(since=f'--since "{since}" ' if since else "")
+            cmd = self._logger_cmd(since=since)
             remote_cmd = (
                 f"cat <<'EOF' > /tmp/logger_cmd_{os.getpid()}.sh\n{cmd}\nEOF\n"
                 f"setsid bash /tmp/logger_cmd_{os.getpid()}.sh & echo $! > {remote_pid_file}; wait"
@@ -135,6 +136,9 @@ class SSHLoggerBase(LoggerBase):
                 "Error retrieving remote node DB service log for file %s: %s", self._target_log_file, details
             )
 
+    def _logger_cmd(self, since: str | None) -> str:
+        return self._logger_cmd_template.format(since=f'--since "{since}" ' if since else "")
+
     @cached_property
     def _remoter(self) -> RemoteCmdRunnerBase:
         return self._node.remoter
@@ -147,12 +151,14 @@ class SSHLoggerBase(LoggerBase):
 
 class HDRHistogramFileLogger(SSHLoggerBase):
     VERBOSE_RETRIEVE = False
+    RESUME_CHECKSUM_BLOCK_SIZE = 4096  # bytes
 
-    def __init__(self, node: BaseNode, remote_log_file: str, target_log_file: str):
+    def __init__(self, node: BaseNode, remote_log_file: str, target_log_file: str, compressed_transfer: bool = False):
         super().__init__(node=node, target_log_file=target_log_file)
         self._child_process = None
         self._remote_log_file = remote_log_file
         self.target_log_file = target_log_file
+        self._compressed_transfer = compressed_transfer
         self._child_thread = ThreadPoolExecutor(max_workers=1)
         self._thread = None
         self._lock = Lock()
@@ -180,6 +186,10 @@ class HDRHistogramFileLogger(SSHLoggerBase):
             self._remoter.run(f"pkill -f '{self._remote_log_file}'", ignore_status=True)
             if self._thread.running():
                 self._thread.cancel()
+            if self._remoter is not self._node.remoter:
+                self._remoter.stop()
+                # The dedicated connection is closed, so, create a new one on the next start.
+                del self._remoter
             self._started = False
 
     def remove_remote_log_file(self):
@@ -190,14 +200,65 @@ class HDRHistogramFileLogger(SSHLoggerBase):
         LOGGER.debug("Removing remote log file: %s", self._remote_log_file)
         assert not self._started, "Cannot remove remote log file while logger is running"
         try:
-            self._remoter.run(f"rm -f {self._remote_log_file}", ignore_status=True)
+            self._node.remoter.run(f"rm -f {self._remote_log_file}", ignore_status=True)
         except Exception as e:  # noqa: BLE001
             # this is best effort, so just log the error and continue
             LOGGER.error("Failed to remove remote log file '%s': %s", self._remote_log_file, e)
 
     @cached_property
-    def _logger_cmd_template(self) -> str:
-        return f"tail -f {self._remote_log_file} -c +0"
+    def _remoter(self) -> RemoteCmdRunnerBase:
+        remoter = self._node.remoter
+        if self._compressed_transfer:
+            if isinstance(remoter, RemoteLibSSH2CmdRunner):
+                # Use a dedicated SSH connection with compression enabled to not affect other commands.
+                remoter = RemoteLibSSH2CmdRunner(**remoter.get_init_arguments())
+                remoter.ssh_compression = True
+            else:
+                LOGGER.debug("Compressed transfer is not supported by %s, ignore it", type(remoter).__name__)
+        return remoter
+
+    @cached_property
+    def _logger_cmd_template(self) -> str:  # The `offset' parameter is a 1-based position to start from.
+        return f"tail -f {self._remote_log_file} -c +{{offset}}"
+
+    def _logger_cmd(self, since: str | None) -> str:
+        return self._logger_cmd_template.format(offset=self._received_bytes() + 1)
+
+    def _received_bytes(self) -> int:
+        """
+        Return number of bytes of the remote file which are already in the target file.
+
+        Validate it using a checksum of the last received block, and return 0 (i.e., stream the remote file
+        from the beginning again) if it doesn't match, e.g., if the remote file was recreated.  In this case
+        the target file is truncated, because the streamed data is appended to it.
+        """
+        try:
+            received_bytes = os.path.getsize(self._target_log_file)
+        except OSError:
+            return 0
+        if not received_bytes:
+            return 0
+        block_size = min(received_bytes, self.RESUME_CHECKSUM_BLOCK_SIZE)
+        with open(self._target_log_file, "rb") as target_log_file:
+            target_log_file.seek(received_bytes - block_size)
+            checksum = hashlib.md5(target_log_file.read(block_size)).hexdigest()
+        result = self._remoter.run(
+            f"tail -c +{received_bytes - block_size + 1} {self._remote_log_file} | head -c {block_size} | md5sum",
+            ignore_status=True,
+            verbose=False,
+        )
+        if result.ok and result.stdout.split()[:1] == [checksum]:
+            LOGGER.debug("Resume reading %s from offset %d", self._remote_log_file, received_bytes)
+            return received_bytes
+        LOGGER.warning(
+            "Last %d bytes of %s don't match %s at offset %d, read it from the beginning",
+            block_size,
+            self._target_log_file,
+            self._remote_log_file,
+            received_bytes,
+        )
+        os.truncate(self._target_log_file, 0)
+        return 0
 
     def validate_and_collect_hdr_file(self):
         """
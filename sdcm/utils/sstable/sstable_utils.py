@@ -2,9 +2,11 @@ import datetime
 import json
 import logging
 import random
+import shlex
 from pathlib import Path
 
 from sdcm.paths import SCYLLA_YAML_PATH
+from sdcm.utils.parallel_object import ParallelObject
 from sdcm.utils.version_utils import ComparableScyllaVersion
 from sdcm.exceptions import SstablesNotFound
 
@@ -21,6 +23,16 @@ class SstableUtils:
     """
 
     REMOTE_SSTABLEDUMP_PATH = "/var/tmp/sstabledump.json"
+    TOMBSTONES_COUNT_CONCURRENCY = 4  # max number of sstables dumped on the node at the same time
+    TOMBSTONES_COUNT_TIMEOUT = 3600  # seconds
+
+    # Read a dump as a stream, one partition at a time, and print only counters, like {"partitions":2,"tombstones":1}
+    TOMBSTONES_COUNT_JQ_FILTER = (
+        'reduce (fromstream(3 | truncate_stream(inputs)) | select(type == "object")) as $partition'
+        " ({partitions: 0, tombstones: 0};"
+        " .partitions += 1"
+        ' | .tombstones += (if ($partition | has("tombstone")) or $partition.expired == true then 1 else 0 end))'
+    )
 
     def __init__(
         self,
@@ -38,11 +50,29 @@ class SstableUtils:
         self.user = kwargs.get("user", None)
         self.password = kwargs.get("password", None)
 
-    def count_tombstones(self):
-        sstables = self.get_sstables()
-        tombstones_num = 0
-        for sstable in sstables:
-            tombstones_num += self.count_sstable_tombstones(sstable=sstable)
+    def count_tombstones(self, sample_size: int = 0):
+        """
+        Counts the number of tombstones in all sstables of the table, `TOMBSTONES_COUNT_CONCURRENCY' sstables at a time.
+
+        :param sample_size: If set, count tombstones only in this number of randomly chosen sstables and extrapolate
+                            the result to all sstables (useful for very large tables.)
+        :return: The number of tombstones.
+        """
+        sstables = sampled_sstables = self.get_sstables()
+        if sample_size and len(sstables) > sample_size:
+            sampled_sstables = random.sample(sstables, sample_size)
+        results = ParallelObject(
+            objects=sampled_sstables,
+            timeout=self.TOMBSTONES_COUNT_TIMEOUT,
+            num_workers=self.TOMBSTONES_COUNT_CONCURRENCY,
+            disable_logging=True,
+        ).run(self.count_sstable_tombstones)
+        tombstones_num = sum(result.result for result in results)
+        if len(sampled_sstables) < len(sstables):
+            self.log.debug(
+                "Got %s tombstones in %s sampled sstables of %s", tombstones_num, len(sampled_sstables), len(sstables)
+            )
+            tombstones_num = round(tombstones_num * len(sstables) / len(sampled_sstables))
         self.log.debug("Got %s tombstones for %s", tombstones_num, self.ks_cf)
         return tombstones_num
 
@@ -142,39 +172,39 @@ class SstableUtils:
         """
         Counts the number of tombstones in a given SSTable.
 
+        The dump is piped to `jq' on the node, so, only the counters are sent back.
+
         :param sstable: The SSTable file path.
         :return: The number of tombstones in the SSTable, or 0 if SSTable doesn't exist.
         """
-        if not self._run_sstabledump(sstable=sstable):  # Check if SSTable exists and was dumped
-            self.log.debug("Skipping tombstone count as SSTable %s does not exist or dump failed.", sstable)
-            return 0
-
-        # Fetch the dumped JSON content
-        result = self.db_node.remoter.run(
-            f"sudo cat {self.REMOTE_SSTABLEDUMP_PATH}", verbose=False, ignore_status=False
+        dump_cmd = get_sstable_data_dump_command(node=self.db_node, keyspace=self.keyspace, table=self.table)
+        count_cmd = (
+            f"set -o pipefail; [ -f {sstable} ] || exit 0; "
+            f"{dump_cmd} {sstable} | jq -c -n --stream {shlex.quote(self.TOMBSTONES_COUNT_JQ_FILTER)}"
         )
+        result = self.db_node.remoter.run(f"sudo bash -c {shlex.quote(count_cmd)}", verbose=False, ignore_status=True)
 
         if not result.ok:
-            self.log.debug(
-                "Failed to retrieve SSTable dump data for %s: (%s, %s)", sstable, result.stdout, result.stderr
-            )
+            self.log.error("Failed to count tombstones in SSTable %s: %s", sstable, result.stderr)
+            return 0
+        if not result.stdout.strip():
+            self.log.debug("Skipping tombstone count as SSTable %s does not exist.", sstable)
             return 0
 
         try:
-            dump_data = json.loads(result.stdout)
-            num_tombstones = sum(
-                1
-                for partition in dump_data.get("sstables", {}).get("anonymous", [])
-                if "tombstone" in partition or partition.get("expired") is True
-            )
-
-            self.log.debug("Found %s tombstones in SSTable %s", num_tombstones, sstable)
-            return num_tombstones
-
+            counters = json.loads(result.stdout)
         except json.JSONDecodeError as e:
-            self.log.error("Failed to parse SSTable dump JSON for %s: %s", sstable, str(e))
+            self.log.error("Failed to parse tombstones count for %s: %s", sstable, str(e))
             raise
 
+        self.log.debug(
+            "Found %s tombstones in %s partitions of SSTable %s",
+            counters["tombstones"],
+            counters["partitions"],
+            sstable,
+        )
+        return counters["tombstones"]
+
     def verify_a_live_normal_node_is_used(self):
         if not self.db_node:
             self.db_node = next(node for node in self.db_cluster.data_nodes if node.db_up())
@@ -335,7 +335,7 @@ class YcsbStressThread(DockerBasedStressThread):
         class HDRHistogramFileLoggerCheckForExistingFile(HDRHistogramFileLogger):
             @cached_property
             def _logger_cmd_template(self) -> str:
-                return f"test -f {self._remote_log_file} && tail -f {self._remote_log_file} -c +0"
+                return f"test -f {self._remote_log_file} && tail -f {self._remote_log_file} -c +{{offset}}"
 
             def stop(self):
                 LOGGER.debug(f"Stopping HDR logger {self._remote_log_file} -> {self.target_log_file}")
@@ -360,6 +360,7 @@ class YcsbStressThread(DockerBasedStressThread):
                 node=loader,
                 remote_log_file=f"{loaders_node_path}/hdrh-{work_type}.hdr",
                 target_log_file=f"{master_node_path}/hdrh-{loader_idx}-{work_type}-{cpu_idx}.hdr",
+                compressed_transfer=self.params.get("hdrhistogram_compressed_transfer"),
             )
             contextes.append(hdrh_logger)
             hdrh_logger.remove_remote_log_file()
@@ -0,0 +1,251 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import os
+import gzip
+import json
+import uuid
+import hashlib
+import threading
+import subprocess
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class FakeAgentJob:
+    def __init__(self, command: str, args: list):
+        self.job_id = str(uuid.uuid4())
+        self.command = command
+        self.args = args
+        self.status = "running"
+        self.exit_code = None
+        self.stdout = self.stderr = ""
+        self.created_at = datetime.now(tz=timezone.utc).isoformat()
+        self.process = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+
+    def to_dict(self, stdout_offset: int | None = None, stderr_offset: int | None = None) -> dict:
+        data = {
+            "job_id": self.job_id,
+            "command": self.command,
+            "args": self.args,
+            "status": self.status,
+            "exit_code": self.exit_code,
+            "created_at": self.created_at,
+            "stdout": self.stdout,
+            "stderr": self.stderr,
+        }
+        if stdout_offset is not None:
+            data |= {
+                "stdout": self.stdout[stdout_offset:],
+                "stderr": self.stderr[stderr_offset:],
+                "stdout_offset": stdout_offset,
+                "stderr_offset": stderr_offset,
+            }
+        return data
+
+
+class FakeAgent(ThreadingHTTPServer):
+    """SCT agent API stub which runs commands and transfers files locally.
+
+    With `incremental_output=False' it behaves like an older agent which ignores output offsets and long-polling,
+    and with `files_api=False' -- like an older agent without the files API.  `drop_transfers' is a number of
+    file uploads/downloads which are interrupted in the middle by closing the connection.
+    Each request is recorded in `requests' as (method, path, full path with the query, response size).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, api_key: str = "test-key", incremental_output: bool = True, files_api: bool = True):
+        self.api_key = api_key
+        self.incremental_output = incremental_output
+        self.files_api = files_api
+        self.drop_transfers = 0
+        self.jobs: dict[str, FakeAgentJob] = {}
+        self.requests = []
+        self.changed = threading.Condition()
+
+        agent = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                if url.path == "/health":
+                    self.respond(200, {"status": "healthy"})
+                elif url.path.startswith("/api/v1/files"):
+                    if not agent.files_api:
+                        self.respond(404, {"message": "not found"})
+                    elif url.path == "/api/v1/files/info":
+                        self.respond(200, agent.get_file_info(params["path"], params.get("checksum")))
+                    else:
+                        self.send_file(params["path"], int(params.get("offset", 0)))
+                elif job := self.get_job(url.path):
+                    self.respond(200, agent.get_job_output(job, {k: v[0] for k, v in parse_qs(url.query).items()}))
+
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                job = agent.start_job(payload["command"], payload["args"])
+                self.respond(201, {"job_id": job.job_id, "status": job.status, "created_at": job.created_at})
+
+            def do_PUT(self):
+                url = urlparse(self.path)
+                if not agent.files_api:
+                    self.respond(404, {"message": "not found"})
+                    return
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                if agent.drop_transfers > 0:
+                    agent.drop_transfers -= 1
+                    body = body[: len(body) // 2]  # write a part of the chunk and drop the connection
+                    self.close_connection = True
+                path, offset = params["path"], int(params["offset"])
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "r+b" if offset else "wb") as fobj:
+                    fobj.seek(offset)
+                    fobj.write(body)
+                if "mode" in params:
+                    os.chmod(path, int(params["mode"], 8))
+                if self.close_connection:
+                    self.connection.shutdown(2)
+                    return
+                self.respond(200, {"size": os.path.getsize(path)})
+
+            def send_file(self, path: str, offset: int):
+                with open(path, "rb") as fobj:
+                    fobj.seek(offset)
+                    body = fobj.read()
+                agent.requests.append((self.command, "/api/v1/files", self.path, len(body)))
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body)
+                    self.send_response(200)
+                    self.send_header("Content-Encoding", "gzip")
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if agent.drop_transfers > 0:
+                    agent.drop_transfers -= 1
+                    self.wfile.write(body[: len(body) // 2])
+                    self.wfile.flush()
+                    self.close_connection = True
+                    self.connection.shutdown(2)
+                    return
+                self.wfile.write(body)
+
+            def do_DELETE(self):
+                if job := self.get_job(urlparse(self.path).path):
+                    agent.cancel_job(job)
+                    self.respond(200, {"job_id": job.job_id, "status": job.status})
+
+            def get_job(self, path: str) -> FakeAgentJob | None:
+                if (job := agent.jobs.get(path.rsplit("/", 1)[-1])) is None:
+                    self.respond(404, {"message": "job not found"})
+                return job
+
+            def respond(self, code: int, data: dict):
+                body = json.dumps(data).encode()
+                agent.requests.append((self.command, urlparse(self.path).path, self.path, len(body)))
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        super().__init__(("127.0.0.1", 0), Handler)
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start_job(self, command: str, args: list) -> FakeAgentJob:
+        job = FakeAgentJob(command, args)
+        job.process = subprocess.Popen(
+            [command, *args], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1
+        )
+        self.jobs[job.job_id] = job
+        readers = [
+            threading.Thread(target=self._read_output, args=(job, stream_name), daemon=True)
+            for stream_name in ("stdout", "stderr")
+        ]
+        for reader in readers:
+            reader.start()
+        threading.Thread(target=self._wait_job, args=(job, readers), daemon=True).start()
+        return job
+
+    def _read_output(self, job: FakeAgentJob, stream_name: str) -> None:
+        for line in getattr(job.process, stream_name):
+            with self.changed:
+                setattr(job, stream_name, getattr(job, stream_name) + line)
+                self.changed.notify_all()
+
+    def _wait_job(self, job: FakeAgentJob, readers: list) -> None:
+        exit_code = job.process.wait()
+        for reader in readers:
+            reader.join()
+        with self.changed:
+            if not job.is_finished:
+                job.exit_code = exit_code
+                job.status = "completed" if exit_code == 0 else "failed"
+            self.changed.notify_all()
+
+    def cancel_job(self, job: FakeAgentJob) -> None:
+        with self.changed:
+            job.status = "cancelled"
+            job.process.kill()
+            self.jobs.pop(job.job_id)
+            self.changed.notify_all()
+
+    @staticmethod
+    def get_file_info(path: str, checksum: str | None = None) -> dict:
+        if not os.path.exists(path):
+            return {"exists": False}
+        info = {"exists": True, "is_dir": os.path.isdir(path), "size": os.path.getsize(path)}
+        if checksum == "sha256" and not info["is_dir"]:
+            with open(path, "rb") as fobj:
+                info["sha256"] = hashlib.sha256(fobj.read()).hexdigest()
+        return info
+
+    def get_job_output(self, job: FakeAgentJob, params: dict) -> dict:
+        if not self.incremental_output:
+            return job.to_dict()
+        stdout_offset, stderr_offset = int(params.get("stdout_offset", 0)), int(params.get("stderr_offset", 0))
+        with self.changed:
+            self.changed.wait_for(
+                lambda: job.is_finished or len(job.stdout) > stdout_offset or len(job.stderr) > stderr_offset,
+                timeout=float(params.get("wait", 0)),
+            )
+            return job.to_dict(stdout_offset, stderr_offset)
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        for job in list(self.jobs.values()):
+            if job.process.poll() is None:
+                job.process.kill()
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,179 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import os
+import time
+import threading
+from pathlib import Path
+
+import pytest
+
+from sdcm.remote.agent_cmd_runner import AgentCmdRunner
+from sdcm.utils.agent_client import AgentChecksumError, AgentClient
+from unit_tests.lib.fake_agent import FakeAgent
+
+CHATTY_CMD = "for i in $(seq 1 30); do echo line-$i-$(printf '%0100d' 0); echo err-$i >&2; sleep 0.01; done"
+CHATTY_STDOUT = "".join(f"line-{i}-{'0' * 100}\n" for i in range(1, 31))
+
+
+class LinesWatcher:
+    def __init__(self):
+        self.lines = []
+
+    def submit_line(self, line):
+        self.lines.append(line)
+
+
+@pytest.fixture(params=[True, False], ids=["incremental", "legacy"])
+def agent(request):
+    with FakeAgent(incremental_output=request.param) as agent:
+        yield agent
+
+
+@pytest.fixture
+def runner(agent):
+    runner = AgentCmdRunner(hostname="127.0.0.1", api_key=agent.api_key, port=agent.port)
+    runner.streaming_poll_interval = 0.1
+    yield runner
+    runner.stop()
+
+
+def get_requests(agent):
+    return [request for request in agent.requests if request[0] == "GET" and request[1] != "/health"]
+
+
+def test_wait_for_job(agent):
+    client = AgentClient("127.0.0.1", agent.api_key, port=agent.port)
+    job = client.execute_command("/bin/bash", ["-c", CHATTY_CMD])
+    job = client.wait_for_job(job.job_id, timeout=30, poll_interval=0.05)
+
+    assert job.status == "completed"
+    assert job.exit_code == 0
+    assert job.stdout == CHATTY_STDOUT
+    assert job.stderr == "".join(f"err-{i}\n" for i in range(1, 31))
+    assert client.incremental_output is agent.incremental_output
+    if agent.incremental_output:
+        assert sum(size for *_, size in get_requests(agent)) < 2 * len(CHATTY_STDOUT) + 400 * len(get_requests(agent))
+
+
+def test_wait_for_job_long_polling_returns_on_completion(agent):
+    if not agent.incremental_output:
+        pytest.skip("older agents are polled")
+    client = AgentClient("127.0.0.1", agent.api_key, port=agent.port)
+    job = client.execute_command("/bin/bash", ["-c", "sleep 0.5; echo done"])
+    start_time = time.perf_counter()
+    job = client.wait_for_job(job.job_id, timeout=30, poll_interval=10)
+
+    assert job.stdout == "done\n"
+    assert time.perf_counter() - start_time < 2
+    assert len(get_requests(agent)) <= 3
+
+
+def test_run_streaming_command(agent, runner):
+    watcher = LinesWatcher()
+    job = runner.agent_client.execute_command("/bin/bash", ["-c", CHATTY_CMD])
+    result = runner._handle_streaming_job(
+        job, CHATTY_CMD, [watcher], verbose=False, ignore_status=True, start_time=time.perf_counter()
+    )
+
+    assert result.exited == 0
+    assert result.stdout == CHATTY_STDOUT
+    assert [line for line in watcher.lines if line.startswith("line-")] == CHATTY_STDOUT.splitlines(True)
+    assert sorted(line for line in watcher.lines if line.startswith("err-")) == sorted(
+        f"err-{i}\n" for i in range(1, 31)
+    )
+
+
+def test_incomplete_lines_submitted_once_completed(agent, runner):
+    watcher = LinesWatcher()
+    cmd = "printf 'first '; sleep 0.3; printf 'line\\nsecond '; sleep 0.3; printf 'line'"
+    job = runner.agent_client.execute_command("/bin/bash", ["-c", cmd])
+    runner._handle_streaming_job(job, cmd, [watcher], verbose=False, ignore_status=True, start_time=0)
+
+    assert watcher.lines == ["first line\n", "second line"]
+
+
+def test_cancel_streaming_command(agent, runner):
+    result = {}
+    job = runner.agent_client.execute_command("/bin/bash", ["-c", "echo started; sleep 60"])
+    thread = threading.Thread(
+        target=lambda: result.update(
+            res=runner._handle_streaming_job(job, "journalctl -f", [], verbose=False, ignore_status=True, start_time=0)
+        )
+    )
+    thread.start()
+    while "journalctl -f" not in str(runner._streaming_jobs):
+        time.sleep(0.01)
+    time.sleep(0.3)
+
+    assert runner.cancel_streaming_command("journalctl")
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert not runner._streaming_jobs
+
+
+@pytest.fixture(params=[True, False], ids=["files_api", "legacy"])
+def files_runner(request):
+    with FakeAgent(files_api=request.param) as agent:
+        runner = AgentCmdRunner(hostname="127.0.0.1", api_key=agent.api_key, port=agent.port)
+        runner.agent_client.file_transfer_chunk_size = 64 * 1024
+        runner.fake_agent = agent
+        yield runner
+        runner.stop()
+
+
+def test_send_and_receive_binary_file(files_runner, tmp_path):
+    content = os.urandom(300 * 1024) + bytes(range(256)) * 1024  # random and compressible parts
+    (src := tmp_path / "local" / "scylla-debug.bin").parent.mkdir()
+    src.write_bytes(content)
+    src.chmod(0o750)
+    (remote_dir := tmp_path / "remote").mkdir()
+    files_runner.fake_agent.drop_transfers = 2  # resume one upload chunk and the download
+
+    assert files_runner.send_files(str(src), str(remote_dir))
+    assert (remote_dir / src.name).read_bytes() == content
+    assert files_runner.receive_files(str(remote_dir / src.name), str(tmp_path / "received.bin"))
+    assert (tmp_path / "received.bin").read_bytes() == content
+
+    if files_runner.fake_agent.files_api:
+        assert files_runner.fake_agent.drop_transfers == 0
+        assert (remote_dir / src.name).stat().st_mode & 0o777 == 0o750
+        assert not [request for request in files_runner.fake_agent.requests if request[0] == "POST"]
+
+
+def test_send_and_receive_directory(files_runner, tmp_path):
+    (src := tmp_path / "local" / "hdr").mkdir(parents=True)
+    (src / "sub").mkdir()
+    (src / "a.hdr").write_bytes(os.urandom(1024))
+    (src / "sub" / "b.hdr").write_text("b")
+
+    assert files_runner.send_files(str(src), str(tmp_path / "remote"))
+    assert (tmp_path / "remote" / "hdr" / "sub" / "b.hdr").read_text() == "b"
+    assert (tmp_path / "remote" / "hdr" / "a.hdr").read_bytes() == (src / "a.hdr").read_bytes()
+
+    if files_runner.fake_agent.files_api:
+        assert files_runner.receive_files(str(tmp_path / "remote" / "hdr"), str(tmp_path / "received"))
+        assert (tmp_path / "received" / "sub" / "b.hdr").read_text() == "b"
+        assert (tmp_path / "received" / "a.hdr").read_bytes() == (src / "a.hdr").read_bytes()
+    assert not list(Path("/tmp").glob("sct_agent_transfer_*"))
+
+
+def test_checksum_mismatch(tmp_path, monkeypatch):
+    (src := tmp_path / "file.bin").write_bytes(b"data")
+    with FakeAgent() as agent:
+        monkeypatch.setattr(agent, "get_file_info", lambda path, checksum=None: {"is_dir": False, "sha256": "0"})
+        client = AgentClient("127.0.0.1", agent.api_key, port=agent.port)
+        with pytest.raises(AgentChecksumError):
+            client.upload_file(str(src), str(tmp_path / "uploaded.bin"))
+        with pytest.raises(AgentChecksumError):
+            client.download_file(str(src), str(tmp_path / "downloaded.bin"))
@@ -90,7 +90,10 @@ def test_stop_drains_pending_events(argus_pipeline):
     """stop() posts every event still queued in the aggregator before the thread exits."""
     postman, aggregator = argus_pipeline
     submitted = []
-    postman._argus_client.submit_event.side_effect = lambda event: submitted.append(event)
+    # Events can be submitted one by one or in batches.
+    postman._argus_client.submit_event.side_effect = lambda event: submitted.extend(
+        event if isinstance(event, list) else [event]
+    )
 
     events = [
         argus_event(Severity.WARNING, "warn"),
@@ -126,6 +129,8 @@ def test_stop_is_bounded_when_submit_hangs(argus_pipeline):
         assert elapsed < 10
         postman._argus_client.submit_event.assert_called_once()  # drain was attempted
         assert postman.is_alive()  # the hung submit is still stuck past the timeout
+        # The hung delivery lane must not block interpreter exit either.
+        assert all(thread.daemon for thread in threading.enumerate() if thread.name.startswith(type(postman).__name__))
     finally:
         release.set()  # release the leaked daemon worker
 
@@ -0,0 +1,189 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from cassandra import ConsistencyLevel, InvalidRequest
+from cassandra.cluster import NoHostAvailable
+
+from sdcm.utils.cql_sessions_pool import CQLSessionsPool, PooledScyllaCQLSession
+from unit_tests.lib.fake_cluster import DummyDbCluster
+
+
+class FakeDriverCluster:
+    def __init__(self):
+        self.is_shutdown = False
+
+    def shutdown(self):
+        self.is_shutdown = True
+
+
+class FakeSession:
+    def __init__(self, keyspace=None):
+        self.cluster = FakeDriverCluster()
+        self.keyspace = keyspace
+        self.is_shutdown = False
+        self.open_connections = 1
+        self.default_timeout = 60.0
+        self.default_consistency_level = ConsistencyLevel.ONE
+        self.default_serial_consistency_level = None
+        self.default_fetch_size = 5000
+        self.row_factory = None
+
+    def get_pool_state(self):
+        return {"host": {"shutdown": False, "open_count": self.open_connections}}
+
+    def execute_async(self, query):
+        return query
+
+
+class Connector:
+    def __init__(self):
+        self.sessions = []
+
+    def __call__(self, keyspace=None):
+        self.sessions.append(FakeSession(keyspace=keyspace))
+        return self.sessions[-1]
+
+
+@pytest.fixture
+def pool():
+    pool = CQLSessionsPool()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def connect():
+    return Connector()
+
+
+def test_session_reused_with_defaults_restored(pool, connect):
+    with pool.lease(key="key", connect=connect) as session:
+        session.default_timeout = 300
+        session.default_consistency_level = ConsistencyLevel.ALL
+    with pool.lease(key="key", connect=connect) as reused_session:
+        assert reused_session is session
+        assert reused_session.default_timeout == 60.0
+        assert reused_session.default_consistency_level == ConsistencyLevel.ONE
+        assert "execute_async" in reused_session.__dict__  # verbose wrapper
+
+    assert len(connect.sessions) == 1
+    assert "execute_async" not in session.__dict__
+    assert not session.cluster.is_shutdown
+    assert len(pool) == 1
+
+
+def test_sessions_leased_exclusively(pool, connect):
+    with pool.lease(key="key", connect=connect) as session1, pool.lease(key="key", connect=connect) as session2:
+        assert session1 is not session2
+    with pool.lease(key="other key", connect=connect) as session3:
+        assert session3 not in (session1, session2)
+    assert len(connect.sessions) == 3
+    assert len(pool) == 3
+
+
+def test_unhealthy_session_replaced(pool, connect):
+    with pool.lease(key="key", connect=connect) as session:
+        pass
+    session.open_connections = 0
+    with pool.lease(key="key", connect=connect) as new_session:
+        assert new_session is not session
+    assert session.cluster.is_shutdown
+
+
+@pytest.mark.parametrize("error,discarded", [(NoHostAvailable("", {}), True), (InvalidRequest(), False)])
+def test_session_discarded_on_connection_error(pool, connect, error, discarded):
+    with pytest.raises(type(error)), pool.lease(key="key", connect=connect) as session:
+        raise error
+    assert session.cluster.is_shutdown is discarded
+    assert len(pool) == int(not discarded)
+
+
+def test_session_with_changed_keyspace_discarded(pool, connect):
+    with pool.lease(key="key", connect=connect) as session:
+        session.keyspace = "keyspace1"
+    assert session.cluster.is_shutdown
+    assert len(pool) == 0
+
+
+def test_idle_sessions_evicted(pool, connect):
+    pool.max_idle_per_key = 1
+    with pool.lease(key="key", connect=connect), pool.lease(key="key", connect=connect):
+        pass
+    assert [session.cluster.is_shutdown for session in connect.sessions] == [True, False]
+
+    pool.idle_timeout = 0
+    pool.evict_idle()
+    assert connect.sessions[1].cluster.is_shutdown
+    assert len(pool) == 0
+
+
+def test_idle_sessions_evicted_on_release(pool, connect):
+    with pool.lease(key="key", connect=connect) as session1:
+        pass
+    pool.idle_timeout = 0
+    with pool.lease(key="other key", connect=connect) as session2:
+        pass
+    assert session1.cluster.is_shutdown
+    assert not session2.cluster.is_shutdown
+    assert len(pool) == 1
+
+
+def test_idle_sessions_evicted_without_pool_usage(pool, connect):
+    pool.idle_timeout = 0.1
+    pool.eviction_interval = 0.01
+    with pool.lease(key="key", connect=connect) as session:
+        pass
+    assert not session.cluster.is_shutdown
+
+    deadline = time.perf_counter() + 5
+    while not session.cluster.is_shutdown and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    assert session.cluster.is_shutdown
+    assert len(pool) == 0
+
+
+def test_close(pool, connect):
+    with pool.lease(key="key", connect=connect) as session1:
+        with pool.lease(key="key", connect=connect) as session2:
+            pass
+        pool.close()
+        assert session2.cluster.is_shutdown
+        assert not session1.cluster.is_shutdown
+    assert session1.cluster.is_shutdown
+    assert len(pool) == 0
+
+
+def test_cluster_cql_connections_pooled(connect):
+    node = SimpleNamespace(CQL_PORT=9042, cql_address="10.0.0.1", node_type="scylla-db", ip_address="10.0.0.1")
+    db_cluster = DummyDbCluster(nodes=[node])
+
+    with patch.object(DummyDbCluster, "_connect_session", side_effect=lambda **kwargs: connect(kwargs["keyspace"])):
+        for _ in range(3):
+            cql_session = db_cluster.cql_connection_patient(node)
+            assert isinstance(cql_session, PooledScyllaCQLSession)
+            with cql_session as session:
+                assert session is connect.sessions[0]
+        with db_cluster.cql_connection_patient_exclusive(node, keyspace="keyspace1") as session:
+            assert session.keyspace == "keyspace1"
+        with db_cluster.cql_connection_patient(node, ssl_context=object()) as session:
+            pass
+
+    assert len(connect.sessions) == 3
+    assert connect.sessions[-1].cluster.is_shutdown  # not pooled
+    db_cluster.cql_sessions_pool.close()
+    assert all(session.cluster.is_shutdown for session in connect.sessions)
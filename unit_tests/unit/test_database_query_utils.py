@@ -0,0 +1,93 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from cassandra import OperationTimedOut
+
+from sdcm.utils import database_query_utils
+from sdcm.utils.database_query_utils import PartitionsValidationAttributes
+
+ROWS_PER_PARTITION = {pk: pk * 10 for pk in range(50)}
+
+
+class FakeCountResults:
+    """Replaces execute_concurrent_with_args(): counts rows using ROWS_PER_PARTITION and fails given keys `failures' times."""
+
+    def __init__(self, failing_keys=(), failures=1):
+        self.failures = {key: failures for key in failing_keys}
+        self.calls = []
+
+    def __call__(self, session, statement, parameters, concurrency, raise_on_first_error, results_generator):
+        self.calls.append((statement, [key for (key,) in parameters], concurrency))
+        for (key,) in parameters:
+            if self.failures.get(key):
+                self.failures[key] -= 1
+                yield False, OperationTimedOut(f"failed to count {key}")
+            else:
+                yield True, MagicMock(one=lambda key=key: SimpleNamespace(count=ROWS_PER_PARTITION[key]))
+
+
+@pytest.fixture
+def partitions_attrs(tmp_path, monkeypatch):
+    monkeypatch.setattr(database_query_utils, "PARTITIONS_COUNT_RETRY_DELAY", 0)
+    monkeypatch.setattr(database_query_utils, "get_partition_keys", lambda **_: list(reversed(ROWS_PER_PARTITION)))
+    session = MagicMock(prepare=lambda query: query)
+    db_cluster = MagicMock(cql_connection_patient=lambda **_: nullcontext(session))
+    tester = SimpleNamespace(db_cluster=db_cluster, logdir=str(tmp_path))
+    return PartitionsValidationAttributes(
+        tester=tester,
+        table_name="scylla_bench.test",
+        primary_key_column="pk",
+        limit_rows_number=100,
+        partition_range_with_data_validation="10-40",
+        count_concurrency=7,
+    )
+
+
+def test_collect_partitions_info(partitions_attrs, tmp_path, monkeypatch):
+    fake_results = FakeCountResults(failing_keys=(12, 30))
+    monkeypatch.setattr(database_query_utils, "execute_concurrent_with_args", fake_results)
+
+    partitions = partitions_attrs.collect_partitions_info()
+
+    expected = {pk: ROWS_PER_PARTITION[pk] for pk in range(10, 40)}
+    assert partitions == expected
+    assert list(partitions) == list(range(10, 40))
+    assert (tmp_path / "partitions_rows_before").read_text() == "".join(f"{k}:{v}, " for k, v in expected.items())
+    assert partitions_attrs.partitions_rows_collected
+    assert fake_results.calls == [
+        ("select count(*) from scylla_bench.test where pk = ? LIMIT 100 using timeout 5m", list(range(10, 40)), 7),
+        ("select count(*) from scylla_bench.test where pk = ? LIMIT 100 using timeout 5m", [12, 30], 7),
+    ]
+
+    fake_results.calls.clear()
+    assert partitions_attrs.collect_partitions_info(ignore_limit_rows_number=True) == expected
+    assert fake_results.calls[0][0] == "select count(*) from scylla_bench.test where pk = ? using timeout 5m"
+    assert (tmp_path / "partitions_rows_after").is_file()
+
+
+def test_collect_partitions_info_retries_exceeded(partitions_attrs, tmp_path, monkeypatch, events):
+    fake_results = FakeCountResults(failing_keys=(20,), failures=partitions_attrs.count_retries + 1)
+    monkeypatch.setattr(database_query_utils, "execute_concurrent_with_args", fake_results)
+
+    assert partitions_attrs.collect_partitions_info() is None
+
+    assert len(fake_results.calls) == partitions_attrs.count_retries + 1
+    assert not (tmp_path / "partitions_rows_before").exists()
+    (event,) = events.get_formatted_event_lines()
+    assert "TestFrameworkEvent" in event
+    assert "failed to count 20" in event
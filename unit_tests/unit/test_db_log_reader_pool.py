@@ -0,0 +1,120 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import json
+import shutil
+import time
+
+import pytest
+
+from sdcm.db_log_reader import DbLogReader, DbLogReaderPool
+from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS
+
+from unit_tests.lib.events_utils import EventsUtilsMixin
+
+LOGS = ("system.log", "system_interlace_stall.log", "kernel_callstack.log", "system_core.log")
+COMPARED_ATTRS = ("type", "severity", "line_number", "line", "backtrace", "raw_backtrace")
+
+
+class TestDbLogReaderPool(EventsUtilsMixin):
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.setup_events_processes(events_device=False, events_main_device=True, registry_patcher=True)
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        cls.teardown_events_processes()
+
+    @pytest.fixture(autouse=True)
+    def logs_dir(self, tmp_path, test_data_dir):
+        for log_name in LOGS:
+            shutil.copy(test_data_dir / log_name, tmp_path / log_name)
+        self.logs_dir = tmp_path
+
+    def reader_kwargs(self, log_name, node_prefix):
+        return dict(
+            system_log=str(self.logs_dir / log_name),
+            node_name=f"{node_prefix}-{log_name}",
+            system_event_patterns=SYSTEM_ERROR_EVENTS_PATTERNS,
+            log_lines=False,
+            backtrace_stall_decoding=True,
+            backtrace_decoding_disable_regex=None,
+        )
+
+    def events_of(self, node_prefix):
+        events = {}
+        with open(self.get_raw_events_log(), encoding="utf-8") as raw_events_log:
+            for line in raw_events_log:
+                event = json.loads(line)
+                if str(event.get("node", "")).startswith(f"{node_prefix}-"):
+                    log_name = event["node"].split("-", 1)[1]
+                    events.setdefault(log_name, []).append({attr: event.get(attr) for attr in COMPARED_ATTRS})
+        return events
+
+    def wait_for_events(self, node_prefix, count, timeout=30):
+        end_time = time.perf_counter() + timeout
+        while time.perf_counter() < end_time:
+            if sum(map(len, self.events_of(node_prefix).values())) >= count:
+                break
+            time.sleep(0.1)
+        time.sleep(0.5)  # make sure there are no extra events
+        return self.events_of(node_prefix)
+
+    def test_same_events_as_db_log_reader(self):
+        for log_name in LOGS:
+            DbLogReader(
+                remoter=None, decoding_queue=None, **self.reader_kwargs(log_name, "direct")
+            )._read_and_publish_events()
+        expected = self.wait_for_events("direct", count=1)
+        expected_count = sum(map(len, expected.values()))
+        assert set(expected) == set(LOGS)
+
+        pool = DbLogReaderPool(size=2)
+        readers = [pool.reader(**self.reader_kwargs(log_name, "pooled")) for log_name in LOGS]
+        try:
+            for reader in readers:
+                reader.start()
+            assert len(pool._workers) == 2
+            assert all(reader.is_alive() for reader in readers)
+            assert self.wait_for_events("pooled", count=expected_count) == expected
+
+            # Lines appended to a log after the removal of its reader are not processed.
+            readers[0].stop()
+            assert not readers[0].is_alive()
+            with open(readers[0].system_log, "a", encoding="utf-8") as log_file:
+                log_file.write(
+                    "2024-01-01T00:00:00+00:00 node1 !ERR | scylla[1]: [shard 0] storage - Reactor stalled\n"
+                )
+            # ...but lines appended to other logs are.
+            with open(readers[1].system_log, "a", encoding="utf-8") as log_file:
+                log_file.write(
+                    "2024-01-01T00:00:00+00:00 node1 !ERR | scylla[1]: Reactor stalled for 42 ms on shard 0.\n"
+                )
+            events = self.wait_for_events("pooled", count=expected_count + 1)
+            assert events[LOGS[0]] == expected[LOGS[0]]
+            assert len(events[LOGS[1]]) == len(expected[LOGS[1]]) + 1
+        finally:
+            pool.stop(timeout=10)
+        assert not any(reader.is_alive() for reader in readers)
+
+    def test_log_is_pinned_to_least_loaded_worker(self):
+        pool = DbLogReaderPool(size=2)
+        try:
+            for log_name in LOGS:
+                pool.reader(**self.reader_kwargs(log_name, "pinned")).start()
+            assert len(pool._workers) == 2
+            assert sorted(map(list(pool._log_to_worker.values()).count, pool._workers)) == [2, 2]
+            with pytest.raises(ValueError):
+                pool.reader(**self.reader_kwargs(LOGS[0], "pinned")).start()
+        finally:
+            pool.stop(timeout=10)
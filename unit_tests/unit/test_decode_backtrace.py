@@ -23,7 +23,7 @@ from sdcm.cluster import TestConfig
 from sdcm.db_log_reader import DbLogReader
 from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS
 
-from unit_tests.lib.dummy_remote import DummyRemote
+from unit_tests.lib.dummy_remote import DummyOutput, DummyRemote
 from unit_tests.lib.fake_cluster import DummyNode
 
 
@@ -307,3 +307,83 @@ def test_no_build_id_skips_external_service(monitor_node):
     mock_post.assert_not_called()
     assert event.backtrace is not None
     assert "addr2line" in event.backtrace
+
+
+class Addr2lineRemote(DummyRemote):
+    """Imitate `addr2line -Cpife' output: one frame with an inlined frame per address."""
+
+    def __init__(self):
+        self.commands = []
+
+    def run(self, cmd, *args, **kwargs):
+        self.commands.append(cmd)
+        addresses = cmd.split()[3:]
+        return DummyOutput(
+            "".join(f"func_{addr} at file.cc:1\n (inlined by) caller_{addr} at file.cc:2\n" for addr in addresses)
+        )
+
+
+def expected_addr2line_output(addresses):
+    return "".join(f"func_{addr} at file.cc:1\n (inlined by) caller_{addr} at file.cc:2\n" for addr in addresses)
+
+
+def test_local_decoding_uses_symbols_cache(monitor_node):
+    monitor_node.remoter = Addr2lineRemote()
+
+    with patch("sdcm.cluster.requests.post", side_effect=requests.ConnectionError("connection refused")):
+        first = _run_decode_with_queue_item(monitor_node, "abc123", "0x1\n0x2\n0x3")
+        second = _run_decode_with_queue_item(monitor_node, "abc123", "0x3\n0x4\n0x1\n0x4")
+        third = _run_decode_with_queue_item(monitor_node, "abc123", "0x4\n0x2")
+        other_build = _run_decode_with_queue_item(monitor_node, "def456", "0x1")
+
+    assert first.backtrace == expected_addr2line_output(["0x1", "0x2", "0x3"])
+    assert second.backtrace == expected_addr2line_output(["0x3", "0x4", "0x1", "0x4"])
+    assert third.backtrace == expected_addr2line_output(["0x4", "0x2"])
+    assert other_build.backtrace == expected_addr2line_output(["0x1"])
+    assert monitor_node.remoter.commands == [
+        "addr2line -Cpife scylla_debug_info_file 0x1 0x2 0x3",
+        "addr2line -Cpife scylla_debug_info_file 0x4",
+        "addr2line -Cpife scylla_debug_info_file 0x1",
+    ]
+
+
+def test_symbols_cache_evicts_least_recently_used_frames(monitor_node):
+    monitor_node.remoter = Addr2lineRemote()
+    monitor_node.backtrace_symbols_cache_size = 3
+
+    with patch("sdcm.cluster.requests.post", side_effect=requests.ConnectionError("connection refused")):
+        _run_decode_with_queue_item(monitor_node, "abc123", "0x1\n0x2\n0x3")
+        _run_decode_with_queue_item(monitor_node, "abc123", "0x1")  # 0x2 is the least recently used now
+        _run_decode_with_queue_item(monitor_node, "def456", "0x1")
+        last = _run_decode_with_queue_item(monitor_node, "abc123", "0x3\n0x2\n0x1")
+
+    assert last.backtrace == expected_addr2line_output(["0x3", "0x2", "0x1"])
+    assert list(monitor_node._backtrace_symbols) == [("abc123", "0x3"), ("abc123", "0x1"), ("abc123", "0x2")]
+    assert monitor_node.remoter.commands == [
+        "addr2line -Cpife scylla_debug_info_file 0x1 0x2 0x3",
+        "addr2line -Cpife scylla_debug_info_file 0x1",
+        "addr2line -Cpife scylla_debug_info_file 0x2",
+    ]
+
+
+def test_decode_backtraces_by_pool_of_workers(monitor_node):
+    config = TestConfig()
+    config.DECODING_QUEUE = queue.Queue()
+    config.BACKTRACE_DECODING_WORKERS = 3
+    monitor_node.test_config = config
+    monitor_node.remoter = Addr2lineRemote()
+
+    events = []
+    for idx in range(20):
+        event = MagicMock()
+        event.raw_backtrace = f"0x{idx}\n0x{idx + 1}"
+        event.severity.value = 0
+        events.append(event)
+        config.DECODING_QUEUE.put({"event": event, "node": "test_node", "build_id": None})
+    config.DECODING_QUEUE.put(None)
+
+    monitor_node.decode_backtrace()
+
+    for idx, event in enumerate(events):
+        assert event.backtrace == expected_addr2line_output([f"0x{idx}", f"0x{idx + 1}"])
+        event.publish.assert_called_once()
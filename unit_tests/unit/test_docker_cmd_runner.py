@@ -126,6 +126,35 @@ class TestDockerCmdRunner:
             with pytest.raises(UnexpectedExit):
                 self.runner._execute_command("false", 30, False, True, [])
 
+    def test_execute_command_streams_output_to_watchers(self):
+        mock_container = MagicMock(status="running", id="container-id")
+        api = mock_container.client.api
+        api.exec_create.return_value = {"Id": "exec-id"}
+        api.exec_start.return_value = iter(
+            [(b"line 1\nli", None), (None, b"warn\n"), (b"ne 2\n\xd0", None), (b"\x96 tail", None)]
+        )
+        api.exec_inspect.return_value = {"ExitCode": 3}
+        watcher = MagicMock(spec=["submit", "submit_line"])
+
+        with patch.object(self.runner, "_get_container", return_value=mock_container):
+            result = self.runner._execute_command("cmd", 30, True, True, [watcher], "root")
+
+        assert result.exited == 3
+        assert result.stdout == "line 1\nline 2\n\u0416 tail"
+        assert result.stderr == "warn\n"
+        assert [c.args[0] for c in watcher.submit_line.call_args_list] == [
+            "line 1\n",
+            "warn\n",
+            "line 2\n",
+            "\u0416 tail",
+        ]
+        api.exec_create.assert_called_once_with(
+            "container-id", ["sh", "-c", "cmd"], stdout=True, stderr=True, tty=False, user="root"
+        )
+        api.exec_start.assert_called_once_with("exec-id", stream=True, demux=True)
+        api.exec_inspect.assert_called_once_with("exec-id")
+        mock_container.exec_run.assert_not_called()
+
     @patch("sdcm.remote.docker_cmd_runner.retrying")
     def test_run(self, mock_retrying):
         mock_retrying.return_value = lambda f: f  # No-op decorator
@@ -151,6 +180,8 @@ class TestDockerCmdRunner:
 
         mock_container = MagicMock()
         mock_container.name = "test-container"
+        sent_chunks = []
+        mock_container.put_archive.side_effect = lambda path, data: sent_chunks.extend(data)
 
         with (
             tempfile.NamedTemporaryFile(mode="w", delete=True) as temp_file,
@@ -169,6 +200,8 @@ class TestDockerCmdRunner:
 
         assert result
         mock_container.put_archive.assert_called_once()
+        assert sent_chunks == [b"tar data"]
+        assert mock_tar_stream.closed
         mock_create_tar.assert_called_once_with(temp_file.name, "/dest/path")
 
     @patch("sdcm.remote.docker_cmd_runner.retrying")
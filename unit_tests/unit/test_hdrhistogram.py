@@ -0,0 +1,111 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import random
+
+import pytest
+
+from sdcm.utils.hdrhistogram import _HdrHistogram, _HdrRangeHistogramBuilder, make_hdrhistogram_summary_by_interval
+
+START_TIME = 1_700_000_000
+HDR_TAGS = ["WRITE-rt", "READ-rt"]
+
+
+def write_hdr_file(path, start_time, duration, tags, seed, step=5.0):
+    """Write an hdr log in the same format as cassandra-stress does: relative timestamps and tagged intervals."""
+    rnd = random.Random(seed)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as hdr_file:
+        hdr_file.write("#[Histogram log format version 1.2]\n")
+        hdr_file.write(f"#[StartTime: {start_time:.3f} (seconds since epoch), Tue Nov 14 22:13:20 UTC 2023]\n")
+        hdr_file.write('"StartTimestamp","Interval_Length","Interval_Max","Interval_Compressed_Histogram"\n')
+        offset = 0.0
+        while offset < duration:
+            for tag in tags:
+                histogram = _HdrHistogram()
+                for _ in range(rnd.randint(1, 50)):
+                    histogram.record_value(rnd.randint(100_000, 50_000_000), rnd.randint(1, 10))
+                payload = histogram.encode().decode()
+                hdr_file.write(f"Tag={tag},{offset:.3f},{step:.3f},{histogram.get_max_value() / 1e6:.3f},{payload}\n")
+            offset += step
+
+
+def build_summary_by_intervals_one_by_one(path, hdr_tags, stress_operation, start_time, end_time, interval):
+    """The way `build_histograms_summary_with_interval' worked before: re-read all files per interval and tag."""
+    start_ts, end_ts = int(start_time), int(end_time)
+    window_step = int(end_ts - start_ts) if end_ts - start_ts < interval else interval
+    summary = []
+    for start_interval in range(start_ts, end_ts, window_step):
+        end_interval = min(start_interval + window_step, end_ts)
+        result = {}
+        for hdr_tag in hdr_tags:
+            builder = _HdrRangeHistogramBuilder(
+                hdr_tags=[hdr_tag],
+                stress_operation=stress_operation,
+                start_time=start_interval,
+                end_time=end_interval,
+            )
+            result.update(builder.build_histogram_summary_by_tag(str(path), hdr_tag) or {})
+        if result:
+            summary.append(result)
+    return summary
+
+
+@pytest.fixture(name="hdr_dir", scope="module")
+def fixture_hdr_dir(tmp_path_factory):
+    hdr_dir = tmp_path_factory.mktemp("hdr")
+    for loader in range(3):
+        write_hdr_file(
+            hdr_dir / f"loader-{loader}" / "hdrh-cs-write.hdr",
+            start_time=START_TIME + loader,
+            duration=1200,
+            tags=HDR_TAGS if loader else HDR_TAGS[:1],
+            seed=loader,
+        )
+    (hdr_dir / "loader-3").mkdir()
+    (hdr_dir / "loader-3" / "hdrh-empty.hdr").touch()
+    return hdr_dir
+
+
+@pytest.mark.parametrize(
+    "start_offset, end_offset, interval",
+    (
+        pytest.param(0, 1200, 600, id="two_intervals"),
+        pytest.param(7, 500, 60, id="intervals_on_interval_boundaries"),
+        pytest.param(-100, 2000, 300, id="longer_than_logs"),
+        pytest.param(100, 130, 600, id="shorter_than_interval"),
+    ),
+)
+def test_summary_with_interval_same_as_interval_by_interval(hdr_dir, start_offset, end_offset, interval):
+    kwargs = dict(
+        hdr_tags=HDR_TAGS,
+        stress_operation="write",
+        start_time=START_TIME + start_offset,
+        end_time=START_TIME + end_offset,
+        interval=interval,
+    )
+    expected = build_summary_by_intervals_one_by_one(path=hdr_dir, **kwargs)
+
+    assert expected
+    assert make_hdrhistogram_summary_by_interval(path=str(hdr_dir), **kwargs) == expected
+
+
+def test_summary_with_interval_from_file(hdr_dir):
+    hdr_file = hdr_dir / "loader-1" / "hdrh-cs-write.hdr"
+    kwargs = dict(
+        hdr_tags=HDR_TAGS, stress_operation="write", start_time=START_TIME, end_time=START_TIME + 1200, interval=120
+    )
+    expected = build_summary_by_intervals_one_by_one(path=hdr_file, **kwargs)
+
+    assert len(expected) == 10
+    assert make_hdrhistogram_summary_by_interval(path=str(hdr_file), **kwargs) == expected
@@ -0,0 +1,83 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import subprocess
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from sdcm.remote import LocalCmdRunner
+from sdcm.utils.remote_logger import HDRHistogramFileLogger
+
+
+@pytest.fixture
+def hdr_logger(tmp_path):
+    remote_log_file = tmp_path / "remote.hdr"
+    remote_log_file.write_bytes(b"".join(b"line %d\n" % i for i in range(2000)))
+    node = SimpleNamespace(name="loader-1", remoter=LocalCmdRunner())
+    return HDRHistogramFileLogger(
+        node=node, remote_log_file=str(remote_log_file), target_log_file=str(tmp_path / "target.hdr")
+    )
+
+
+def run_without_follow(cmd):
+    return subprocess.run(cmd.replace("tail -f", "tail"), shell=True, check=True, capture_output=True).stdout
+
+
+def test_start_from_beginning_without_target_file(hdr_logger):
+    assert hdr_logger._logger_cmd(since=None) == f"tail -f {hdr_logger._remote_log_file} -c +1"
+
+
+@pytest.mark.parametrize("received_bytes", [1, 100, 4096, 10000])
+def test_resume_from_received_offset(hdr_logger, received_bytes):
+    with open(hdr_logger._remote_log_file, "rb") as remote_log_file:
+        content = remote_log_file.read()
+    with open(hdr_logger.target_log_file, "wb") as target_log_file:
+        target_log_file.write(content[:received_bytes])
+
+    cmd = hdr_logger._logger_cmd(since=None)
+
+    assert cmd == f"tail -f {hdr_logger._remote_log_file} -c +{received_bytes + 1}"
+    assert content[:received_bytes] + run_without_follow(cmd) == content
+
+
+def test_restart_from_beginning_if_remote_file_changed(hdr_logger):
+    with open(hdr_logger.target_log_file, "wb") as target_log_file:
+        target_log_file.write(b"line 0\nline 1\nsomething else\n")
+
+    cmd = hdr_logger._logger_cmd(since=None)
+
+    assert cmd == f"tail -f {hdr_logger._remote_log_file} -c +1"
+    # The streamed output is appended to the target file (see LogWriteWatcher.)
+    with open(hdr_logger.target_log_file, "ab") as target_log_file:
+        target_log_file.write(run_without_follow(cmd))
+    with open(hdr_logger._remote_log_file, "rb") as remote_log_file, open(hdr_logger.target_log_file, "rb") as target:
+        assert target.read() == remote_log_file.read()
+
+
+def test_compressed_transfer_fallback_to_node_remoter(hdr_logger):
+    hdr_logger._compressed_transfer = True
+
+    assert hdr_logger._remoter is hdr_logger._node.remoter
+
+
+def test_stop_drops_dedicated_remoter(hdr_logger):
+    dedicated_remoter = hdr_logger._remoter = MagicMock()
+    hdr_logger._thread = MagicMock()
+    hdr_logger._started = True
+
+    hdr_logger.stop()
+
+    dedicated_remoter.stop.assert_called_once_with()
+    assert hdr_logger._remoter is hdr_logger._node.remoter
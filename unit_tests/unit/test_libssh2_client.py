@@ -0,0 +1,207 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import time
+from io import StringIO
+from threading import Lock
+
+import pytest
+from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN
+
+from sdcm.remote import RemoteLibSSH2CmdRunner
+from sdcm.remote.base import parse_retain_output
+from sdcm.remote.libssh2_client import Client, SSHReaderThread, TailBuffer
+from sdcm.remote.libssh2_client.result import Result
+
+
+class FakeSession:
+    def __init__(self):
+        self.lock = Lock()
+
+    def simple_select(self, timeout=None):
+        pass
+
+
+class FakeChannel:
+    """Return stdout and stderr chunks one by one, and EAGAIN when there is no more data till EOF."""
+
+    def __init__(self, stdout_chunks, stderr_chunks, delay=0):
+        self.stdout_chunks = list(stdout_chunks)
+        self.stderr_chunks = list(stderr_chunks)
+        self.delay = delay
+
+    @staticmethod
+    def _read(chunks):
+        if chunks:
+            chunk = chunks.pop(0)
+            return len(chunk), chunk
+        return 0, b""
+
+    def read(self):
+        time.sleep(self.delay)
+        return self._read(self.stdout_chunks)
+
+    def read_stderr(self):
+        return self._read(self.stderr_chunks)
+
+    def eof(self):
+        return LIBSSH2_ERROR_EAGAIN if self.stdout_chunks or self.stderr_chunks else 1
+
+
+class LinesWatcher:
+    def __init__(self):
+        self.lines = []
+
+    def submit_line(self, line):
+        self.lines.append(line)
+
+
+def process_output(channel, watchers, stdout=None, stderr=None):
+    stdout = StringIO() if stdout is None else stdout
+    stderr = StringIO() if stderr is None else stderr
+    reader = SSHReaderThread(FakeSession(), channel, timeout=10, timeout_read_data=0.01)
+    assert Client._process_output(watchers, "utf-8", stdout, stderr, reader, timeout=10, timeout_read_data_chunk=0.01)
+    reader.join()
+    return stdout.getvalue(), stderr.getvalue()
+
+
+def test_process_output_splits_chunks_into_lines():
+    watcher = LinesWatcher()
+    stdout, stderr = process_output(
+        FakeChannel(
+            stdout_chunks=[b"line 1\nli", b"ne 2\n", b"line 3\nline 4\nline", b" 5 \xd0\xbf\xd1", b"\x80\xd0\xb8"],
+            stderr_chunks=[b"error 1\n", b"error 2"],
+        ),
+        watchers=[watcher],
+    )
+
+    assert stdout == "line 1\nline 2\nline 3\nline 4\nline 5 при\n"
+    assert stderr == "error 1\nerror 2\n"
+    assert sorted(watcher.lines) == sorted(stdout.splitlines(True) + stderr.splitlines(True))
+
+
+def test_process_output_with_backpressure(monkeypatch):
+    monkeypatch.setattr(SSHReaderThread, "max_buffered_lines", 10)
+    stdout_chunks = [b"".join(b"line %d-%d\n" % (i, j) for j in range(7)) for i in range(100)]
+
+    class SlowWatcher(LinesWatcher):
+        max_buffered = 0
+
+        def __init__(self, reader_lines):
+            super().__init__()
+            self.reader_lines = reader_lines
+
+        def submit_line(self, line):
+            super().submit_line(line)
+            self.max_buffered = max(self.max_buffered, len(self.reader_lines()))
+
+    reader_lines = []
+    watcher = SlowWatcher(lambda: reader_lines[0].stdout if reader_lines else [])
+    original_init = SSHReaderThread.__init__
+
+    def init(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        reader_lines.append(self)
+
+    monkeypatch.setattr(SSHReaderThread, "__init__", init)
+    stdout, _ = process_output(FakeChannel(stdout_chunks, []), watchers=[watcher])
+
+    assert stdout == b"".join(stdout_chunks).decode()
+    assert len(watcher.lines) == 700
+    # The reader may add one chunk above the limit before it waits for the consumer.
+    assert watcher.max_buffered <= 10 + 7
+
+
+def test_process_output_ignores_watcher_errors():
+    class FailingWatcher:
+        def submit_line(self, line):
+            raise ValueError(line)
+
+    watcher = LinesWatcher()
+    stdout, _ = process_output(FakeChannel([b"line 1\nline 2\n"], []), watchers=[FailingWatcher(), watcher])
+
+    assert stdout == "line 1\nline 2\n"
+    assert watcher.lines == []
+
+
+def test_process_output_into_tail_buffer():
+    stdout, _ = process_output(
+        FakeChannel([b"%05d\n" % i for i in range(1000)], []), watchers=[], stdout=TailBuffer(size=15)
+    )
+
+    assert stdout == "00997\n00998\n00999\n"[-15:]
+
+
+@pytest.mark.parametrize("size", [0, 1, 5, 10, 100])
+def test_tail_buffer(size):
+    buffer, expected = TailBuffer(size=size), ""
+    for i in range(50):
+        data = "x" * (i % 7) + str(i)
+        assert buffer.write(data) == len(data)
+        expected += data
+        assert buffer.getvalue() == (expected[-size:] if size else "")
+
+
+@pytest.mark.parametrize(
+    "retain_output,expected",
+    [
+        (None, None),
+        ("all", None),
+        ("tail:0", 0),
+        ("tail:4096", 4096),
+        ("tail:100B", 100),
+        ("tail:8KB", 8 * 1024),
+        ("tail: 1MB", 1024**2),
+        ("tail:1mb", 1024**2),
+        ("tail:2G", 2 * 1024**3),
+    ],
+)
+def test_parse_retain_output(retain_output, expected):
+    assert parse_retain_output(retain_output) == expected
+
+
+@pytest.mark.parametrize("retain_output", ["", "head:1MB", "tail:", "tail:1TB", "tail:-1"])
+def test_parse_retain_output_wrong_value(retain_output):
+    with pytest.raises(ValueError):
+        parse_retain_output(retain_output)
+
+
+@pytest.mark.parametrize("supports_output_tail", [True, False])
+def test_run_with_retain_output(supports_output_tail, tmp_path):
+    class FakeConnection:
+        def __init__(self):
+            self.kwargs = None
+
+        def run(self, **kwargs):
+            self.kwargs = kwargs
+            output = "".join(f"line {i}\n" for i in range(100))
+            if tail_size := kwargs.get("output_tail_size"):
+                output = output[-tail_size:]
+            return Result(stdout=output, stderr="", exited=0, command=kwargs["command"])
+
+    class FakeRemoter(RemoteLibSSH2CmdRunner):
+        def _is_connection_generation_ok(self, connection):
+            return True
+
+    connection = FakeConnection()
+    remoter = FakeRemoter(hostname="127.0.0.1")
+    remoter.supports_output_tail = supports_output_tail
+    setattr(remoter.connection_thread_map, str(id(remoter)), connection)
+    try:
+        result = remoter.run("cmd", log_file=str(tmp_path / "cmd.log"), retain_output="tail:16", verbose=False)
+    finally:
+        delattr(remoter.connection_thread_map, str(id(remoter)))
+
+    assert ("output_tail_size" in connection.kwargs) is supports_output_tail
+    assert result.stdout == "line 98\nline 99\n"
+    assert result.log_file == str(tmp_path / "cmd.log")
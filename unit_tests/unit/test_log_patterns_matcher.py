@@ -0,0 +1,114 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import re
+import time
+import logging
+
+import pytest
+
+from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS, get_pattern_to_event_to_func_mapping
+from sdcm.utils.log_patterns_matcher import MultiPatternMatcher, required_literals
+
+LOGGER = logging.getLogger(__name__)
+
+
+def linear_search(patterns, line):
+    for index, pattern in enumerate(patterns):
+        if match := pattern.search(line):
+            return index, match.span()
+    return None
+
+
+def matcher_search(matcher, line):
+    if found := matcher.search(line):
+        return found[0], found[1].span()
+    return None
+
+
+def recorded_log_lines(test_data_dir):
+    lines = []
+    for log_name in ("system.log", "system_core.log", "system_interlace_stall.log", "kernel_callstack.log"):
+        lines.extend((test_data_dir / log_name).read_text(encoding="utf-8").splitlines(keepends=True))
+    return lines
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    (
+        pytest.param(re.compile(r"Reactor stalled", re.IGNORECASE), [{"reactor stalled"}], id="literal"),
+        pytest.param(re.compile(r"(^ERROR|!\s*?ERR).*\[shard.*\]"), [{"error", "err"}, {"[shard"}], id="branch"),
+        pytest.param(re.compile(r"a(bcd)?e"), [], id="optional_group"),
+        pytest.param(re.compile(r"(?:foo)+bar\d+baz"), [{"foo"}, {"bar"}, {"baz"}], id="repeat"),
+        pytest.param(re.compile(r"(abc|d)xyz"), [{"xyz"}], id="short_branch"),
+        pytest.param(re.compile(r"\w+"), [], id="no_literals"),
+    ),
+)
+def test_required_literals(pattern, expected):
+    assert [set(req) for req in required_literals(pattern)] == expected
+
+
+def test_first_matched_pattern_wins():
+    patterns = [re.compile("a+bcd"), re.compile("abc"), re.compile(r"\d+")]
+    matcher = MultiPatternMatcher(patterns)
+
+    assert matcher.search("xx abcd 42")[0] == 0
+    assert matcher.search("xx abc 42")[0] == 1
+    assert matcher.search("xx ABC 42")[0] == 2
+    assert matcher.search("no match here") is None
+    assert matcher.candidates("no match here") == [2]
+
+
+def test_non_ascii_lines_are_not_prefiltered():
+    matcher = MultiPatternMatcher([re.compile("kelvin", re.IGNORECASE)])
+
+    # KELVIN SIGN is lowercased to ASCII `k'.
+    assert matcher.search("Kelvin")[0] == 0
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    (
+        pytest.param([pattern for pattern, _ in SYSTEM_ERROR_EVENTS_PATTERNS], id="system_error_events"),
+        pytest.param([item.pattern for item in get_pattern_to_event_to_func_mapping(node="node1")], id="continuous"),
+    ),
+)
+def test_same_results_as_linear_search(test_data_dir, patterns):
+    matcher = MultiPatternMatcher(patterns)
+    lines = recorded_log_lines(test_data_dir)
+
+    assert [matcher_search(matcher, line) for line in lines] == [linear_search(patterns, line) for line in lines]
+
+
+@pytest.mark.benchmark
+def test_log_patterns_matcher_benchmark(test_data_dir):
+    patterns = [pattern for pattern, _ in SYSTEM_ERROR_EVENTS_PATTERNS]
+    matcher = MultiPatternMatcher(patterns)
+    lines = recorded_log_lines(test_data_dir) * 2
+
+    start = time.perf_counter()
+    expected = [linear_search(patterns, line) for line in lines]
+    linear_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [matcher_search(matcher, line) for line in lines]
+    matcher_duration = time.perf_counter() - start
+
+    LOGGER.info(
+        "%d lines: linear search %.2f lines/sec, multi-pattern matcher %.2f lines/sec",
+        len(lines),
+        len(lines) / linear_duration,
+        len(lines) / matcher_duration,
+    )
+    assert results == expected
+    assert matcher_duration < linear_duration
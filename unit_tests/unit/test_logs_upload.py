@@ -0,0 +1,232 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import os
+import time
+import uuid
+import threading
+import subprocess
+from functools import partial
+from types import SimpleNamespace
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from sdcm.logcollector import LogCollector
+from sdcm.utils.common import S3Storage, list_logs_by_test_id
+from sdcm.utils.logs_upload import ArchiveUploadPipeline, LocalDirLogsStorage, LogsStorage, S3LogsStorage
+
+
+class SlowStorage(LocalDirLogsStorage):
+    """Local storage which counts concurrent uploads."""
+
+    def __init__(self, root, delay=0.1):
+        super().__init__(root)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = self.max_in_flight = 0
+
+    def upload(self, file_path, dest_dir):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return super().upload(file_path, dest_dir)
+
+
+def make_archive(path, content=b"data"):
+    def compress():
+        time.sleep(0.05)
+        with open(path, "wb") as archive:
+            archive.write(content)
+        return str(path)
+
+    return compress
+
+
+def test_archive_upload_pipeline(tmp_path):
+    storage = SlowStorage(tmp_path / "storage")
+    src = tmp_path / "src"
+    src.mkdir()
+    report = tmp_path / "upload.report"
+    pipeline = ArchiveUploadPipeline(storage=storage, dest_dir="test-id/run", report_path=str(report))
+
+    for num in range(8):
+        pipeline.submit(make_archive(tmp_path / f"node-{num}.tar.zst", content=b"x" * num), cleanup=[str(src)])
+    pipeline.submit(lambda: [make_archive(tmp_path / f"chunk-{num}.zst")() for num in range(2)])
+    pipeline.submit(lambda: 1 / 0)
+    links = pipeline.join()
+
+    names = [f"node-{num}.tar.zst" for num in range(8)] + ["chunk-0.zst", "chunk-1.zst"]
+    assert links == [(tmp_path / "storage" / "test-id" / "run" / name).as_uri() for name in names]
+    assert (tmp_path / "storage" / "test-id" / "run" / "node-7.tar.zst").read_bytes() == b"x" * 7
+    assert 1 < storage.max_in_flight <= pipeline.upload_workers
+    assert not list(tmp_path.glob("*.zst"))
+    assert not src.exists()
+    assert sorted(row.archive for row in pipeline.uploaded) == sorted(names)
+    assert "10 archive(s)" in report.read_text()
+    assert not os.path.exists(pipeline.work_dir)
+
+
+def test_archive_upload_pipeline_skips_bad_archives(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    pipeline = ArchiveUploadPipeline(
+        storage=LocalDirLogsStorage(tmp_path / "storage"),
+        dest_dir="run",
+        check_archive=lambda archive: "bad" not in archive,
+    )
+    pipeline.submit(make_archive(tmp_path / "good.zst"))
+    pipeline.submit(make_archive(tmp_path / "bad.zst"))
+    pipeline.submit(lambda: None, cleanup=[str(src)])
+
+    assert pipeline.join() == [(tmp_path / "storage" / "run" / "good.zst").as_uri()]
+    assert [row.link is None for row in pipeline.uploaded if row.archive == "bad.zst"] == [True]
+    assert src.exists()  # nothing was archived, so, nothing removed
+    assert not (tmp_path / "bad.zst").exists()
+
+
+def test_s3_logs_storage_multipart_upload(tmp_path, monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    archive = tmp_path / "db-node-1.tar.zst"
+    content = os.urandom(12 * 1024 * 1024)
+    archive.write_bytes(content)
+
+    with mock_aws():
+        s3 = boto3.resource("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=S3Storage.bucket_name)
+        storage = S3LogsStorage()
+        storage.multipart_threshold = storage.multipart_chunksize = 5 * 1024 * 1024
+
+        link = storage.upload(str(archive), "test-id/run")
+
+        assert link == f"https://{S3Storage.bucket_name}.s3.amazonaws.com/test-id/run/db-node-1.tar.zst"
+        obj = s3.Object(S3Storage.bucket_name, "test-id/run/db-node-1.tar.zst").get()
+        assert obj["Body"].read() == content
+        assert obj["ETag"].endswith('-3"')  # uploaded by 3 parts
+
+
+class FileLogEntity:
+    name = "file.log"
+
+    def __init__(self, collect_from_parent=False):
+        self.collect_from_parent = collect_from_parent
+
+    def set_params(self, params):
+        pass
+
+    def collect(self, node, local_dst, remote_dst=None, local_search_path=None):
+        os.makedirs(local_dst, exist_ok=True)
+        with open(os.path.join(local_dst, f"{node.name}-{self.name}"), "w", encoding="utf-8") as log_file:
+            log_file.write(f"log of {node.name}")
+
+
+class FakeLogCollector(LogCollector):
+    cluster_log_type = "fake-db"
+    log_entities = [FileLogEntity(), FileLogEntity(collect_from_parent=True)]
+    archive_per_node_min_nodes = 3
+
+    def create_remote_storage_dir(self, node, path=""):
+        return self.node_remote_dir
+
+
+class FakeLoaderLogCollector(FakeLogCollector):
+    cluster_log_type = "loader-set"
+
+
+def archived_files(archive_path) -> set[str]:
+    listing = subprocess.run(["tar", "--zstd", "-tf", str(archive_path)], capture_output=True, text=True, check=True)
+    return {name for name in listing.stdout.split() if not name.endswith("/")}
+
+
+@pytest.mark.parametrize("nodes_count,archives_count", [(2, 1), (4, 5)])
+def test_log_collector_archives_per_node(tmp_path, monkeypatch, nodes_count, archives_count):
+    monkeypatch.chdir(tmp_path)
+    test_id = str(uuid.uuid4())
+    nodes = [SimpleNamespace(name=f"db-node-{num}") for num in range(nodes_count)]
+    collector = FakeLogCollector(nodes=nodes, test_id=test_id, storage_dir=str(tmp_path / "collected"), params={})
+    collector.logs_storage = LocalDirLogsStorage(tmp_path / "storage")
+
+    links = collector.collect_logs()
+
+    assert len(links) == archives_count
+    uploaded = tmp_path / "storage" / test_id / collector.current_run
+    cluster_archive = f"fake-db-{test_id[:8]}.tar.zst"
+    assert os.path.basename(links[-1]) == cluster_archive
+    expected = {f"fake-db-{test_id[:8]}/db-node-{num}-file.log" for num in range(nodes_count)}
+    if archives_count == 1:
+        expected |= {f"fake-db-{test_id[:8]}/db-node-{num}/db-node-{num}-file.log" for num in range(nodes_count)}
+    else:
+        for num in range(nodes_count):
+            node_archive = uploaded / f"fake-db-{test_id[:8]}-db-node-{num}.tar.zst"
+            assert archived_files(node_archive) == {f"fake-db-{test_id[:8]}-db-node-{num}/db-node-{num}-file.log"}
+    assert archived_files(uploaded / cluster_archive) == expected
+    assert not os.path.exists(collector.local_dir)
+    assert not list(tmp_path.glob("*.tar.zst"))
+    assert (tmp_path / "collected" / collector.current_run / "upload.report").is_file()
+
+
+def test_log_collector_archives_per_node_listed_by_test_id(tmp_path, monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    test_id = str(uuid.uuid4())
+    nodes = [SimpleNamespace(name=f"loader-node-{num}") for num in range(4)]
+    collector = FakeLoaderLogCollector(nodes=nodes, test_id=test_id, storage_dir=str(tmp_path / "collected"), params={})
+
+    with mock_aws():
+        boto3.resource("s3", region_name="us-east-1").create_bucket(Bucket=S3Storage.bucket_name)
+        links = collector.collect_logs()
+        logs = list_logs_by_test_id(test_id)
+
+    assert len(links) == 5
+    assert sorted(log["s3_url"] for log in logs) == sorted(links)
+    assert {log["type"] for log in logs} == {"loader-set"}
+
+
+class ExtractingStorage(LogsStorage):
+    """Keep content of the uploaded archives."""
+
+    def __init__(self):
+        self.uploaded = []
+
+    def upload(self, file_path, dest_dir):
+        content = subprocess.run(["tar", "--zstd", "-xOf", file_path], capture_output=True, check=True).stdout
+        self.uploaded.append(content)
+        return file_path
+
+
+def test_log_collector_archives_files_with_same_names(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    collector = FakeLogCollector(
+        nodes=[], test_id=str(uuid.uuid4()), storage_dir=str(tmp_path / "collected"), params={}
+    )
+    storage = ExtractingStorage()
+    pipeline = ArchiveUploadPipeline(storage=storage, dest_dir="run")
+    for num in range(8):
+        src_file = tmp_path / "src" / str(num) / "file.log"
+        src_file.parent.mkdir(parents=True)
+        src_file.write_text(f"log {num}")
+        pipeline.submit(partial(collector.archive_to_tarfile, str(src_file), archive_dir=pipeline.work_dir))
+
+    links = pipeline.join()
+
+    assert len(set(links)) == 8
+    assert sorted(storage.uploaded) == [b"log %d" % num for num in range(8)]
+    assert not os.path.exists(pipeline.work_dir)
+    assert not list(tmp_path.glob("*.tar.zst"))
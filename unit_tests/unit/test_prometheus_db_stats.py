@@ -0,0 +1,186 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import json
+import math
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from sdcm.db_stats import PROMETHEUS_QUERY_CACHE, PrometheusDBStats, PrometheusQuery
+from sdcm.utils import latency
+
+SCRAPE_INTERVAL = 20
+CONFIG = {"yaml": f"scrape_configs:\n- job_name: scylla\n  scrape_interval: {SCRAPE_INTERVAL}s\n"}
+
+
+class PrometheusStub(ThreadingHTTPServer):
+    """Prometheus HTTP API stub which responds to range queries with `series' and counts concurrent requests."""
+
+    daemon_threads = True
+
+    def __init__(self, series: dict, delay: float = 0):
+        self.series = series
+        self.delay = delay
+        self.queries = []
+        self.connections = set()
+        self.in_flight = self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path == "/api/v1/status/config":
+                    self.respond(CONFIG)
+                    return
+                params = {key: value[0] for key, value in parse_qs(url.query).items()}
+                with stub.lock:
+                    stub.queries.append(params)
+                    stub.connections.add(self.client_address)
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                time.sleep(stub.delay)
+                with stub.lock:
+                    stub.in_flight -= 1
+                self.respond({"resultType": "matrix", "result": stub.series.get(params["query"], [])})
+
+            def respond(self, data):
+                body = json.dumps({"status": "success", "data": data}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        super().__init__(("127.0.0.1", 0), Handler)
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+@pytest.fixture(autouse=True)
+def clear_query_cache():
+    PROMETHEUS_QUERY_CACHE.clear()
+    yield
+    PROMETHEUS_QUERY_CACHE.clear()
+
+
+def series(metric: dict, *values) -> dict:
+    return {
+        "metric": metric,
+        "values": [[1000 + num * SCRAPE_INTERVAL, str(value)] for num, value in enumerate(values)],
+    }
+
+
+def test_query_aligned_to_step_and_cached():
+    with PrometheusStub(series={"up": [series({}, 1, 2)]}) as stub:
+        prometheus = PrometheusDBStats(host="127.0.0.1", port=stub.server_address[1])
+
+        assert prometheus.query("up", start=1005, end=1235) == [series({}, 1, 2)]
+        assert prometheus.query("up", start=1001, end=1239.5) == [series({}, 1, 2)]
+        assert stub.queries == [{"query": "up", "start": "1000", "end": "1220", "step": str(SCRAPE_INTERVAL)}]
+
+        now = time.time()
+        prometheus.query("up", start=now - 60, end=now)
+        prometheus.query("up", start=now - 60, end=now)
+        assert len(stub.queries) == 3  # recent results are not cached
+        assert len(PROMETHEUS_QUERY_CACHE) == 1
+
+        # Recent ranges are not aligned, so, a point query at now is not moved to the past.
+        assert {(query["start"], query["end"]) for query in stub.queries[1:]} == {(str(now - 60), str(now))}
+        prometheus.query("up", start=now, end=now)
+        assert (stub.queries[-1]["start"], stub.queries[-1]["end"]) == (str(now), str(now))
+
+
+def test_query_many_concurrently():
+    queries = [PrometheusQuery(f"metric{num}", 1000, 2000) for num in range(16)]
+    with PrometheusStub(
+        series={query.query: [series({}, num)] for num, query in enumerate(queries)}, delay=0.1
+    ) as stub:
+        prometheus = PrometheusDBStats(host="127.0.0.1", port=stub.server_address[1])
+        results = prometheus.query_series_many(queries)
+
+    assert [[list(result.values) for result in results_] for results_ in results] == [[[num]] for num in range(16)]
+    assert 1 < stub.max_in_flight <= prometheus.query_workers
+    assert len(stub.connections) <= prometheus.query_workers + 1  # +1 for the configuration request
+
+
+def test_query_series_parsing():
+    with PrometheusStub(series={"up": [series({"instance": "a"}, 1, "NaN", 2.5)]}) as stub:
+        prometheus = PrometheusDBStats(host="127.0.0.1", port=stub.server_address[1])
+        (result,) = prometheus.query_series("up", 1000, 2000)
+
+    assert result.metric == {"instance": "a"}
+    assert list(result.timestamps) == [1000, 1020, 1040]
+    assert result.values[0] == 1 and math.isnan(result.values[1]) and result.values[2] == 2.5
+
+
+def test_collect_latency(monkeypatch):
+    cs_query = 'sct_cassandra_stress_write_gauge{type="lat_perc_%s"}'
+    scylla_query = (
+        "histogram_quantile(0.99,sum(rate(scylla_storage_proxy_coordinator_write_latency_bucket{}[1000s]))"
+        " by (instance, le))"
+    )
+    prometheus_series = {
+        cs_query % 99: [series({}, 2, "NaN", 4), series({}, 5, 5)],
+        cs_query % 95: [series({}, 1, 30)],
+        scylla_query: [
+            series({"instance": "[10.0.0.1]", "shard": "0"}, 1000, 3000),
+            series({"instance": "[10.0.0.1]", "shard": "1"}, 1000, 3000),
+            series({"instance": "10.0.0.2"}, 500),
+            series({"instance": "10.0.0.3"}, 500),
+        ],
+    }
+    nodes = {"10.0.0.1": SimpleNamespace(name="db-node-1"), "10.0.0.2": SimpleNamespace(name="db-node-2")}
+    resolved = []
+
+    def get_node_by_ip(node_ip):
+        resolved.append(node_ip)
+        return nodes.get(node_ip)
+
+    with PrometheusStub(series=prometheus_series) as stub:
+        monitor_node = SimpleNamespace(external_address="127.0.0.1")
+        cluster = SimpleNamespace(get_node_by_ip=get_node_by_ip)
+        monkeypatch.setattr(
+            latency, "PrometheusDBStats", lambda host: PrometheusDBStats(host="127.0.0.1", port=stub.server_address[1])
+        )
+        result = latency.collect_latency(monitor_node, 1000, 2000, "write", cluster, nodes_list=[])
+
+    assert result == {
+        "c-s P99": 3.0,
+        "c-s P99_stdev": 1.41,
+        "c-s P99_points_above_threshold": 0,
+        "c-s P99 max": 4.0,
+        "c-s P95": 15.5,
+        "c-s P95_stdev": 20.51,
+        "c-s P95_points_above_threshold": 1,
+        "c-s P95 max": 30.0,
+        "Scylla P99_write - node-1": 2.0,
+        "Scylla P99_write - node-2": 0.5,
+    }
+    assert resolved == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
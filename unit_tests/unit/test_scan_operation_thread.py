@@ -7,6 +7,7 @@ test_scan_negative_operation_timed_out - getting operation_timed_out in scan exe
 test_scan_negative_exception - getting operation_timed_out in scan execution (with and without nemesis)
 """
 
+import random
 from threading import Event
 from importlib import reload
 from unittest.mock import MagicMock, patch
@@ -20,6 +21,7 @@ from sdcm.utils.issues import SkipPerIssues
 from sdcm.test_config import TestConfig
 import sdcm.scan_operation_thread
 from sdcm.scan_operation_thread import ScanOperationThread, ThreadParams, PrometheusDBStats
+from sdcm.utils.operations_thread import OperationThreadStats
 
 
 def mock_retrying_decorator(*args, **kwargs):
@@ -211,3 +213,41 @@ def test_scan_negative_running_nemesis(mode, severity, running_nemesis, execute_
     all_events = get_event_log_file(events)
     assert "Severity.NORMAL" in all_events[0] and "period_type=begin" in all_events[0]
     assert f"Severity.{severity}" in all_events[1] and "period_type=end" in all_events[1]
+
+
+@pytest.mark.parametrize(
+    ("normal_rows", "reversed_rows", "limit", "mismatches", "first_mismatch"),
+    [
+        [range(10), range(9, -1, -1), "", 0, None],
+        [range(10), range(9, 4, -1), 5, 0, None],
+        [range(10), range(9, 4, -1), "", 5, "6: 14 | <missing>"],
+        [range(10), [9, 8, 0, 5], "", 8, "3: 17 | 10"],
+        [range(300), range(300), "", 300, "1: 1299 | 10"],
+    ],
+)
+def test_partition_scan_compare_output_files(
+    normal_rows, reversed_rows, limit, mismatches, first_mismatch, cluster, tmp_path
+):
+    thread_params = ThreadParams(db_cluster=cluster, ks_cf="a.b", mode="partition", **DEFAULT_PARAMS)
+    scan_operation = sdcm.scan_operation_thread.FullPartitionScanOperation(
+        generator=random.Random(1), thread_params=thread_params, thread_stats=OperationThreadStats()
+    )
+    scan_operation.limit = limit
+    scan_operation.normal_query_output.writelines(f"1{row}\n" for row in normal_rows)
+    scan_operation.reversed_query_output.writelines(f"1{row}\n" for row in reversed_rows)
+    output_files = (scan_operation.normal_query_output.name, scan_operation.reversed_query_output.name)
+
+    with patch.object(TestConfig, "logdir", return_value=str(tmp_path)):
+        assert scan_operation._compare_output_files() is (mismatches == 0)
+
+    assert output_files != (scan_operation.normal_query_output.name, scan_operation.reversed_query_output.name)
+    diff_logs = list((tmp_path / "fullscans").glob("partition_range_scan_diff_*.log"))
+    if not mismatches:
+        assert not diff_logs
+        return
+    (diff_log,) = diff_logs
+    reported = diff_log.read_text().splitlines()[1:]
+    if mismatches > scan_operation.max_reported_mismatches:
+        assert reported.pop() == f"... {mismatches - scan_operation.max_reported_mismatches} more mismatched rows"
+    assert len(reported) == min(mismatches, scan_operation.max_reported_mismatches)
+    assert reported[0] == first_mismatch
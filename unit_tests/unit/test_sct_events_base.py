@@ -12,17 +12,29 @@
 # Copyright (c) 2020 ScyllaDB
 
 import json
+import time
 import pickle
+import fnmatch
+import logging
 from typing import Type, Protocol, runtime_checkable
 from unittest.mock import patch
 
 import pytest
 
 from sdcm.sct_events import Severity, SctEventProtocol
-from sdcm.sct_events.base import SctEvent, SctEventTypesRegistry, BaseFilter, LogEvent, LogEventProtocol
+from sdcm.sct_events.base import (
+    SctEvent,
+    SctEventTypesRegistry,
+    BaseFilter,
+    LogEvent,
+    LogEventProtocol,
+    add_severity_limit_rules,
+    max_severity,
+)
 from sdcm.sct_events.nemesis import DisruptionEvent
 
 Y = None  # define a global name for pickle.
+LOGGER = logging.getLogger(__name__)
 
 SEVERITIES_YAML = b"Y: NORMAL\nZ: ERROR\nY.T: WARNING\nY.T.S: CRITICAL\nZ.T.S: NORMAL\nW.T.S: NORMAL\n"
 
@@ -660,3 +672,84 @@ def test_to_json_with_dict_in_subcontext():
     assert "subcontext" in parsed
     assert len(parsed["subcontext"]) == 1
     assert parsed["subcontext"][0]["event_id"] == "dict-event-id"
+
+
+def make_y_t_s_events() -> list:
+    class Y(SctEvent):
+        T: Type[SctEvent]
+
+    Y.add_subevent_type("T")
+    Y.T.add_subevent_type("S")
+    events = [Y(), Y.T(), Y.T.S()]
+    for event in events:
+        event.dont_publish()
+    return events
+
+
+def fnmatch_max_severity(event: SctEvent) -> Severity:
+    """The original implementation of max_severity() to compare with."""
+    keys = (event.base, f"{event.base}.{event.type}", f"{event.base}.{event.type}.{event.subtype}")
+    for pattern, severity in SctEvent._sct_event_types_registry.limit_rules:
+        if fnmatch.filter(keys, pattern):
+            return severity
+    return SctEvent._sct_event_types_registry.max_severities[type(event).__name__]
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [
+        [],
+        ["Y=DEBUG"],
+        ["Y.T*=NORMAL", "Y=ERROR"],
+        ["Y=ERROR", "Y.T*=NORMAL", "*.S=DEBUG"],
+        ["Y.?=ERROR", "[XY].T.S=WARNING", "Z*=DEBUG", "", "wrong rule"],
+    ],
+)
+def test_max_severity_limit_rules(rules):
+    events = make_y_t_s_events()
+
+    add_severity_limit_rules(rules)
+
+    assert [max_severity(event) for event in events] == [fnmatch_max_severity(event) for event in events]
+
+
+def test_max_severity_limit_rules_with_groups_in_translated_patterns():
+    events = make_y_t_s_events()
+    translate = fnmatch.translate
+
+    # Some Python versions (e.g., 3.10) emit capturing groups for patterns with wildcards.
+    with patch.object(fnmatch, "translate", lambda pattern: f"(?=(.*)){translate(pattern)}"):
+        add_severity_limit_rules(["Y*=DEBUG", "*.T.S=WARNING", "Y.?=ERROR"])
+        severities = [max_severity(event) for event in events]
+
+    assert severities == [fnmatch_max_severity(event) for event in events]
+    assert severities == [Severity.DEBUG, Severity.ERROR, Severity.ERROR]
+
+
+def test_max_severity_cache_invalidated_by_new_rules():
+    _, _, y_t_s = make_y_t_s_events()
+
+    assert max_severity(y_t_s) is Severity.CRITICAL
+    add_severity_limit_rules(["Y.T.*=WARNING"])
+    assert max_severity(y_t_s) is Severity.WARNING
+    add_severity_limit_rules(["Y=ERROR"])
+    assert max_severity(y_t_s) is Severity.ERROR
+
+
+@pytest.mark.benchmark
+def test_max_severity_benchmark():
+    events_number = 20_000
+    add_severity_limit_rules(["Y.T*=NORMAL"] + [f"Event{num}.*=WARNING" for num in range(100)])  # the last has priority
+    y_t_s_class = type(make_y_t_s_events()[2])
+
+    rates = {}
+    for name, func in (("fnmatch", fnmatch_max_severity), ("compiled", max_severity)):
+        start_time = time.perf_counter()
+        for _ in range(events_number):
+            event = y_t_s_class()
+            event.dont_publish()
+            assert func(event) is Severity.NORMAL
+        rates[name] = events_number / (time.perf_counter() - start_time)
+
+    LOGGER.info("Events construction with max_severity() for %d events: %s", events_number, rates)
+    assert rates["compiled"] > rates["fnmatch"]
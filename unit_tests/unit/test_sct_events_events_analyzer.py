@@ -14,9 +14,12 @@ import threading
 import time
 import unittest.mock
 
+from sdcm.sct_events import Severity
+from sdcm.sct_events.database import DatabaseLogEvent
+from sdcm.sct_events.filters import EventsSeverityChangerFilter
 from sdcm.sct_events.system import InfoEvent, SpotTerminationEvent
 from sdcm.sct_events.setup import EVENTS_SUBSCRIBERS_START_DELAY
-from sdcm.sct_events.events_analyzer import EventsAnalyzer, start_events_analyzer
+from sdcm.sct_events.events_analyzer import CriticalEventsSubscription, EventsAnalyzer, start_events_analyzer
 from sdcm.sct_events.events_processes import EVENTS_ANALYZER_ID, get_events_process
 
 from unit_tests.lib.events_utils import EventsUtilsMixin
@@ -81,3 +84,19 @@ class TestEventsAnalyzer(EventsUtilsMixin):
         finally:
             stop_event.set()
             thread.join(timeout=1)
+
+
+def test_critical_events_subscription():
+    subscription = CriticalEventsSubscription()
+
+    assert subscription.match(b"E|CRITICAL|11|InfoEvent.")
+    assert not subscription.match(b"E|ERROR|11|DatabaseLogEvent.DATABASE_ERROR.")
+
+    subscription.filter_added(
+        EventsSeverityChangerFilter(new_severity=Severity.CRITICAL, event_class=DatabaseLogEvent.DATABASE_ERROR)
+    )
+    subscription.filter_added(
+        EventsSeverityChangerFilter(new_severity=Severity.WARNING, event_class=DatabaseLogEvent.RUNTIME_ERROR)
+    )
+    assert subscription.match(b"E|ERROR|11|DatabaseLogEvent.DATABASE_ERROR.")
+    assert not subscription.match(b"E|ERROR|11|DatabaseLogEvent.RUNTIME_ERROR.")
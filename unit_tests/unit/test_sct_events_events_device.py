@@ -11,17 +11,33 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
+import time
 import ctypes
+import pickle
+import logging
 import threading
+import unittest.mock
 import multiprocessing
 
 import pytest
+import zmq
 
+from sdcm.sct_events import Severity
+from sdcm.sct_events.database import DatabaseLogEvent
 from sdcm.sct_events.health import ClusterHealthValidatorEvent
-from sdcm.sct_events.events_device import EventsDevice, start_events_main_device, get_events_main_device
-from sdcm.sct_events.events_processes import EventsProcessesRegistry
+from sdcm.sct_events.events_device import (
+    DELIVERY_VERIFICATION_WINDOW,
+    EventsDevice,
+    event_topic,
+    start_events_main_device,
+    get_events_main_device,
+)
+from sdcm.sct_events.events_processes import EventsProcessesRegistry, EventsSubscription, events_topics
+from sdcm.sct_events.filters import DbEventsFilter
 from sdcm.wait import wait_for
 
+LOGGER = logging.getLogger(__name__)
+
 
 @pytest.fixture
 def events_processes_registry(tmp_path):
@@ -86,3 +102,167 @@ def test_start_get_events_main_device(events_processes_registry):
         assert events_device.subscribe_address
     finally:
         events_device.stop(timeout=1)
+
+
+def test_batched_publish_subscribe(events_device):
+    events = [ClusterHealthValidatorEvent.NodeStatus() for _ in range(5)]
+
+    batcher = events_device.enable_batched_publishing(batch_size=3, flush_period=60)
+
+    # First 3 events are flushed by size, last 2 are kept in the buffer until explicit flush.
+    for event in events:
+        events_device.publish_event(event)
+    assert len(batcher) == 2
+    assert len(events_device.raw_events_log.read_text().splitlines()) == 3
+    assert events_device.events_counter == 3
+
+    events_device.flush_published_events()
+    assert len(batcher) == 0
+    raw_events = events_device.raw_events_log.read_text().splitlines()
+    assert raw_events == [event.to_json() for event in events]
+    assert events_device.events_counter == 5
+
+    stop_event = threading.Event()
+    counter = multiprocessing.Value(ctypes.c_uint32, 0)
+
+    threading.Timer(interval=1, function=stop_event.set).start()  # stop subscriber in 1 second.
+    events_device.start_delay = 0.5
+    events_device.start()
+
+    try:
+        received = [event for _, event in events_device.outbound_events(stop_event=stop_event, events_counter=counter)]
+    finally:
+        events_device.stop(timeout=1)
+
+    assert received == events
+    assert counter.value == 5
+
+
+def test_batched_publish_flush_by_time(events_device):
+    event = ClusterHealthValidatorEvent.NodeStatus()
+
+    events_device.enable_batched_publishing(batch_size=100, flush_period=0.1)
+    events_device.publish_event(event)
+
+    wait_for(func=lambda: events_device.events_counter == 1, timeout=5, step=0.1)
+    assert events_device.raw_events_log.read_text().splitlines() == [event.to_json()]
+
+
+def test_pipelined_delivery_verification(events_device):
+    events = [ClusterHealthValidatorEvent.NodeStatus() for _ in range(50)]
+    for event in events:
+        events_device.publish_event(event)
+
+    stop_event = threading.Event()
+    counter = multiprocessing.Value(ctypes.c_uint32, 0)
+
+    threading.Timer(interval=2, function=stop_event.set).start()
+    events_device.delivery_verification_window = 10
+    events_device.start_delay = 0.5
+    events_device.start()
+
+    try:
+        received = [event for _, event in events_device.outbound_events(stop_event=stop_event, events_counter=counter)]
+    finally:
+        events_device.stop(timeout=1)
+
+    assert received == events
+    assert events_device.undelivered_events_counter == 0
+
+
+def test_sub_socket_high_water_mark(events_device):
+    events_device.socket_hwm = 12345
+
+    with (
+        unittest.mock.patch.object(EventsDevice, "subscribe_address", "tcp://localhost:1"),
+        zmq.Context() as ctx,
+        events_device._sub_socket(ctx, topics=[b""]) as sub,
+    ):
+        assert sub.getsockopt(zmq.RCVHWM) == 12345
+
+
+def test_event_topic():
+    event = ClusterHealthValidatorEvent.NodeStatus()
+    event.publish_to_argus = False
+    assert event_topic(event) == b"E|ERROR|10|ClusterHealthValidatorEvent.NodeStatus."
+    assert event_topic(DbEventsFilter(db_event=DatabaseLogEvent.BACKTRACE)) == b"F|"
+
+    subscription = EventsSubscription(topics=events_topics(severities=[Severity.ERROR], publish_to_grafana=True))
+    assert subscription.match(event_topic(event))
+    assert subscription.match(b"F|")
+    assert not subscription.match(b"E|CRITICAL|10|ClusterHealthValidatorEvent.NodeStatus.")
+    assert not subscription.match(b"E|ERROR|01|ClusterHealthValidatorEvent.NodeStatus.")
+
+    subscription = EventsSubscription(topics=events_topics(event_classes=[ClusterHealthValidatorEvent]))
+    assert subscription.match(event_topic(event))
+    assert not subscription.match(b"E|ERROR|10|ClusterHealthValidatorEventX.")
+
+
+def test_subscribe_to_topics(events_device):
+    error_event = ClusterHealthValidatorEvent.NodeStatus(severity=Severity.ERROR)
+    critical_event = ClusterHealthValidatorEvent.NodeStatus(severity=Severity.CRITICAL)
+    not_for_grafana_event = ClusterHealthValidatorEvent.NodeStatus(severity=Severity.CRITICAL)
+    not_for_grafana_event.publish_to_grafana = False
+    for event in (error_event, critical_event, not_for_grafana_event):
+        events_device.publish_event(event)
+
+    stop_event = threading.Event()
+    counter = multiprocessing.Value(ctypes.c_uint32, 0)
+    subscription = EventsSubscription(
+        topics=events_topics(publish_to_grafana=True), prefixes=events_topics(severities=[Severity.CRITICAL])
+    )
+
+    threading.Timer(interval=1, function=stop_event.set).start()
+    events_device.start_delay = 0.5
+    events_device.start()
+
+    try:
+        with unittest.mock.patch("sdcm.sct_events.events_device.pickle.loads", wraps=pickle.loads) as loads:
+            received = [
+                event
+                for _, event in events_device.outbound_events(
+                    stop_event=stop_event, events_counter=counter, subscription=subscription
+                )
+            ]
+    finally:
+        events_device.stop(timeout=1)
+
+    assert received == [critical_event]
+    assert loads.call_count == 1  # the error event received but not unpickled
+    assert counter.value == 2  # the event not for Grafana wasn't even sent to the subscriber
+
+
+@pytest.mark.benchmark
+def test_events_device_throughput_benchmark(tmp_path):
+    events_number = 10_000
+    rates = {}
+    for mode, window in (("one-by-one", 1), ("pipelined", DELIVERY_VERIFICATION_WINDOW)):
+        events_device = EventsDevice(_registry=EventsProcessesRegistry(log_dir=str(tmp_path / mode)))
+        events_device.delivery_verification_window = window
+        events_device.start_delay = 0.5
+        for line_number in range(events_number):
+            event = DatabaseLogEvent.REACTOR_STALLED().add_info(
+                node="node1", line=f"Reactor stalled for {line_number % 1000} ms on shard 1", line_number=line_number
+            )
+            events_device.publish_event(event)
+            event.dont_publish()
+
+        stop_event = threading.Event()
+        timer = threading.Timer(interval=120, function=stop_event.set)
+        events_device.start()
+        try:
+            inbound_events = events_device.inbound_events(stop_event=stop_event)
+            timer.start()
+            next(inbound_events)
+            start_time = time.perf_counter()
+            received = 1 + sum(1 for _ in zip(range(events_number - 1), inbound_events))
+            rates[mode] = (received - 1) / (time.perf_counter() - start_time)
+        finally:
+            timer.cancel()
+            stop_event.set()
+            events_device.stop(timeout=1)
+
+        assert received == events_number
+        assert events_device.undelivered_events_counter == 0
+
+    LOGGER.info("EventsDevice throughput for %d DatabaseLogEvent's: %s", events_number, rates)
@@ -12,6 +12,9 @@
 # Copyright (c) 2020 ScyllaDB
 
 import time
+import logging
+
+import pytest
 
 from sdcm.sct_events import Severity
 from sdcm.sct_events.system import SpotTerminationEvent
@@ -26,6 +29,8 @@ from sdcm.sct_events.file_logger import (
 
 from unit_tests.lib.events_utils import EventsUtilsMixin
 
+LOGGER = logging.getLogger(__name__)
+
 
 class TestFileLogger(EventsUtilsMixin):
     def setup_method(self) -> None:
@@ -109,3 +114,46 @@ class TestFileLogger(EventsUtilsMixin):
             assert len(group) == 5
             for num, event in enumerate(group, start=0 if severity == Severity.CRITICAL.name else 5):
                 assert f"m-{num}-{severity}" in event
+
+    def test_buffered_events_are_flushed(self) -> None:
+        event = SpotTerminationEvent(node="node", message="buffered")
+        event.severity = Severity.NORMAL
+
+        with self.wait_for_n_events(self.file_logger, count=1, timeout=3):
+            self.events_main_device.publish_event(event)
+
+        time.sleep(self.file_logger.flush_interval * 2)
+        assert get_logger_event_summary(_registry=self.events_processes_registry) == {Severity.NORMAL.name: 1}
+        assert "buffered" in self.file_logger.events_log.read_text()
+        assert "buffered" in self.file_logger.events_logs_by_severity[Severity.NORMAL].read_text()
+
+    def test_write_event_outside_of_logger_process(self) -> None:
+        event = SpotTerminationEvent(node="node", message="not-buffered")
+        event.severity = Severity.WARNING
+
+        # This process has no open log files, so, the event should be written immediately.
+        self.file_logger.write_event(event)
+
+        assert "not-buffered" in self.file_logger.events_log.read_text()
+        assert get_logger_event_summary(_registry=self.events_processes_registry) == {Severity.WARNING.name: 1}
+
+    @pytest.mark.benchmark
+    def test_file_logger_benchmark(self) -> None:
+        events_number = 10_000
+        event = SpotTerminationEvent(node="node", message="benchmark")
+        event.severity = Severity.WARNING
+        rates = {}
+        for mode in ("unbuffered", "buffered"):
+            if mode == "buffered":
+                self.file_logger.open_log_files()
+            start_time = time.perf_counter()
+            for _ in range(events_number):
+                self.file_logger.write_event(event)
+            self.file_logger.close_log_files()
+            rates[mode] = events_number / (time.perf_counter() - start_time)
+
+        LOGGER.info("EventsFileLogger throughput for %d events: %s", events_number, rates)
+        assert rates["buffered"] > rates["unbuffered"]
+        assert get_logger_event_summary(_registry=self.events_processes_registry) == {
+            Severity.WARNING.name: events_number * 2
+        }
@@ -72,7 +72,7 @@ class TestGrafana(EventsUtilsMixin):
             grafana_aggregator.time_window = 1
 
             set_grafana_url("http://localhost", _registry=self.events_processes_registry)
-            with unittest.mock.patch("requests.post") as mock:
+            with unittest.mock.patch("requests.Session.post") as mock:
                 for runs in range(1, 4):
                     with self.wait_for_n_events(grafana_annotator, count=10, timeout=1):
                         for _ in range(10):
@@ -0,0 +1,160 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from sdcm.sct_events.argus import ArgusEventPostman
+from sdcm.sct_events.grafana import GrafanaEventPostman
+from sdcm.sct_events.events_device import EVENTS_LOG_DIR
+from sdcm.sct_events.events_processes import EventsProcessesRegistry
+
+
+class AnnotationsStub(ThreadingHTTPServer):
+    """Grafana annotations API stub which fails first `failures' requests and counts concurrent requests."""
+
+    daemon_threads = True
+
+    def __init__(self, failures: int = 0, delay: float = 0):
+        self.failures = failures
+        self.delay = delay
+        self.annotations = []
+        self.connections = set()
+        self.in_flight = self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_POST(self):
+                annotation = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub.lock:
+                    stub.connections.add(self.client_address)
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                    failed = stub.failures > 0
+                    stub.failures -= failed
+                time.sleep(stub.delay)
+                with stub.lock:
+                    stub.in_flight -= 1
+                    if not failed:
+                        stub.annotations.append(annotation)
+                self.send_response(500 if failed else 200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        super().__init__(("127.0.0.1", 0), Handler)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+def run_postman(postman, events):
+    postman.inbound_events = lambda: iter(events)
+    postman.retry_backoff = 0.01
+    postman.wait_until_ready = lambda: None
+    postman.run()
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return EventsProcessesRegistry(log_dir=tmp_path)
+
+
+def annotation(num: int) -> dict:
+    return {"time": num, "tags": ["TestEvent", "ERROR", "events"], "isRegion": False, "text": f"event {num}"}
+
+
+def test_grafana_postman_posts_in_order_per_url_with_keep_alive(registry):
+    postman = GrafanaEventPostman(_registry=registry)
+    with AnnotationsStub(delay=0.01) as stub1, AnnotationsStub(delay=0.01) as stub2:
+        postman.set_grafana_url(stub1.url)
+        postman.set_grafana_url(stub2.url)
+        run_postman(postman, [annotation(num) for num in range(40)])
+
+    for stub in (stub1, stub2):
+        assert [a["time"] for a in stub.annotations] == list(range(40))
+        assert stub.max_in_flight == 1
+        assert len(stub.connections) == 1
+    assert postman.dead_letters_counter == 0
+
+
+def test_grafana_postman_retries_failed_posts(registry):
+    postman = GrafanaEventPostman(_registry=registry)
+    with AnnotationsStub(failures=3) as stub:
+        postman.set_grafana_url(stub.url)
+        run_postman(postman, [annotation(1)])
+
+    assert stub.annotations == [annotation(1)]
+    assert postman.dead_letters_counter == 0
+
+
+def test_grafana_postman_spools_undelivered_annotations(registry):
+    postman = GrafanaEventPostman(_registry=registry)
+    with AnnotationsStub(failures=100) as stub:
+        postman.set_grafana_url(stub.url)
+        run_postman(postman, [annotation(1), annotation(2)])
+
+    assert stub.annotations == []
+    assert stub.failures == 100 - 2 * postman.retry_attempts
+    assert postman.dead_letters_counter == 2
+    spool = registry.log_dir / EVENTS_LOG_DIR / postman.dead_letter_spool
+    records = [json.loads(line) for line in spool.read_text().splitlines()]
+    assert sorted(record["payload"]["time"] for record in records) == [1, 2]
+    assert {record["target"] for record in records} == {stub.url + postman.api_endpoint}
+
+
+def test_argus_postman_submits_batches(registry):
+    release = threading.Event()
+    submitted = []
+
+    def submit_event(payload):
+        submitted.append(payload)
+        release.wait(timeout=5)  # hold workers busy to let the events queue up
+
+    postman = ArgusEventPostman(_registry=registry)
+    postman._argus_client = MagicMock()
+    postman._argus_client.submit_event.side_effect = submit_event
+    postman.max_workers = 1
+    postman.batch_size = 10
+
+    def events():
+        yield {"message": "event 0"}
+        while not submitted:
+            time.sleep(0.01)
+        yield from ({"message": f"event {num}"} for num in range(1, 26))
+        release.set()
+
+    run_postman(postman, events())
+
+    assert [len(payload) if isinstance(payload, list) else 1 for payload in submitted] == [1, 10, 10, 5]
+    assert postman.dead_letters_counter == 0
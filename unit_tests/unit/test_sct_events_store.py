@@ -0,0 +1,141 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import json
+import time
+
+import pytest
+
+from sdcm.sct_events import Severity
+from sdcm.sct_events.system import SpotTerminationEvent
+from sdcm.sct_events.filters import EventsFilter, EventsSeverityChangerFilter
+from sdcm.sct_events.setup import EVENTS_SUBSCRIBERS_START_DELAY
+from sdcm.sct_events.file_logger import start_events_logger, get_events_logger, get_events_grouped_by_category
+from sdcm.sct_events.events_store import (
+    EventsStore,
+    EventsStoreWriter,
+    start_events_store,
+    get_events_store_writer,
+    import_raw_events_log,
+)
+
+from unit_tests.lib.events_utils import EventsUtilsMixin
+
+
+def make_event(node: str, message: str, severity: Severity, timestamp: float = None) -> SpotTerminationEvent:
+    event = SpotTerminationEvent(node=node, message=message)
+    event.severity = severity
+    if timestamp is not None:
+        event.event_timestamp = timestamp
+    event.dont_publish()
+    return event
+
+
+@pytest.fixture
+def events():
+    return [
+        make_event(node=f"node-{num % 3}", message=f"m-{num}", severity=severity, timestamp=1_000_000 + num)
+        for num, severity in enumerate([Severity.NORMAL, Severity.ERROR, Severity.WARNING, Severity.ERROR] * 3)
+    ]
+
+
+def test_events_store_query(tmp_path, events):
+    with EventsStore(tmp_path / "events.db") as store:
+        store.add_events(events)
+        store.commit()
+
+    with EventsStore(tmp_path / "events.db", readonly=True) as store:
+        assert store.count() == len(events)
+        assert store.count_by_severity() == {"NORMAL": 3, "WARNING": 3, "ERROR": 6}
+        assert [e.event_id for e in store.query()] == [e.event_id for e in events]
+        assert [e.as_dict()["message"] for e in store.query(severity="ERROR", node="node-1")] == ["m-1", "m-7"]
+        assert store.count(severity=[Severity.NORMAL, Severity.WARNING]) == 6
+        assert store.count(base="SpotTerminationEvent", type="nonexistent") == 0
+        assert store.count(since=events[4].event_timestamp, until=events[6].event_timestamp) == 2
+        assert [e.as_dict()["message"] for e in store.query(limit=2, newest_first=True)] == ["m-11", "m-10"]
+        (event,) = store.query(event_id=events[5].event_id)
+        assert event.formatted == events[5].format_event()
+        assert event.severity == "ERROR"
+        assert event.node == "node-2"
+
+
+def test_import_raw_events_log(tmp_path, events):
+    raw_events_log = tmp_path / "raw_events.log"
+    raw_events_log.write_text("".join(event.to_json() + "\n" for event in events) + '{"base": "Partial')
+
+    events_db = import_raw_events_log(raw_events_log, batch_size=5)
+
+    assert events_db == tmp_path / "events.db"
+    with EventsStore(events_db, readonly=True) as store:
+        assert [e.as_dict() for e in store.query()] == [json.loads(event.to_json()) for event in events]
+        assert store.count(severity=Severity.ERROR, node="node-0") == 2
+
+
+class TestEventsStoreWriter(EventsUtilsMixin):
+    def setup_method(self) -> None:
+        self.setup_events_processes(events_device=False, events_main_device=True, registry_patcher=False)
+        start_events_logger(_registry=self.events_processes_registry)
+        start_events_store(_registry=self.events_processes_registry)
+        self.file_logger = get_events_logger(_registry=self.events_processes_registry)
+        self.events_store = get_events_store_writer(_registry=self.events_processes_registry)
+
+        time.sleep(EVENTS_SUBSCRIBERS_START_DELAY)
+
+        assert isinstance(self.events_store, EventsStoreWriter)
+        assert self.events_store.is_alive()
+
+    def teardown_method(self) -> None:
+        self.file_logger.stop(timeout=3)
+        self.events_store.stop(timeout=3)
+        self.teardown_events_processes()
+
+    def test_get_events_grouped_by_category_from_store(self) -> None:
+        with self.wait_for_n_events(self.events_store, count=len(Severity) * 10, timeout=3):
+            for severity in Severity:
+                for num in range(10):
+                    self.events_main_device.publish_event(
+                        make_event(node="node", message=f"m-{num}-{severity.name}", severity=severity)
+                    )
+        time.sleep(self.events_store.commit_interval * 2)
+
+        with EventsStore(self.events_store.events_db, readonly=True) as store:
+            assert set(store.count_by_severity().values()) == {10}
+
+        grouped = get_events_grouped_by_category(_registry=self.events_processes_registry, limit=5)
+        assert grouped == self.file_logger.get_events_by_category_from_files(limit=5)
+        for severity, group in grouped.items():
+            assert len(group) == 5
+            for num, event in enumerate(group, start=0 if severity == Severity.CRITICAL.name else 5):
+                assert f"m-{num}-{severity}" in event
+
+    def test_filtered_events_stored_with_original_severity(self) -> None:
+        with self.wait_for_n_events(self.events_store, count=5, timeout=3):
+            self.events_main_device.publish_event(
+                EventsSeverityChangerFilter(
+                    new_severity=Severity.WARNING, event_class=SpotTerminationEvent, regex=".*changed"
+                )
+            )
+            self.events_main_device.publish_event(EventsFilter(event_class=SpotTerminationEvent, regex=".*filtered"))
+            for message in ("changed", "filtered", "kept"):
+                self.events_main_device.publish_event(make_event(node="node", message=message, severity=Severity.ERROR))
+        time.sleep(self.events_store.commit_interval * 2)
+
+        with EventsStore(self.events_store.events_db, readonly=True) as store:
+            assert [
+                (event.as_dict()["message"], event.severity, event.original_severity, event.filtered)
+                for event in store.query(filtered=None)
+            ] == [("changed", "WARNING", "ERROR", 0), ("filtered", "ERROR", "ERROR", 1), ("kept", "ERROR", "ERROR", 0)]
+            assert [event.as_dict()["message"] for event in store.query()] == ["changed", "kept"]
+            assert store.count_by_severity() == {"WARNING": 1, "ERROR": 1}
+            assert [event.as_raw_dict()["severity"] for event in store.query(filtered=True)] == ["ERROR"]
+            assert store.count(original_severity=Severity.ERROR, filtered=None) == 3
@@ -0,0 +1,79 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import json
+import shutil
+from types import SimpleNamespace
+
+import pytest
+
+from sdcm.remote import LocalCmdRunner
+from sdcm.utils.sstable import sstable_utils
+from sdcm.utils.sstable.sstable_utils import SstableUtils
+
+pytestmark = pytest.mark.skipif(not shutil.which("jq"), reason="jq is not installed")
+
+
+class SudolessLocalCmdRunner(LocalCmdRunner):
+    def run(self, cmd, *args, **kwargs):
+        return super().run(cmd.removeprefix("sudo "), *args, **kwargs)
+
+
+def partition(num: int, **kwargs) -> dict:
+    return {"key": {"raw": f"{num:04x}", "value": str(num)}} | kwargs
+
+
+@pytest.fixture
+def sstables(tmp_path):
+    dumps = {
+        "me-1-big-Data.db": [
+            partition(1, tombstone={"timestamp": 1738230562965937, "deletion_time": "2025-01-30 09:49:23z"}),
+            partition(2, clustering_elements=[{"type": "clustering-row", "tombstone": {"timestamp": 1}}]),
+            partition(3, expired=True),
+            partition(4, expired=False),
+        ],
+        "me-2-big-Data.db": [partition(5, tombstone={"timestamp": 1}), partition(6)],
+        "me-3-big-Data.db": [],
+    }
+    paths = []
+    for name, partitions in dumps.items():
+        path = tmp_path / name
+        path.write_text(json.dumps({"sstables": {str(path): partitions}}, indent=2))
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def sstable_util(monkeypatch, sstables):
+    monkeypatch.setattr(sstable_utils, "get_sstable_data_dump_command", lambda **_: "cat")
+    node = SimpleNamespace(remoter=SudolessLocalCmdRunner(), parent_cluster=None)
+    util = SstableUtils(ks_cf="ks.cf", db_node=node)
+    monkeypatch.setattr(util, "get_sstables", lambda: sstables)
+    return util
+
+
+def test_count_sstable_tombstones(sstable_util, sstables, tmp_path):
+    assert [sstable_util.count_sstable_tombstones(sstable) for sstable in sstables] == [2, 1, 0]
+    assert sstable_util.count_sstable_tombstones(str(tmp_path / "me-4-big-Data.db")) == 0  # doesn't exist
+
+    (tmp_path / "me-5-big-Data.db").write_text('{"sstables": {"broken": [')
+    assert sstable_util.count_sstable_tombstones(str(tmp_path / "me-5-big-Data.db")) == 0
+
+
+def test_count_tombstones(sstable_util, sstables, monkeypatch):
+    assert sstable_util.count_tombstones() == 3
+
+    monkeypatch.setattr(sstable_utils.random, "sample", lambda population, k: population[1 : k + 1])
+    assert sstable_util.count_tombstones(sample_size=1) == 3  # 1 tombstone in 1 of 3 sstables
+    assert sstable_util.count_tombstones(sample_size=2) == 2  # 1.5 = (1 + 0) * 3 / 2
+    assert sstable_util.count_tombstones(sample_size=3) == 3
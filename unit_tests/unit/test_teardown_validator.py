@@ -3,6 +3,8 @@ from unittest.mock import Mock, patch, mock_open
 
 import pytest
 
+from sdcm.sct_events.events_store import EventsStore
+from sdcm.sct_events.database import DatabaseLogEvent
 from sdcm.teardown_validators.events import ErrorEventsValidator, Severity
 from sdcm.sct_config import SCTConfiguration
 
@@ -136,3 +138,50 @@ def test_validate_with_failing_events_with_critical_events(
     with patch("builtins.open", open_mock):
         validator.validate()
     assert tester_mock.get_test_status() == "FAILED"
+
+
+def stored_event(line, severity, original_severity, filtered=False):
+    event = DatabaseLogEvent.BACKTRACE().add_info(node="node", line=line, line_number=1)
+    event.severity = severity
+    event._original_severity = original_severity
+    event._filtered = filtered
+    event.dont_publish()
+    return event
+
+
+@pytest.mark.parametrize(
+    "line,severity,original_severity,filtered,expected_status",
+    [
+        ("failing event", Severity.ERROR, Severity.ERROR, False, "FAILED"),
+        ("failing event", Severity.WARNING, Severity.ERROR, False, "FAILED"),  # severity changed by a filter
+        ("failing event", Severity.ERROR, Severity.ERROR, True, "FAILED"),
+        ("failing event", Severity.ERROR, Severity.WARNING, False, "SUCCESS"),
+        ("other event", Severity.ERROR, Severity.ERROR, False, "SUCCESS"),
+    ],
+)
+@patch("sdcm.teardown_validators.events.get_events_main_device")
+def test_validate_with_events_store(  # noqa: PLR0913
+    get_events_main_device_mock,
+    tester_mock,
+    make_validator,
+    tmp_path,
+    line,
+    severity,
+    original_severity,
+    filtered,
+    expected_status,
+):
+    _, validator = make_validator([{"event_class": "DatabaseLogEvent", "event_type": "BACKTRACE", "regex": "failing"}])
+    get_events_main_device_mock.return_value.raw_events_log = tmp_path / "raw_events.log"  # doesn't exist
+    tester_mock.get_event_summary.return_value = {}
+    with EventsStore(tmp_path / "events.db") as store:
+        store.add_events(
+            [
+                stored_event("unrelated", Severity.ERROR, Severity.ERROR),
+                stored_event(line, severity, original_severity, filtered),
+            ]
+        )
+
+    validator.validate()
+
+    assert tester_mock.get_test_status() == expected_status
@@ -10,10 +10,14 @@
 # See LICENSE for more details.
 #
 # Copyright (c) 2022 ScyllaDB
+import re
+import json
 from dataclasses import dataclass
+from types import SimpleNamespace
 
 import pytest
 
+from sdcm.test_config import TestConfig
 from sdcm.utils.data_validator import LongevityDataValidator
 from sdcm import sct_config
 
@@ -58,3 +62,124 @@ def test_view_names_for_updated_data_not_found(params):
     data_validator._validate_updated_per_view = [True, True]
     views_list = data_validator.list_of_view_names_for_update_test()
     assert views_list == []
+
+
+class FakeStatement(str):
+    fetch_size = None
+
+
+class FakeTokenRangesSession:
+    """Executes token range queries of LongevityDataValidator over in-memory tables."""
+
+    def __init__(self, tables: dict, partition_keys: dict):
+        self.tables = tables  # table name -> list of dicts
+        self.partition_keys = partition_keys  # table name -> list of partition key columns
+        self.token_range_queries = 0
+
+    @staticmethod
+    def token(*values) -> int:
+        return hash(values) % 2**64 - 2**63 + 1
+
+    def prepare(self, query: str) -> FakeStatement:
+        return FakeStatement(query)
+
+    def execute(self, query, parameters=None):
+        if "system_schema.columns" in query:
+            _, table = parameters
+            return [
+                SimpleNamespace(column_name=column, kind="partition_key", position=position)
+                for position, column in enumerate(self.partition_keys[table])
+            ] + [SimpleNamespace(column_name="ck", kind="clustering", position=0)]
+        table = re.search(r"FROM (\w+)", query).group(1)
+        if query.endswith("LIMIT 1"):
+            return SimpleNamespace(column_names=list(self.tables[table][0]))
+        self.token_range_queries += 1
+        columns = re.search(r"SELECT (.*) FROM", query).group(1).split(", ")
+        start, end = parameters
+        return [
+            tuple(row[column] for column in columns)
+            for row in self.tables[table]
+            if start < self.token(*(row[column] for column in self.partition_keys[table])) <= end
+        ]
+
+
+@pytest.fixture
+def data_validator(params, tmp_path, monkeypatch):
+    monkeypatch.setattr(TestConfig, "_logdir", str(tmp_path))
+    data_validator = LongevityDataValidator(
+        longevity_self_object=MockLongevityTest(params=params),
+        user_profile_name="c-s_lwt",
+        base_table_partition_keys=["domain", "published_date"],
+    )
+    data_validator.TOKEN_RANGES_COUNT = 16
+    return data_validator
+
+
+def immutable_rows(count: int) -> list[dict]:
+    return [{"lwt_indicator": num, "domain": f"d{num}", "ck": num % 3, "author": f"a{num}"} for num in range(count)]
+
+
+@pytest.mark.sct_config(files="unit_tests/test_data/test_data_validator/lwt-basic-3h.yaml")
+def test_validate_range_not_expected_to_change(data_validator, events_function_scope, tmp_path):
+    session = FakeTokenRangesSession(
+        tables={
+            "blogposts_not_updated_lwt_indicator": immutable_rows(100),
+            "blogposts_not_updated_lwt_indicator_expect": list(reversed(immutable_rows(100))),
+        },
+        partition_keys=dict.fromkeys(
+            ["blogposts_not_updated_lwt_indicator", "blogposts_not_updated_lwt_indicator_expect"], ["lwt_indicator"]
+        ),
+    )
+    data_validator.validate_range_not_expected_to_change(session=session)
+
+    assert session.token_range_queries == 2 * data_validator.TOKEN_RANGES_COUNT
+    (event,) = events_function_scope.get_formatted_event_lines()
+    assert "Validation immutable rows finished successfully" in event
+    assert not (tmp_path / "lwt_validator_data_for_debug").exists()
+
+
+@pytest.mark.sct_config(files="unit_tests/test_data/test_data_validator/lwt-basic-3h.yaml")
+def test_validate_range_not_expected_to_change_mismatch(data_validator, tmp_path):
+    actual_rows = immutable_rows(100)
+    actual_rows[42]["author"] = "wrong author"
+    session = FakeTokenRangesSession(
+        tables={
+            "blogposts_not_updated_lwt_indicator": actual_rows,
+            "blogposts_not_updated_lwt_indicator_expect": immutable_rows(100),
+        },
+        partition_keys=dict.fromkeys(
+            ["blogposts_not_updated_lwt_indicator", "blogposts_not_updated_lwt_indicator_expect"], ["lwt_indicator"]
+        ),
+    )
+    with pytest.raises(AssertionError, match="Rows differ in 1 token ranges"):
+        data_validator.validate_range_not_expected_to_change(session=session)
+
+    diff_file = (
+        tmp_path / "lwt_validator_data_for_debug" / "blogposts_not_updated_lwt_indicator_token_ranges_diff.jsonl"
+    )
+    (diff,) = [json.loads(line) for line in diff_file.read_text().splitlines()]
+    start, end = diff["token_range"]
+    assert start < session.token(42) <= end
+    assert diff["missing_rows_count"] == diff["unexpected_rows_count"] == 1
+    assert diff["missing_rows"] == ["(42, 'd42', 0, 'a42')"]
+    assert diff["unexpected_rows"] == ["(42, 'd42', 0, 'wrong author')"]
+
+
+@pytest.mark.sct_config(files="unit_tests/test_data/test_data_validator/lwt-basic-3h.yaml")
+def test_validate_range_expected_to_change(data_validator, events_function_scope):
+    data_validator._validate_updated_per_view = [True, True]
+    rows = [{"lwt_indicator": num % 2, "domain": f"d{num}", "published_date": num} for num in range(20)]
+    tables, partition_keys = {}, {}
+    for before_view, after_view, expected_table, _ in data_validator.list_of_view_names_for_update_test():
+        tables |= {before_view: rows[:5], after_view: rows[5:], expected_table: rows}
+        partition_keys |= {before_view: ["lwt_indicator"], after_view: ["lwt_indicator"], expected_table: ["domain"]}
+    session = FakeTokenRangesSession(tables=tables, partition_keys=partition_keys)
+
+    data_validator.validate_range_expected_to_change(session=session)
+
+    assert session.token_range_queries == 6  # the whole token ring per entity, because of different partition keys
+    assert len(events_function_scope.get_formatted_event_lines()) == 2
+    assert all(
+        "Validation updated rows finished successfully" in event
+        for event in events_function_scope.get_formatted_event_lines()
+    )
@@ -0,0 +1,28 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import pytest
+
+from sdcm.utils.file import read_lines_backwards
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 7, 1024])
+@pytest.mark.parametrize(
+    "content",
+    ["", "\n", "one", "one\n", "one\ntwo\nthree\n", "one\n\nthree", "\n\nlonger line with ünicode\nx\n"],
+)
+def test_read_lines_backwards(tmp_path, content, block_size):
+    path = tmp_path / "file.txt"
+    path.write_text(content, encoding="utf-8")
+
+    assert list(read_lines_backwards(str(path), block_size=block_size)) == content.splitlines()[::-1]
@@ -1,6 +1,15 @@
+import re
+import sys
+import gzip
+import json
 from copy import deepcopy
+from itertools import accumulate
 from unittest import mock
 
+import pytest
+import yaml
+
+from sdcm.utils import k8s as k8s_utils
 from sdcm.utils.k8s import (
     HelmValues,
     KubernetesOps,
@@ -313,3 +322,127 @@ def test_scylla_pods_ip_change_tracker_02_negative():
     ip_tracker._process_line(no_ns_str)
 
     assert not ip_mapper, ip_mapper
+
+
+FAKE_KUBECTL = """#!{python}
+import json, os, sys, time
+
+CALLS_LOG = {calls_log!r}
+PODS = {{"scylla": {{"pod-1": ["scylla", "sidecar"], "pod-2": ["scylla", "sidecar"]}}, "default": {{"other": ["app"]}}}}
+
+args, namespace = [], None
+for arg in sys.argv[1:]:
+    if arg.startswith("--namespace="):
+        namespace = arg.split("=", 1)[1]
+    elif not arg.startswith(("--kubeconfig=", "--cache-dir=", "--server=")):
+        args.append(arg)
+started_at = time.time()
+status = 0
+match args:
+    case ["api-resources", "--namespaced=false", *_]:
+        print("namespaces\\nnodes")
+    case ["api-resources", "--namespaced=true", *_]:
+        print("pods\\nconfigmaps\\nevents")
+    case ["get", "namespaces", "-o", "wide"]:
+        print("NAME STATUS AGE\\nscylla Active 1d\\ndefault Active 1d")
+    case ["get", "pods", "-A", "-o", "wide"]:
+        print("NAMESPACE NAME READY")
+        print("\\n".join(f"{{ns}} {{pod}} 1/1" for ns, pods in PODS.items() for pod in pods))
+    case ["get", "configmaps", "-A", "-o", "wide"]:
+        print("NAMESPACE NAME DATA\\nscylla cm 1")
+    case ["get", "pods", "-o", "yaml"] if namespace:
+        items = [
+            {{"kind": "Pod", "metadata": {{"name": pod}}, "spec": {{"containers": [{{"name": c}} for c in containers]}}}}
+            for pod, containers in PODS[namespace].items()
+        ]
+        print(json.dumps({{"kind": "List", "items": items}}))
+    case ["get", "configmaps", "-o", "yaml"] if namespace:
+        print(json.dumps({{"kind": "List", "items": [{{"kind": "ConfigMap", "metadata": {{"name": "cm"}}}}]}}))
+    case ["logs", pod, container, *previous]:
+        time.sleep(0.1)
+        if previous and container != "-c=scylla":
+            print("previous terminated container not found", file=sys.stderr)
+            status = 1
+        else:
+            print(f"log of {{namespace}}/{{pod}}/{{container[3:]}}{{' previous' if previous else ''}}")
+    case ["cp", src, dst, *_]:
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        with open(dst, "w") as fobj:
+            fobj.write(src)
+    case ["get", *_] | ["describe", *_] | ["version"]:
+        print(" ".join(args))
+    case _:
+        print("unexpected command: " + " ".join(args), file=sys.stderr)
+        status = 2
+with open(CALLS_LOG, "a") as calls:
+    calls.write(json.dumps([args, namespace, started_at, time.time()]) + "\\n")
+sys.exit(status)
+"""
+
+
+@pytest.fixture
+def fake_kubectl(tmp_path, monkeypatch):
+    calls_log = tmp_path / "kubectl_calls.jsonl"
+    kubectl_bin = tmp_path / "kubectl"
+    kubectl_bin.write_text(FAKE_KUBECTL.format(python=sys.executable, calls_log=str(calls_log)))
+    kubectl_bin.chmod(0o755)
+    monkeypatch.setattr(k8s_utils, "KUBECTL_BIN", str(kubectl_bin))
+    monkeypatch.delenv("_SCT_TEST_LOGDIR", raising=False)
+
+    def calls():
+        return [json.loads(line) for line in calls_log.read_text().splitlines()]
+
+    return calls
+
+
+def max_concurrency(calls) -> int:
+    edges = sorted([(start, 1) for *_, start, _ in calls] + [(end, -1) for *_, end in calls])
+    return max(accumulate(delta for _, delta in edges))
+
+
+def test_gather_k8s_logs(tmp_path, fake_kubectl):
+    logdir = tmp_path / "logs"
+    logdir.mkdir()
+
+    KubernetesOps.gather_k8s_logs(logdir_path=logdir)
+
+    assert (logdir / "cluster-scoped-resources" / "namespaces.wide").is_file()
+    assert (logdir / "cluster-scoped-resources" / "nodes.desc").is_file()
+    pods_dir = logdir / "namespace-scoped-resources" / "scylla" / "pods"
+    assert yaml.safe_load((pods_dir / "pod-1.yaml").read_text())["metadata"]["name"] == "pod-1"
+    assert sorted(path.name for path in (pods_dir / "pod-2").iterdir()) == [
+        "scylla",
+        "scylla-previous.log.gz",
+        "scylla.log.gz",
+        "sidecar-previous.log.gz",
+        "sidecar.log.gz",
+    ]
+    assert gzip.decompress((pods_dir / "pod-2" / "scylla.log.gz").read_bytes()) == b"log of scylla/pod/pod-2/scylla\n"
+    assert gzip.decompress((pods_dir / "pod-2" / "sidecar-previous.log.gz").read_bytes()) == b""
+    assert (pods_dir / "pod-1" / "scylla" / "etc-scylla").read_text() == "pod-1:/etc/scylla/"
+    assert (logdir / "namespace-scoped-resources" / "default" / "pods" / "other" / "app.log.gz").is_file()
+    assert (logdir / "namespace-scoped-resources" / "scylla" / "configmaps" / "cm.yaml").is_file()
+    assert not (logdir / "namespace-scoped-resources" / "default" / "configmaps").exists()
+    assert not list(logdir.rglob(".*.yaml"))
+
+    calls = fake_kubectl()
+    assert not [args for args, *_ in calls if args[0] == "get" and "/" in args[1]]  # no per-resource calls
+    assert sorted(ns for args, ns, *_ in calls if args[:2] == ["get", "pods"] and ns) == ["default", "scylla"]
+    assert max_concurrency([call for call in calls if call[0][0] == "logs"]) > 1
+
+    report = (logdir / k8s_utils.K8S_LOGS_GATHERING_REPORT).read_text()
+    assert re.search(r"^logs\s+5\s+0\s", report, re.MULTILINE)
+    assert re.search(r"^previous-logs\s+5\s+0\s", report, re.MULTILINE)
+
+
+def test_gather_k8s_logs_limited_by_api_call_rate_limiter(tmp_path, fake_kubectl):
+    limiter = mock.Mock(queue_size=2)
+
+    KubernetesOps.gather_k8s_logs(logdir_path=tmp_path, namespaces="scylla", api_call_rate_limiter=limiter)
+
+    calls = fake_kubectl()
+    assert limiter.wait.call_count == len(calls)
+    assert max_concurrency(calls) <= 2
+    assert not [args for args, *_ in calls if args[0] == "api-resources" and "--namespaced=false" in args]
+    assert not (tmp_path / "namespace-scoped-resources" / "default").exists()
+    assert (tmp_path / "namespace-scoped-resources" / "scylla" / "pods" / "pod-1" / "sidecar.log.gz").is_file()